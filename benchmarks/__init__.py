@@ -0,0 +1 @@
+"""Benchmarks, run each one with ``python -m benchmarks.<name>`` from the repository root."""
@@ -0,0 +1,42 @@
+"""
+Memory and allocation cost of bets, as created by bet-churning strategies.
+
+Run with ``python -m benchmarks.bench_bets`` from the repository root.
+"""
+
+import copy
+import timeit
+import tracemalloc
+
+from crapssim.bet import Come, Odds, PassLine, Place
+
+
+def bytes_per_bet(factory, n: int = 100_000) -> float:
+    tracemalloc.start()
+    bets = [factory() for _ in range(n)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del bets
+    return current / n
+
+
+def main(number: int = 200_000) -> None:
+    factories = {
+        "PassLine": lambda: PassLine(5),
+        "Come": lambda: Come(5, 6),
+        "Place": lambda: Place(6, 12),
+        "Odds": lambda: Odds(Come, 6, 10),
+    }
+    for name, factory in factories.items():
+        print(f"{name:<8} {bytes_per_bet(factory):6.1f} bytes/bet")
+
+    place = Place(6, 12)
+    print()
+    print(f"bet.copy():      {timeit.timeit(place.copy, number=number) / number * 1e9:6.0f} ns")
+    print(f"copy.copy(bet):  {timeit.timeit(lambda: copy.copy(place), number=number) / number * 1e9:6.0f} ns")
+    print(f"bet + bet:       {timeit.timeit(lambda: place + place, number=number) / number * 1e9:6.0f} ns")
+    print(f"sum([bet, bet]): {timeit.timeit(lambda: sum([place, place]), number=number) / number * 1e9:6.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
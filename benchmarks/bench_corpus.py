@@ -0,0 +1,48 @@
+"""
+Compare replaying dice from a memory mapped corpus with rolling random dice,
+and report the size of the corpus on disk.
+
+Run with ``python -m benchmarks.bench_corpus`` from the repository root.
+"""
+
+import functools
+import os
+import tempfile
+import timeit
+
+import numpy as np
+
+from crapssim.corpus import DiceCorpus, DiceCorpusWriter, ReplayDice
+from crapssim.dice import Dice
+
+
+def main(n_rolls: int = 1_000_000) -> None:
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as path:
+        with DiceCorpusWriter(path) as writer:
+            writer.add(0, 0, rng.integers(1, 7, size=(n_rolls, 2)))
+        corpus = DiceCorpus(path)
+        size = os.path.getsize(os.path.join(path, "faces.bin"))
+
+        def replay(corpus: DiceCorpus) -> None:
+            dice = ReplayDice(corpus.session(0, 0))
+            for _ in range(n_rolls):
+                dice.roll()
+
+        def random():
+            dice = Dice(0)
+            for _ in range(n_rolls):
+                dice.roll()
+
+        # the corpus is passed in, so it can be closed before the directory is removed
+        t_replay = timeit.timeit(functools.partial(replay, corpus), number=1)
+        t_random = timeit.timeit(random, number=1)
+        del corpus
+
+    print(f"{n_rolls} rolls, {size / 1e6:.1f} MB on disk")
+    print(f"replay dice: {t_replay / n_rolls * 1e9:8.1f} ns/roll")
+    print(f"random dice: {t_random / n_rolls * 1e9:8.1f} ns/roll")
+
+
+if __name__ == "__main__":
+    main()
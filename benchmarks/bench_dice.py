@@ -0,0 +1,48 @@
+"""
+Compare the numpy and pure Python dice backends and weighted dice, both
+rolling the dice alone and running a table one roll at a time.
+
+Run with ``python -m benchmarks.bench_dice`` from the repository root.
+"""
+
+import timeit
+
+from crapssim.dice import DICE_BACKENDS, Dice, WeightedDice
+from crapssim.strategy import BetPassLine
+from crapssim.table import Table
+
+
+def main(n_rolls: int = 1_000_000, n_table_rolls: int = 100_000) -> None:
+    # a dice setter who rolls half as many sevens
+    probabilities = [0.5 if d1 + d2 == 7 else 1 for d1 in range(1, 7) for d2 in range(1, 7)]
+
+    def make_dice(backend):
+        if backend == "weighted":
+            return WeightedDice(probabilities, seed=1)
+        return Dice(1, backend=backend)
+
+    for backend in (*DICE_BACKENDS, "weighted"):
+
+        def roll():
+            dice = make_dice(backend)
+            for _ in range(n_rolls):
+                dice.roll()
+
+        def run():
+            table = Table(dice=make_dice(backend))
+            table.add_player(float("inf"), strategy=BetPassLine(5))
+            table.run(max_rolls=n_table_rolls, verbose=False)
+
+        t_roll = timeit.timeit(roll, number=1)
+        t_run = timeit.timeit(run, number=1)
+        print(
+            f"{backend:>8} dice: {t_roll / n_rolls * 1e9:8.1f} ns/roll, "
+            f"table: {t_run / n_table_rolls * 1e6:6.2f} us/roll"
+        )
+
+    t_sample = timeit.timeit(lambda: WeightedDice(probabilities, seed=1).sample(n_rolls), number=1)
+    print(f"weighted dice, vectorized: {t_sample / n_rolls * 1e9:.1f} ns/roll")
+
+
+if __name__ == "__main__":
+    main()
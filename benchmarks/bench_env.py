@@ -0,0 +1,59 @@
+"""
+Time the step API: single steps with :py:func:`crapssim.env.step` and
+batched steps over many environments with :py:func:`crapssim.env.step_batch`,
+each playing a Pass Line bet with double odds.
+
+Run with ``python -m benchmarks.bench_env`` from the repository root.
+"""
+
+import time
+
+import numpy as np
+
+from crapssim.bet import Odds, PassLine
+from crapssim.env import SLOTS, Action, BatchState, State, slot_index, step, step_batch
+
+
+def time_step(rolls) -> float:
+    state = State(bankroll=1e12)
+    start = time.perf_counter()
+    for roll in rolls:
+        if state.point is None:
+            action = Action(add=(PassLine(5),))
+        else:
+            action = Action(add=(Odds(PassLine, state.point, 10),))
+        state, _ = step(state, action, roll)
+    return time.perf_counter() - start
+
+
+def time_step_batch(n_envs: int, n_rolls: int, rng: np.random.Generator) -> float:
+    state = BatchState.initial(n_envs, bankroll=1e12)
+    pass_line = slot_index(PassLine(1))
+    odds = {n: slot_index(Odds(PassLine, n, 1)) for n in (4, 5, 6, 8, 9, 10)}
+    seconds = 0.0
+    for _ in range(n_rolls):
+        rolls = rng.integers(1, 7, size=(n_envs, 2))
+        start = time.perf_counter()
+        add = np.zeros((n_envs, len(SLOTS)))
+        add[state.point == 0, pass_line] = 5
+        for number, i in odds.items():
+            add[state.point == number, i] = 10
+        state, _ = step_batch(state, rolls, add=add)
+        seconds += time.perf_counter() - start
+    return seconds
+
+
+def main(n_rolls: int = 2_000) -> None:
+    rng = np.random.default_rng(0)
+    rolls = [tuple(x) for x in rng.integers(1, 7, size=(n_rolls, 2)).tolist()]
+    seconds = time_step(rolls)
+    print(f"step:              {seconds / n_rolls * 1e6:6.2f} us per env-roll")
+
+    for n_envs in (100, 10_000, 100_000):
+        n = max(10, n_rolls * 100 // n_envs)
+        seconds = time_step_batch(n_envs, n, rng)
+        print(f"step_batch {n_envs:>7}: {seconds / n / n_envs * 1e6:6.3f} us per env-roll")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Compare assembling sessions from a library of shooter hands with rolling
+random dice, and report the time to build the library.
+
+Run with ``python -m benchmarks.bench_hands`` from the repository root.
+"""
+
+import functools
+import tempfile
+import timeit
+
+from crapssim.dice import Dice
+from crapssim.hands import HandLibrary, HandLibraryDice, build_hand_library
+
+
+def main(n_hands: int = 200_000, n_rolls: int = 1_000_000) -> None:
+    with tempfile.TemporaryDirectory() as path:
+        t_build = timeit.timeit(lambda: build_hand_library(path, n_hands, seed=0), number=1)
+        library = build_hand_library(path, n_hands, seed=0)
+
+        def hands(library: HandLibrary) -> None:
+            dice = HandLibraryDice(library, seed=1)
+            for _ in range(n_rolls):
+                dice.roll()
+
+        def random():
+            dice = Dice(1)
+            for _ in range(n_rolls):
+                dice.roll()
+
+        # the library is passed in, so it can be closed before the directory is removed
+        t_hands = timeit.timeit(functools.partial(hands, library), number=1)
+        t_random = timeit.timeit(random, number=1)
+        n_library_rolls = library.n_rolls
+        del library
+
+    print(f"{n_hands} hands ({n_library_rolls} rolls) built in {t_build:.2f} s")
+    print(f"library dice: {t_hands / n_rolls * 1e9:8.1f} ns/roll")
+    print(f"random dice:  {t_random / n_rolls * 1e9:8.1f} ns/roll")
+
+
+if __name__ == "__main__":
+    main()
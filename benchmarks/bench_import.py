@@ -0,0 +1,56 @@
+"""
+Measure the cold-start time of ``import crapssim`` in fresh interpreters, and
+of importing it along with the lazily loaded parts (NumPy, the example
+strategies).
+
+Each case is run in a new process with a warm bytecode cache, and the
+fastest of several runs is reported.
+
+Run with ``python -m benchmarks.bench_import`` from the repository root.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+CASES = {
+    "import crapssim": "import crapssim",
+    "Table only": "import crapssim; crapssim.Table().add_player()",
+    "+ first roll (numpy)": "import crapssim; crapssim.Table(seed=1).run(1, verbose=False)",
+    "+ strategy.examples": "import crapssim; crapssim.strategy.examples.IronCross",
+    "import numpy": "import numpy",
+}
+
+
+def time_import(code: str, env: dict[str, str], repeat: int) -> float:
+    timer = (
+        "import time; _t = time.perf_counter(); "
+        f"{code}; "
+        "print(time.perf_counter() - _t)"
+    )
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", timer], env=env, capture_output=True, text=True
+        )
+        out.check_returncode()
+        times.append(float(out.stdout.split()[-1]))
+    return min(times)
+
+
+def main(repeat: int = 10) -> None:
+    with tempfile.TemporaryDirectory() as cache:
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=cache)
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+
+        for code in CASES.values():
+            time_import(code, env, 1)  # write the bytecode cache
+        for name, code in CASES.items():
+            print(f"{name:22} {time_import(code, env, repeat) * 1e3:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
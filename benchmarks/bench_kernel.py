@@ -0,0 +1,74 @@
+"""
+Compare settling bets with ``Bet.get_result`` against the array-based kernel
+in :py:mod:`crapssim.kernel`, end to end through ``Table.run`` so that the
+cost of encoding bets as they are placed and removed is included.
+
+Run with ``python -m benchmarks.bench_kernel`` from the repository root.
+"""
+
+import timeit
+
+from crapssim.bet import Come
+from crapssim.kernel import KernelTableUpdate
+from crapssim.strategy import (
+    BetPassLine,
+    BetPlace,
+    ComeOddsMultiplier,
+    PassLineOddsMultiplier,
+)
+from crapssim.strategy.examples import IronCross, Pass2Come
+from crapssim.strategy.single_bet import BetHardWay
+from crapssim.strategy.tools import CountStrategy, Strategy
+from crapssim.table import Table, TableUpdate
+
+
+def crowded_strategy() -> Strategy:
+    """Pass Line and four Come bets with odds, Place bets on every number and
+    the four Hard Ways: about 20 bets at a time."""
+    strategy = (
+        BetPassLine(5)
+        + PassLineOddsMultiplier(2)
+        + CountStrategy((Come,), 4, Come(5))
+        + ComeOddsMultiplier(2)
+        + BetPlace({x: 10 for x in (4, 5, 6, 8, 9, 10)}, skip_point=False)
+    )
+    for number in (4, 6, 8, 10):
+        strategy += BetHardWay(number, 1)
+    return strategy
+
+
+def run(strategy: Strategy, table_update: TableUpdate, n_rolls: int) -> None:
+    table = Table(seed=1)
+    table.add_player(1_000_000_000, strategy)
+    table.run(max_rolls=n_rolls, verbose=False, table_update=table_update)
+
+
+def main(n_rolls: int = 10_000, repeat: int = 5) -> None:
+    strategies = {
+        "Pass2Come": lambda: Pass2Come(5),
+        "IronCross": lambda: IronCross(5),
+        "crowded": crowded_strategy,
+    }
+    print(f"{n_rolls} rolls through Table.run, best of {repeat}")
+    for name, strategy in strategies.items():
+        per_bet = min(
+            timeit.repeat(
+                lambda: run(strategy(), TableUpdate(), n_rolls),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        kernel = min(
+            timeit.repeat(
+                lambda: run(strategy(), KernelTableUpdate(), n_rolls),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        print(
+            f"{name:14} get_result: {per_bet / n_rolls * 1e6:6.1f} us/roll   "
+            f"kernel: {kernel / n_rolls * 1e6:6.1f} us/roll"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Time the bet resolution stage (``TableUpdate.update_bets``) of tables with
+many players, where players with the same bets share the result of each bet
+shape on a roll, against resolving every player's bets on their own.
+
+Run with ``python -m benchmarks.bench_players`` from the repository root.
+"""
+
+import time
+
+import numpy as np
+
+from crapssim.strategy import BetPassLine
+from crapssim.strategy.examples import IronCross, Pass2Come, Place682Come
+from crapssim.table import Table, TableUpdate
+
+STRATEGIES = [
+    lambda: BetPassLine(5),
+    lambda: Pass2Come(5),
+    lambda: IronCross(5),
+    lambda: Place682Come(),
+]
+
+
+def update_bets_unshared(table: Table, verbose: bool = False) -> None:
+    for player in table.players:
+        player.update_bet(verbose=verbose)
+
+
+def time_update_bets(update_bets, n_players: int, outcomes) -> float:
+    table = Table()
+    for i in range(n_players):
+        strategy = STRATEGIES[i % len(STRATEGIES)]()
+        table.add_player(bankroll=float("inf"), strategy=strategy, name=str(i))
+
+    seconds = 0.0
+    for outcome in outcomes:
+        TableUpdate.run_strategies(table)
+        TableUpdate.before_roll(table)
+        TableUpdate.roll(table, outcome)
+        start = time.perf_counter()
+        update_bets(table)
+        seconds += time.perf_counter() - start
+        TableUpdate.set_new_shooter(table)
+        TableUpdate.update_numbers(table, verbose=False)
+    return seconds
+
+
+def main(n_rolls: int = 500, repeat: int = 3) -> None:
+    rng = np.random.default_rng(0)
+    outcomes = [tuple(x) for x in rng.integers(1, 7, size=(n_rolls, 2)).tolist()]
+
+    for n_players in (1, 50, 200, 500):
+        shared, unshared = (
+            min(time_update_bets(f, n_players, outcomes) for _ in range(repeat))
+            / n_rolls
+            / n_players
+            * 1e6
+            for f in (TableUpdate.update_bets, update_bets_unshared)
+        )
+        print(
+            f"{n_players:4} players: shared {shared:5.2f} us, "
+            f"unshared {unshared:5.2f} us per player-roll"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Time long sessions with and without skipping of quiet rolls (rolls where
+nothing happens, see ``crapssim.skip``) for strategies that sit through most
+rolls of a point.
+
+Run with ``python -m benchmarks.bench_skip`` from the repository root.
+"""
+
+import time
+
+from crapssim.strategy import (
+    BetDontPass,
+    BetPassLine,
+    DontPassOddsMultiplier,
+    PassLineOddsMultiplier,
+)
+from crapssim.strategy.examples import Place68DontCome2Odds
+from crapssim.table import Table
+
+STRATEGIES = {
+    "PassLine+2xOdds": lambda: BetPassLine(5) + PassLineOddsMultiplier(2),
+    "DontPass": lambda: BetDontPass(5),
+    "DontPass+6xOdds": lambda: BetDontPass(5) + DontPassOddsMultiplier(6),
+    "Place68DontCome2Odds": lambda: Place68DontCome2Odds(),
+}
+
+
+def time_sessions(strategy, skip: bool, n_sessions: int, n_rolls: int) -> float:
+    start = time.perf_counter()
+    for i in range(n_sessions):
+        table = Table(seed=i)
+        table.add_player(bankroll=1e9, strategy=strategy())
+        table.run(n_rolls, verbose=False, skip_quiet_rolls=skip)
+    return time.perf_counter() - start
+
+
+def main(n_sessions: int = 20, n_rolls: int = 5_000) -> None:
+    for name, strategy in STRATEGIES.items():
+        full = time_sessions(strategy, False, n_sessions, n_rolls)
+        skip = time_sessions(strategy, True, n_sessions, n_rolls)
+        per_roll = 1e6 / n_sessions / n_rolls
+        print(
+            f"{name:22} every roll {full * per_roll:5.1f} us/roll, "
+            f"skipping {skip * per_roll:5.1f} us/roll ({full / skip:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
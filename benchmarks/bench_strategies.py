@@ -0,0 +1,71 @@
+"""
+Time full table runs for a few of the example strategies, along with the
+bet comparisons and membership checks that strategies rely on, the per-roll
+stopping check (``Table.is_run_complete``) and the max odds check.
+
+Run with ``python -m benchmarks.bench_strategies`` from the repository root.
+"""
+
+import timeit
+
+import numpy as np
+
+from crapssim.bet import Come, Odds, Place
+from crapssim.strategy import BetPassLine, ComeOddsMultiplier, PassLineOddsMultiplier
+from crapssim.strategy.examples import IronCross, Pass2Come, Place682Come
+from crapssim.strategy.tools import CountStrategy
+from crapssim.table import Table
+
+STRATEGIES = {
+    "Pass2Come": lambda: Pass2Come(5),
+    "Place682Come": lambda: Place682Come(),
+    "Pass6ComeOdds": lambda: BetPassLine(5)
+    + PassLineOddsMultiplier(2)
+    + CountStrategy(Come, 6, Come(5))
+    + ComeOddsMultiplier(3),
+}
+
+
+def run_table(strategy, outcomes) -> Table:
+    table = Table()
+    table.add_player(bankroll=float("inf"), strategy=strategy)
+    table.fixed_run(outcomes, verbose=False)
+    return table
+
+
+def main(n_rolls: int = 20_000, repeat: int = 3) -> None:
+    rng = np.random.default_rng(0)
+    outcomes = [tuple(x) for x in rng.integers(1, 7, size=(n_rolls, 2)).tolist()]
+
+    for name, strategy in STRATEGIES.items():
+        seconds = min(
+            timeit.repeat(lambda: run_table(strategy(), outcomes), number=1, repeat=repeat)
+        )
+        print(f"{name:<14} {seconds / n_rolls * 1e6:7.1f} us/roll")
+
+    bets = [Come(5, x) for x in (4, 5, 6, 8, 9)] + [Place(6, 6), Place(8, 6)]
+    missing = Come(5, 10)
+    number = 200_000
+    print()
+    print(f"bet == bet:     {timeit.timeit(lambda: bets[0] == bets[1], number=number) / number * 1e9:6.0f} ns")
+    print(f"bet not in bets:{timeit.timeit(lambda: missing not in bets, number=number) / number * 1e9:6.0f} ns")
+
+    table = Table()
+    for strategy in (Pass2Come(5), Place682Come(), IronCross(5)):
+        table.add_player(bankroll=1000, strategy=strategy)
+    table.fixed_run(outcomes[:10])
+    check = timeit.timeit(
+        lambda: table.is_run_complete(float("inf"), float("inf")), number=number
+    )
+    print(f"is_run_complete:{check / number * 1e9:6.0f} ns (3 players, no changes)")
+
+    table = Table()
+    table.add_player(bankroll=1000, strategy=BetPassLine(5))
+    table.players[0].bets.extend(Come(5, x) for x in (4, 5, 6, 8, 9, 10))
+    odds = Odds(Come, 6, 10)
+    check = timeit.timeit(lambda: odds.is_allowed(table.players[0]), number=number)
+    print(f"odds.is_allowed:{check / number * 1e9:6.0f} ns (6 Come bets)")
+
+
+if __name__ == "__main__":
+    main()
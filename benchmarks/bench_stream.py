@@ -0,0 +1,35 @@
+"""
+Compare rolling counter-based stream dice with the default dice, and time
+regenerating a single roll deep into a session.
+
+Run with ``python -m benchmarks.bench_stream`` from the repository root.
+"""
+
+import timeit
+
+from crapssim.dice import Dice, StreamDice
+
+
+def main(n_rolls: int = 1_000_000) -> None:
+    def stream():
+        dice = StreamDice(1, 734_512)
+        for _ in range(n_rolls):
+            dice.roll()
+
+    def random():
+        dice = Dice(1)
+        for _ in range(n_rolls):
+            dice.roll()
+
+    t_stream = timeit.timeit(stream, number=1)
+    t_random = timeit.timeit(random, number=1)
+    n_access = 10_000
+    t_access = timeit.timeit(lambda: StreamDice.outcome_at(1, 734_512, 10**9), number=n_access)
+
+    print(f"stream dice: {t_stream / n_rolls * 1e9:8.1f} ns/roll")
+    print(f"random dice: {t_random / n_rolls * 1e9:8.1f} ns/roll")
+    print(f"one roll of one session: {t_access / n_access * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,33 @@
 __all__ = ["table", "dice", "strategy", "bet", "Table", "Player"]
 
+__version__ = "0.3.2"
+
 from crapssim.dice import Dice
 from crapssim.table import Player, Table
 
 from . import bet, strategy
+
+_LAZY_SUBMODULES = {
+    "cache",
+    "corpus",
+    "differential",
+    "env",
+    "hands",
+    "kernel",
+    "metrics",
+    "registry",
+    "runner",
+    "service",
+    "skip",
+    "trajectory",
+}
+
+
+def __getattr__(name: str):
+    # these submodules import numpy (or asyncio), so they are only imported on
+    # first use
+    if name in _LAZY_SUBMODULES:
+        import importlib
+
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
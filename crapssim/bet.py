@@ -1,10 +1,11 @@
-import copy
+import operator
 import typing
 from abc import ABC, ABCMeta, abstractmethod
 from dataclasses import dataclass
 from typing import Protocol, TypedDict
 
 from crapssim.dice import Dice
+from crapssim.money import as_amount
 from crapssim.point import Point
 
 __all__ = [
@@ -97,7 +98,57 @@ class BetResult:
         return self.amount if self.amount > 0 else 0
 
 
+def _is_number(value: object) -> bool:
+    # isinstance checks against typing.SupportsFloat are slow, so check common types first
+    if isinstance(value, (int, float)):
+        return True
+    if type(value) in _BET_TYPES or isinstance(value, Bet):
+        return False
+    return isinstance(value, typing.SupportsFloat)
+
+
+def _key_attribute(name: str, doc: str) -> property:
+    """
+    Bet attribute that is part of the bet's keys (e.g. ``number``), stored
+    in the ``_<name>`` slot. Setting it clears the bet's cached keys.
+    """
+    private_name = f"_{name}"
+    get_value = operator.attrgetter(private_name)
+
+    def set_value(self: "Bet", value: typing.Any) -> None:
+        setattr(self, private_name, value)
+        self._clear_keys()
+
+    return property(get_value, set_value, doc=doc)
+
+
+_SLOT_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def _slot_names(cls: type) -> tuple[str, ...]:
+    """All slot attribute names of a class, including inherited slots."""
+    try:
+        return _SLOT_NAMES[cls]
+    except KeyError:
+        names = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            names += [x for x in slots if x not in ("__dict__", "__weakref__")]
+        _SLOT_NAMES[cls] = tuple(dict.fromkeys(names))
+        return _SLOT_NAMES[cls]
+
+
+_BET_TYPES: set[type] = set()
+"""All Bet classes, to check for bets without the (slower) ABC isinstance check"""
+
+
 class _MetaBetABC(ABCMeta):
+    def __init__(cls, name, bases, namespace, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+        _BET_TYPES.add(cls)
+
     # Trick to get a bet like `PassLine` to have it's repr be `crapssim.bet.PassLine`
     def __repr__(cls):
         return f"crapssim.bet.{cls.__name__}"
@@ -109,11 +160,29 @@ class Bet(ABC, metaclass=_MetaBetABC):
 
     The high-level class that defines most of the core bet methods.
     All bets will be a subclass of this.
+
+    Bets use ``__slots__`` to keep instances small and cheap to create, so
+    subclasses should declare any new instance attributes in ``__slots__``.
     """
 
+    __slots__ = ("_amount", "_placed_key_cache", "_hash_key_cache")
+
     def __init__(self, amount: typing.SupportsFloat):
-        self.amount: float = float(amount)
+        # Key attributes are set through their slots in __init__, since the
+        # cached keys are empty until first used
+        self._placed_key_cache: typing.Hashable | None = None
+        self._hash_key_cache: typing.Hashable | None = None
+        self._amount: float = as_amount(amount)
+
+    @property
+    def amount(self) -> float:
         """Wagered amount for the bet."""
+        return self._amount
+
+    @amount.setter
+    def amount(self, value: float) -> None:
+        self._amount = value
+        self._hash_key_cache = None
 
     @abstractmethod
     def get_result(self, table: Table) -> BetResult:
@@ -126,6 +195,43 @@ class Bet(ABC, metaclass=_MetaBetABC):
         """
         pass
 
+    def get_shared_result(self, table: Table, results: dict) -> BetResult:
+        """
+        Result of the bet, sharing the work with identical bets on the same roll.
+
+        Bets with the same shape (e.g. every player's ``PassLine``) have the
+        same outcome on a roll, so the first result is stored in ``results``
+        and reused for bets of the same amount, or scaled by the payout ratio
+        for other amounts. ``results`` must only be used for a single roll.
+        Bets whose result depends on their own state (e.g. ``Fire``) always
+        use :py:meth:`get_result`.
+        """
+        key = self._get_result_key()
+        if key is None:
+            return self.get_result(table)
+
+        amount = self._amount
+        # by type too, since Cents(500) == 500.0 but they are different money
+        amount_key = (type(amount), amount)
+        shared = results.get(key)
+        if shared is None:
+            result = self.get_result(table)
+            if amount > 0:
+                results[key] = (result, {amount_key: result})
+            return result
+
+        first, by_amount = shared
+        result = by_amount.get(amount_key)
+        if result is None:
+            result = by_amount[amount_key] = _scale_result(self, table, first, amount)
+        return result
+
+    def _get_result_key(self) -> typing.Hashable | None:
+        """Key of bets that share results on a roll, None if not shared"""
+        if type(self) in _SHARED_RESULT_TYPES:
+            return self._placed_key
+        return None
+
     def update_number(self, table: Table):
         """
         Update the bet's number, if applicable
@@ -137,6 +243,15 @@ class Bet(ABC, metaclass=_MetaBetABC):
         """
         pass
 
+    @property
+    def moving(self) -> bool:
+        """
+        Whether :py:meth:`update_number` can still change the bet's number.
+        The table only calls ``update_number`` on moving bets, which by
+        default are the bets of classes that override it.
+        """
+        return type(self).update_number is not Bet.update_number
+
     def is_removable(self, table: Table) -> bool:
         """
         Checks whether the bet is removable. May depend on the
@@ -162,17 +277,51 @@ class Bet(ABC, metaclass=_MetaBetABC):
         new_bet = self.__class__(self.amount)
         return new_bet
 
+    def _copy_with_amount(self, amount: float) -> "Bet":
+        """Shallow copy of this bet with a new amount, without calling __init__"""
+        new_bet = self.__copy__()
+        new_bet.amount = amount
+        return new_bet
+
+    def __copy__(self) -> "Bet":
+        new_bet = object.__new__(type(self))
+        for name in _slot_names(type(self)):
+            try:
+                setattr(new_bet, name, getattr(self, name))
+            except AttributeError:
+                pass
+        if hasattr(self, "__dict__"):
+            new_bet.__dict__.update(self.__dict__)
+        return new_bet
+
+    def _clear_keys(self) -> None:
+        """Clear the cached keys, needed when an attribute used in the keys changes"""
+        self._placed_key_cache = None
+        self._hash_key_cache = None
+
+    def _get_placed_key(self) -> typing.Hashable:
+        """Compute the placed key, which identifies bets that are combined when placed"""
+        return type(self)
+
     @property
     def _placed_key(self) -> typing.Hashable:
-        return type(self)
+        key = self._placed_key_cache
+        if key is None:
+            key = self._placed_key_cache = self._get_placed_key()
+        return key
 
     @property
     def _hash_key(self) -> typing.Hashable:
-        return self._placed_key, self.amount
+        key = self._hash_key_cache
+        if key is None:
+            key = self._hash_key_cache = (self._placed_key, self._amount)
+        return key
 
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, Bet):
-            return self._hash_key == other._hash_key
+        if type(other) in _BET_TYPES or isinstance(other, Bet):
+            return (self._hash_key_cache or self._hash_key) == (
+                other._hash_key_cache or other._hash_key
+            )
         raise NotImplementedError
 
     def __hash__(self) -> int:
@@ -182,29 +331,25 @@ class Bet(ABC, metaclass=_MetaBetABC):
         return f"{self.__class__.__name__}(amount={self.amount})"
 
     def __add__(self, other: "Bet") -> "Bet":
-        if isinstance(other, typing.SupportsFloat):
-            amount = self.amount - float(other)
+        if _is_number(other):
+            amount = self.amount - as_amount(other, like=self.amount)
         elif self._placed_key == other._placed_key:
             amount = self.amount + other.amount
         else:
             raise NotImplementedError
-        new_bet = copy.copy(self)
-        new_bet.amount = amount
-        return new_bet
+        return self._copy_with_amount(amount)
 
     def __radd__(self, other):
         return self.__add__(other)
 
     def __sub__(self, other: "Bet") -> "Bet":
-        if isinstance(other, typing.SupportsFloat):
-            amount = self.amount - float(other)
+        if _is_number(other):
+            amount = self.amount - as_amount(other, like=self.amount)
         elif self._placed_key == other._placed_key:
             amount = self.amount - other.amount
         else:
             raise NotImplementedError
-        new_bet = copy.copy(self)
-        new_bet.amount = amount
-        return new_bet
+        return self._copy_with_amount(amount)
 
     def __rsub__(self, other):
         return self.__sub__(other)
@@ -218,6 +363,8 @@ class _WinningLosingNumbersBet(Bet, ABC):
     calculate the result.
     """
 
+    __slots__ = ()
+
     def get_result(self, table: Table) -> BetResult:
         """Core bet logic that determines the result.
 
@@ -229,7 +376,7 @@ class _WinningLosingNumbersBet(Bet, ABC):
         on the table.
         """
         if table.dice.total in self.get_winning_numbers(table):
-            result_amount = self.get_payout_ratio(table) * self.amount + self.amount
+            result_amount = self.amount * self.get_payout_ratio(table) + self.amount
             should_remove = True
         elif table.dice.total in self.get_losing_numbers(table):
             result_amount = -1 * self.amount
@@ -264,6 +411,8 @@ class _SimpleBet(_WinningLosingNumbersBet, ABC):
     at instantiation and don't depend on the table.
     """
 
+    __slots__ = ()
+
     winning_numbers: list[int] = []
     """Winning numbers for the bet"""
     losing_numbers: list[int] = []
@@ -297,6 +446,8 @@ class PassLine(_WinningLosingNumbersBet):
     the point number again before rolling a 7. Pays 1 to 1.
     """
 
+    __slots__ = ()
+
     def get_winning_numbers(self, table: Table) -> list[int]:
         """Winnings numbers are 7, 11 before point is set,
         and the point number after point is set. Uses table
@@ -347,13 +498,17 @@ class Come(_WinningLosingNumbersBet):
     the point number. Pays 1 to 1.
     """
 
+    __slots__ = ("_number",)
+
+    number = _key_attribute("number", "Number the bet moved to, None before it moves")
+
     def __init__(self, amount: typing.SupportsFloat, number: int | None = None):
         super().__init__(amount)
         possible_numbers = (4, 5, 6, 7, 8, 9, 10)
         if number in possible_numbers:
-            self.number = number
+            self._number = number
         else:
-            self.number = None
+            self._number = None
 
     def get_winning_numbers(self, table: Table) -> list[int]:
         """Winnings numbers are 7, 11 before the number is set,
@@ -377,6 +532,11 @@ class Come(_WinningLosingNumbersBet):
         """Come always pays out 1:1"""
         return 1.0
 
+    @property
+    def moving(self) -> bool:
+        """The bet is moving until it has moved to its number."""
+        return self._number is None
+
     def update_number(self, table: Table):
         """
         Update the bet's number to the first number rolled if it's in (4, 5, 6, 8, 9, 10).
@@ -406,8 +566,7 @@ class Come(_WinningLosingNumbersBet):
         new_bet = self.__class__(self.amount, number=None)
         return new_bet
 
-    @property
-    def _placed_key(self) -> typing.Hashable:
+    def _get_placed_key(self) -> typing.Hashable:
         return type(self), self.number
 
     def __repr__(self) -> str:
@@ -425,6 +584,8 @@ class DontPass(_WinningLosingNumbersBet):
     Note that a push will keep the bet active and not result in any change to bankroll.
     """
 
+    __slots__ = ()
+
     def get_winning_numbers(self, table: Table) -> list[int]:
         """Winnings numbers are 2 or 3 before point is set,
         and 7 after point is set. Uses table to determine the point
@@ -467,13 +628,17 @@ class DontCome(_WinningLosingNumbersBet):
     the number is rolled before a 7. Pays 1 to 1.
     """
 
+    __slots__ = ("_number",)
+
+    number = _key_attribute("number", "Number the bet moved to, None before it moves")
+
     def __init__(self, amount: typing.SupportsFloat, number: int | None = None):
         super().__init__(amount)
         possible_numbers = (4, 5, 6, 7, 8, 9, 10)
         if number in possible_numbers:
-            self.number = number
+            self._number = number
         else:
-            self.number = None
+            self._number = None
 
     def get_winning_numbers(self, table: Table) -> list[int]:
         if self.number is None:
@@ -489,6 +654,11 @@ class DontCome(_WinningLosingNumbersBet):
         """Don't Come always pays out 1:1"""
         return 1.0
 
+    @property
+    def moving(self) -> bool:
+        """The bet is moving until it has moved to its number."""
+        return self._number is None
+
     def update_number(self, table: Table):
         possible_numbers = (4, 5, 6, 7, 8, 9, 10)
         if self.number is None and table.dice.total in possible_numbers:
@@ -507,8 +677,7 @@ class DontCome(_WinningLosingNumbersBet):
         new_bet = self.__class__(self.amount, number=None)
         return new_bet
 
-    @property
-    def _placed_key(self) -> typing.Hashable:
+    def _get_placed_key(self) -> typing.Hashable:
         return type(self), self.number
 
     def __repr__(self) -> str:
@@ -528,6 +697,11 @@ class Odds(_WinningLosingNumbersBet):
     or "dark side" (Don't Pass/Don't Come) bet.
     """
 
+    __slots__ = ("_base_type", "_number", "always_working")
+
+    base_type = _key_attribute("base_type", "Type of the bet the odds are for")
+    number = _key_attribute("number", "Point number of the odds")
+
     def __init__(
         self,
         base_type: typing.Type[PassLine | DontPass | Come | DontCome],
@@ -536,8 +710,8 @@ class Odds(_WinningLosingNumbersBet):
         always_working: bool = False,
     ):
         super().__init__(amount)
-        self.base_type = base_type
-        self.number = number
+        self._base_type = base_type
+        self._number = number
         self.always_working = always_working
 
     @property
@@ -604,14 +778,9 @@ class Odds(_WinningLosingNumbersBet):
             raise NotImplementedError
 
     def base_amount(self, player: Player):
-        base_bets = [
-            x
-            for x in player.bets
-            if isinstance(x, self.base_type)
-            and x.get_winning_numbers(player.table)
-            == self.get_winning_numbers(player.table)
-        ]
-        return sum(x.amount for x in base_bets)
+        """Total amount of the player's base bets with the same winning numbers."""
+        numbers = tuple(self.get_winning_numbers(player.table))
+        return player.base_bet_amounts(self.base_type).get(numbers, 0)
 
     def copy(self) -> "Bet":
         """Create a fresh copy of this bet"""
@@ -626,10 +795,15 @@ class Odds(_WinningLosingNumbersBet):
             f", always_working={self.always_working})" if self.always_working else f")"
         )
 
-    @property
-    def _placed_key(self) -> typing.Hashable:
+    def _get_placed_key(self) -> typing.Hashable:
         return type(self), self.base_type, self.number
 
+    def _get_result_key(self) -> typing.Hashable | None:
+        key = super()._get_result_key()
+        if key is None:
+            return None
+        return key, self.always_working
+
     def __repr__(self):
         return (
             f"Odds(base_type={self.base_type}, number={self.number}, amount={self.amount}"
@@ -649,14 +823,16 @@ class Place(_SimpleBet):
     Remains active until the number or a 7 is rolled.
     """
 
+    __slots__ = ("_number", "payout_ratio", "winning_numbers")
+
     payout_ratios = {4: 9 / 5, 5: 7 / 5, 6: 7 / 6, 8: 7 / 6, 9: 7 / 5, 10: 9 / 5}
     """Stores the place bet payouts: 9 to 5 on (4, 10), 7 to 5 on (5, 9), and 7 to 6 on (6, 8)."""
     losing_numbers: list[int] = [7]
+    number = _key_attribute("number", "The placed number, which determines payout ratio")
 
     def __init__(self, number: int, amount: typing.SupportsFloat):
         super().__init__(amount)
-        self.number = number
-        """The placed number, which determines payout ratio"""
+        self._number = number
         self.payout_ratio = self.payout_ratios[number]
         self.winning_numbers = [number]
 
@@ -665,8 +841,7 @@ class Place(_SimpleBet):
         new_bet = self.__class__(self.number, self.amount)
         return new_bet
 
-    @property
-    def _placed_key(self) -> typing.Hashable:
+    def _get_placed_key(self) -> typing.Hashable:
         return type(self), self.number
 
     def __repr__(self) -> str:
@@ -686,6 +861,8 @@ class Field(_WinningLosingNumbersBet):
     "field_payouts":, which default to 2 to 1 for (2, 12) and 1 to 1 otherwise.
     """
 
+    __slots__ = ()
+
     winning_numbers = [2, 3, 4, 9, 10, 11, 12]
     """Field wins on 2, 3, 4, 9, 10, 11, or 12"""
     losing_numbers = [5, 6, 7, 8]
@@ -719,6 +896,8 @@ class CAndE(_WinningLosingNumbersBet):
     Loses on all other numbers.
     """
 
+    __slots__ = ()
+
     winning_numbers: list[int] = [2, 3, 11, 12]
     """Winning numbers are (2, 3, 11, 12)."""
     losing_numbers: list[int] = list(ALL_DICE_NUMBERS - {2, 3, 11, 12})
@@ -753,6 +932,8 @@ class Any7(_SimpleBet):
     Offers a 4 to 1 payout and loses on all other numbers.
     """
 
+    __slots__ = ()
+
     winning_numbers: list[int] = [7]
     losing_numbers: list[int] = list(ALL_DICE_NUMBERS - {7})
     """Losing number is anything except 7."""
@@ -767,6 +948,8 @@ class Two(_SimpleBet):
     Offers a 30 to 1 payout and loses on all other numbers.
     """
 
+    __slots__ = ()
+
     winning_numbers: list[int] = [2]
     losing_numbers: list[int] = list(ALL_DICE_NUMBERS - {2})
     """Losing number is anything except 2."""
@@ -781,6 +964,8 @@ class Three(_SimpleBet):
     Offers a 15 to 1 payout and loses on all other numbers.
     """
 
+    __slots__ = ()
+
     winning_numbers: list[int] = [3]
     losing_numbers: list[int] = list(ALL_DICE_NUMBERS - {3})
     """Losing number is anything except 3."""
@@ -795,6 +980,8 @@ class Yo(_SimpleBet):
     Offers a 15 to 1 payout and loses on all other numbers.
     """
 
+    __slots__ = ()
+
     winning_numbers: list[int] = [11]
     losing_numbers: list[int] = list(ALL_DICE_NUMBERS - {11})
     """Losing number is anything except 11."""
@@ -809,6 +996,8 @@ class Boxcars(_SimpleBet):
     Offers a 30 to 1 payout and loses on all other numbers.
     """
 
+    __slots__ = ()
+
     winning_numbers: list[int] = [12]
     losing_numbers: list[int] = list(ALL_DICE_NUMBERS - {12})
     """Losing number is anything except 12."""
@@ -823,6 +1012,8 @@ class AnyCraps(_SimpleBet):
     Offers a 7 to 1 payout and loses on all other numbers.
     """
 
+    __slots__ = ()
+
     winning_numbers: list[int] = [2, 3, 12]
     losing_numbers: list[int] = list(ALL_DICE_NUMBERS - {2, 3, 12})
     """Losing number is anything except (2, 3, 12)."""
@@ -842,17 +1033,20 @@ class HardWay(Bet):
     the number is rolled in a "soft" way.
     """
 
+    __slots__ = ("_number", "payout_ratio")
+
     payout_ratios = {4: 7, 6: 9, 8: 9, 10: 7}
     """Payout ratios vary: 7 to 1 for hard 4 or 10, 9 to 1 for hard 6 or 8."""
+    number = _key_attribute("number", "The hard way number (4, 6, 8, or 10)")
 
     def __init__(self, number: int, amount: typing.SupportsFloat) -> None:
         super().__init__(amount)
-        self.number: int = number
+        self._number = number
         self.payout_ratio: float = self.payout_ratios[number]
 
     def get_result(self, table: Table) -> BetResult:
         if table.dice.result == self.winning_result:
-            result_amount = self.payout_ratio * self.amount + self.amount
+            result_amount = self.amount * self.payout_ratio + self.amount
             should_remove = True
         elif table.dice.total in (7, self.number):
             result_amount = -1 * self.amount
@@ -872,8 +1066,7 @@ class HardWay(Bet):
         new_bet = self.__class__(self.number, self.amount)
         return new_bet
 
-    @property
-    def _placed_key(self) -> typing.Hashable:
+    def _get_placed_key(self) -> typing.Hashable:
         return type(self), self.number
 
     def __repr__(self) -> str:
@@ -898,13 +1091,17 @@ class Hop(Bet):
     - Hard hop: higher payout (default 30 to 1)
     """
 
+    __slots__ = ("_result",)
+
+    result = _key_attribute("result", "The dice result (sorted) that wins the bet")
+
     def __init__(self, result: tuple[int, int], amount: typing.SupportsFloat) -> None:
         super().__init__(amount)
-        self.result: tuple[int, int] = tuple(sorted(result))
+        self._result = tuple(sorted(result))
 
     def get_result(self, table: Table) -> BetResult:
         if table.dice.result in self.winning_results:
-            result_amount = self.payout_ratio(table) * self.amount + self.amount
+            result_amount = self.amount * self.payout_ratio(table) + self.amount
             should_remove = True
         else:
             result_amount = -1 * self.amount
@@ -931,8 +1128,7 @@ class Hop(Bet):
         new_bet = self.__class__(self.result, self.amount)
         return new_bet
 
-    @property
-    def _placed_key(self) -> typing.Hashable:
+    def _get_placed_key(self) -> typing.Hashable:
         return type(self), self.result
 
     def __repr__(self) -> str:
@@ -942,6 +1138,25 @@ class Hop(Bet):
 # Fire bet -------------------------------------------------------------------
 
 
+def number_mask(numbers: typing.Iterable[int]) -> int:
+    """
+    Bitmask of dice totals, with bit ``n`` set for each total ``n``, e.g.
+    ``0b10000`` for {4}. Used for the progress of Fire and All/Tall/Small bets.
+    """
+    mask = 0
+    for number in numbers:
+        mask |= 1 << number
+    return mask
+
+
+_TOTAL_BITS = {n: 1 << n for n in ALL_DICE_NUMBERS}
+
+
+def mask_numbers(mask: int) -> frozenset[int]:
+    """The dice totals in a bitmask from :func:`number_mask`."""
+    return frozenset(n for n in range(2, 13) if mask >> n & 1)
+
+
 class Fire(Bet):
     """
     Fire bet in craps.
@@ -955,29 +1170,51 @@ class Fire(Bet):
     "fire_payouts"), default is 24 to 1 for four points, 249 to 1 for five points, and
     999 to 1 for all six points.
     - Automatically ends when all 6 points are made or a 7 is rolled while the point is On.
+
+    The points made are kept as a bitmask (see :func:`number_mask`) in ``points_mask``.
     """
 
+    __slots__ = ("points_mask", "ended")
+
+    complete_mask: int = number_mask((4, 5, 6, 8, 9, 10))
+    """Bitmask with all six points made"""
+
     def __init__(self, amount: float):
         super().__init__(amount)
-        self.points_made: set[int] = set()
+        self.points_mask: int = 0
         self.ended: bool = False
 
+    @property
+    def points_made(self) -> frozenset[int]:
+        """The point numbers made so far."""
+        return mask_numbers(self.points_mask)
+
+    @points_made.setter
+    def points_made(self, numbers: typing.Iterable[int]) -> None:
+        self.points_mask = number_mask(numbers)
+
+    @property
+    def n_points_made(self) -> int:
+        """Number of different points made so far."""
+        return self.points_mask.bit_count()
+
     def get_result(self, table: Table) -> BetResult:
 
         if table.point.status == "Off":
             return BetResult(amount=0, remove=False, bet_amount=self.amount)
 
-        if table.dice.total == table.point.number:
-            self.points_made.add(table.point.number)
+        total = table.dice.total
+        if total == table.point.number:
+            self.points_mask |= 1 << total
 
         # Fire pays out on 7 when enough points made
         # Fire pays out automatically when all 6 points are made
-        n_points_made = len(self.points_made)
-        ended = table.dice.total == 7 or len(self.points_made) == 6
+        n_points_made = self.points_mask.bit_count()
+        ended = total == 7 or self.points_mask == self.complete_mask
 
         if ended and n_points_made in table.settings["fire_payouts"]:
             payout_ratio = table.settings["fire_payouts"][n_points_made]
-            result_amount = payout_ratio * self.amount + self.amount
+            result_amount = self.amount * payout_ratio + self.amount
         elif ended and n_points_made not in table.settings["fire_payouts"]:
             result_amount = -1 * self.amount
         else:
@@ -1006,23 +1243,49 @@ class Fire(Bet):
 
 
 class _ATSBet(Bet):
-    """Class representing ATS (All, Tall, Small) bets, not a usable bet by itself."""
+    """
+    Class representing ATS (All, Tall, Small) bets, not a usable bet by itself.
+
+    The numbers rolled are kept as a bitmask (see :func:`number_mask`) in ``rolled_mask``,
+    and the bet wins once it equals the ``complete_mask`` of the bet type.
+    """
+
+    __slots__ = ("rolled_mask",)
 
     numbers: list[int] = []
+    complete_mask: int = 0
+    """Bitmask of all the numbers of the bet"""
     type: str = "_ATSBet"
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.complete_mask = number_mask(cls.numbers)
+
     def __init__(self, amount: float):
         super().__init__(amount)
-        self.rolled_numbers: set[int] = set()
+        self.rolled_mask: int = 0
+
+    @property
+    def rolled_numbers(self) -> frozenset[int]:
+        """The numbers of the bet rolled so far."""
+        return mask_numbers(self.rolled_mask)
+
+    @rolled_numbers.setter
+    def rolled_numbers(self, numbers: typing.Iterable[int]) -> None:
+        self.rolled_mask = number_mask(numbers) & self.complete_mask
+
+    @property
+    def n_rolled(self) -> int:
+        """Number of different numbers of the bet rolled so far."""
+        return self.rolled_mask.bit_count()
 
     def get_result(self, table: Table) -> BetResult:
 
-        if table.dice.total in self.numbers:
-            self.rolled_numbers.add(table.dice.total)
+        self.rolled_mask |= _TOTAL_BITS.get(table.dice.total, 0) & self.complete_mask
 
-        if self.numbers == list(self.rolled_numbers):
+        if self.rolled_mask == self.complete_mask:
             payout_ratio = table.settings["ATS_payouts"][self.type]
-            result_amount = payout_ratio * self.amount + self.amount
+            result_amount = self.amount * payout_ratio + self.amount
             should_remove = True
         elif table.dice.total == 7:
             result_amount = -1 * self.amount
@@ -1062,6 +1325,8 @@ class All(_ATSBet):
     (["ATS_payouts"]["all"]), which defaults to 150 to 1.
     """
 
+    __slots__ = ()
+
     type: str = "all"
     numbers: list[int] = [2, 3, 4, 5, 6, 8, 9, 10, 11, 12]
 
@@ -1076,6 +1341,8 @@ class Tall(_ATSBet):
     (["ATS_payouts"]["tall"]), which defaults to 30 to 1.
     """
 
+    __slots__ = ()
+
     type: str = "tall"
     numbers: list[int] = [8, 9, 10, 11, 12]
 
@@ -1090,5 +1357,53 @@ class Small(_ATSBet):
     (["ATS_payouts"]["small"]), which defaults to 30.
     """
 
+    __slots__ = ()
+
     type: str = "small"
     numbers: list[int] = [2, 3, 4, 5, 6]
+
+
+# Shared results --------------------------------------------------------------
+
+_SHARED_RESULT_TYPES: set[type] = {
+    PassLine,
+    Come,
+    DontPass,
+    DontCome,
+    Odds,
+    Place,
+    Field,
+    CAndE,
+    Any7,
+    Two,
+    Three,
+    Yo,
+    Boxcars,
+    AnyCraps,
+    HardWay,
+    Hop,
+}
+"""Bet types whose result only depends on the table and ``_get_result_key``.
+Subclasses aren't included since they may change how results are computed."""
+
+
+def _payout_ratio(bet: Bet, table: Table) -> float:
+    if isinstance(bet, HardWay):
+        return bet.payout_ratio
+    if isinstance(bet, Hop):
+        return bet.payout_ratio(table)
+    return bet.get_payout_ratio(table)
+
+
+def _scale_result(
+    bet: Bet, table: Table, result: BetResult, amount: float
+) -> BetResult:
+    """Result for ``amount`` given the result of a (positive) bet of the same shape"""
+    if result.won:
+        won = amount * _payout_ratio(bet, table) + amount
+        return BetResult(won, result.remove, amount)
+    elif result.lost:
+        return BetResult(-1 * amount, result.remove, amount)
+    elif result.remove:
+        return BetResult(amount, result.remove, amount)
+    return BetResult(0, result.remove, amount)
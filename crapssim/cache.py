@@ -0,0 +1,180 @@
+"""
+A persistent, content-addressed cache for simulation results, so that runs
+repeated across reports and dashboards are only simulated once.
+
+Results are stored as JSON files in a local directory, keyed by a hash of
+everything that determines them: the strategies (their declarative spec, see
+:py:mod:`crapssim.strategy.spec`, or their repr), the table settings, the run
+parameters, the seed, and the crapssim version along with a fingerprint of the
+package's source code. Any change to the engine therefore gives new keys, so
+results from an older engine are never served. The least recently used
+results are evicted once the cache grows past its size limit.
+
+:py:func:`~crapssim.runner.run_sessions` checks the cache before simulating
+when given one::
+
+    cache = ResultCache("~/.cache/crapssim")
+    records = run_sessions(
+        {"pass": BetPassLine(5)}, 10_000, max_rolls=144, seed=1, cache=cache
+    )
+"""
+
+import functools
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+import typing
+
+__all__ = ["ResultCache", "cache_key", "strategy_identity", "engine_fingerprint"]
+
+
+@functools.cache
+def engine_fingerprint() -> str:
+    """Hash of the crapssim version and the source of all of its modules."""
+    import crapssim
+
+    root = pathlib.Path(crapssim.__file__).parent
+    digest = hashlib.sha256(crapssim.__version__.encode())
+    for path in sorted(root.rglob("*.py")):
+        digest.update(str(path.relative_to(root)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def strategy_identity(strategy: typing.Any) -> str:
+    """
+    Stable identity of a strategy for cache keys.
+
+    Args:
+        strategy: A strategy spec, or a Strategy object whose repr describes
+            it completely.
+
+    Raises:
+        ValueError: If the strategy's repr isn't stable, e.g. because it
+            contains a lambda. Use a declarative spec for such strategies.
+    """
+    if isinstance(strategy, typing.Mapping):
+        from crapssim.strategy.spec import spec_hash
+
+        return f"spec:{spec_hash(strategy)}"
+    try:
+        identity = repr(strategy)
+    except Exception as e:
+        raise ValueError(f"strategy has no usable repr: {e}") from e
+    if " at 0x" in identity:
+        raise ValueError(f"strategy repr isn't stable: {identity}")
+    return f"repr:{identity}"
+
+
+def cache_key(
+    strategies: typing.Mapping[str, typing.Any],
+    settings: typing.Mapping[str, typing.Any],
+    **params: typing.Any,
+) -> str:
+    """
+    Key for the results of a run.
+
+    Args:
+        strategies: Strategies (or specs) by player name.
+        settings: The table settings.
+        **params: Run parameters, e.g. bankroll, number of sessions, stopping
+            rules and seed. Values must be JSON serializable.
+
+    Raises:
+        ValueError: If a strategy doesn't have a stable identity.
+    """
+    content = {
+        "engine": engine_fingerprint(),
+        "strategies": {k: strategy_identity(v) for k, v in strategies.items()},
+        "settings": {k: settings[k] for k in sorted(settings)},
+        "params": params,
+    }
+    canonical = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Directory of cached results with least recently used eviction.
+
+    Args:
+        path: Directory for the cache, created if needed.
+        max_bytes: Total size of the cached results to keep. Once it is
+            exceeded, the least recently used results are removed.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], max_bytes: int = 256 * 1024**2
+    ) -> None:
+        self.path = pathlib.Path(path).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def _file(self, key: str) -> pathlib.Path:
+        return self.path / f"{key}.json"
+
+    def get(self, key: str) -> typing.Any | None:
+        """Cached value for the key, None if it isn't cached."""
+        path = self._file(key)
+        try:
+            with open(path, "rb") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("key") != key:
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        return entry["value"]
+
+    def put(self, key: str, value: typing.Any) -> None:
+        """Store a JSON serializable value, then evict old values if needed."""
+        data = json.dumps({"key": key, "value": value}).encode()
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._file(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self.evict()
+
+    def __contains__(self, key: str) -> bool:
+        return self._file(key).exists()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.path.glob("*.json"))
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached values in bytes."""
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def _entries(self) -> list[tuple[pathlib.Path, os.stat_result]]:
+        entries = []
+        for path in self.path.glob("*.json"):
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                pass
+        return entries
+
+    def evict(self) -> None:
+        """Remove the least recently used values until the cache fits its size."""
+        entries = sorted(self._entries(), key=lambda x: x[1].st_mtime_ns)
+        total = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        for path, _ in self._entries():
+            path.unlink(missing_ok=True)
@@ -0,0 +1,281 @@
+"""
+A dice corpus stores recorded dice outcomes on disk so that large regression
+runs can be replayed without holding the rolls in Python lists. Each roll is
+one byte with the two faces packed as 3-bit values (``d1 << 3 | d2``), and the
+rolls are grouped into sessions indexed by ``(seed, session)``.
+
+A corpus is a directory with two files: ``faces.bin`` with the packed rolls of
+all sessions back to back, and ``index.npy`` with the seed, session, offset and
+length of each session. The rolls are memory mapped when the corpus is opened.
+
+Example::
+
+    with DiceCorpusWriter("corpus") as writer:
+        writer.add(seed=1, session=0, outcomes=[(3, 4), (2, 2)])
+
+    corpus = DiceCorpus("corpus")
+    table = Table(dice=ReplayDice(corpus.session(1, 0)))
+"""
+
+import os
+import typing
+
+import numpy as np
+
+from crapssim.dice import Dice
+
+__all__ = [
+    "INDEX_DTYPE",
+    "pack_outcomes",
+    "unpack_outcomes",
+    "DiceCorpusWriter",
+    "DiceCorpus",
+    "ReplayDice",
+]
+
+INDEX_DTYPE = np.dtype(
+    [
+        ("seed", np.int64),
+        ("session", np.int64),
+        ("offset", np.int64),
+        ("length", np.int64),
+    ]
+)
+"""One row per session: its seed and session number, and where its rolls are."""
+
+_FACES_FILE = "faces.bin"
+_INDEX_FILE = "index.npy"
+
+_UNPACKED: tuple[tuple[int, int] | None, ...] = tuple(
+    (b >> 3, b & 7) if 1 <= b >> 3 <= 6 and 1 <= b & 7 <= 6 else None
+    for b in range(256)
+)
+"""Dice result for each packed byte, None for bytes that aren't valid rolls."""
+
+_PACKED_OUTCOME: tuple[int | None, ...] = tuple(
+    None if result is None else (result[0] - 1) * 6 + result[1] - 1 for result in _UNPACKED
+)
+"""Outcome index (see :py:attr:`Dice.outcome`) for each packed byte."""
+
+
+def pack_outcomes(outcomes: typing.Iterable[typing.Iterable[int]]) -> np.ndarray:
+    """
+    Pack dice outcomes into one byte per roll.
+
+    Args:
+        outcomes: Dice outcomes, e.g. ``[(3, 4), (2, 2)]`` or an array with
+            shape (n, 2).
+
+    Returns:
+        Array of dtype uint8 with one byte per roll.
+    """
+    faces = np.asarray(outcomes if isinstance(outcomes, np.ndarray) else list(outcomes))
+    faces = faces.reshape(-1, 2)
+    if faces.size and (faces.min() < 1 or faces.max() > 6):
+        raise ValueError("Dice faces must be between 1 and 6")
+    faces = faces.astype(np.uint8)
+    return (faces[:, 0] << 3) | faces[:, 1]
+
+
+def unpack_outcomes(packed: np.ndarray) -> np.ndarray:
+    """Unpack rolls from :func:`pack_outcomes` into an array with shape (n, 2)."""
+    packed = np.asarray(packed, dtype=np.uint8)
+    return np.stack([packed >> 3, packed & 7], axis=1)
+
+
+class DiceCorpusWriter:
+    """
+    Writes sessions of dice outcomes to a new corpus directory.
+
+    Use as a context manager, or call :py:meth:`close` when done so that the
+    index is written.
+
+    Args:
+        path: Directory for the corpus, created if it doesn't exist.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._file = open(os.path.join(path, _FACES_FILE), "wb")
+        self._index: list[tuple[int, int, int, int]] = []
+        self._keys: set[tuple[int, int]] = set()
+        self._offset = 0
+
+    def add(
+        self,
+        seed: int,
+        session: int,
+        outcomes: typing.Iterable[typing.Iterable[int]] | np.ndarray,
+    ) -> None:
+        """
+        Add a session of rolls.
+
+        Args:
+            seed: Seed the rolls were generated with (or any other label).
+            session: Session number within the seed.
+            outcomes: Dice outcomes, either unpacked or already packed as a
+                uint8 array from :func:`pack_outcomes`.
+        """
+        if (seed, session) in self._keys:
+            raise ValueError(f"Session {(seed, session)} is already in the corpus")
+        if isinstance(outcomes, np.ndarray) and outcomes.dtype == np.uint8:
+            packed = outcomes
+        else:
+            packed = pack_outcomes(outcomes)
+
+        self._file.write(packed.tobytes())
+        self._index.append((seed, session, self._offset, len(packed)))
+        self._keys.add((seed, session))
+        self._offset += len(packed)
+
+    def add_sessions(
+        self,
+        seed: int,
+        packed: np.ndarray,
+        lengths: typing.Sequence[int] | np.ndarray,
+        first_session: int = 0,
+    ) -> None:
+        """
+        Add consecutive sessions whose packed rolls are stored back to back.
+
+        Args:
+            seed: Seed the rolls were generated with (or any other label).
+            packed: Packed rolls of all the sessions, from :func:`pack_outcomes`.
+            lengths: Number of rolls in each session, summing to ``len(packed)``.
+            first_session: Session number of the first session, the others
+                are numbered consecutively.
+        """
+        lengths = np.asarray(lengths, dtype=np.int64)
+        if lengths.sum() != len(packed):
+            raise ValueError("Session lengths don't add up to the number of rolls")
+        sessions = range(first_session, first_session + len(lengths))
+        if any((seed, session) in self._keys for session in sessions):
+            raise ValueError(f"Sessions of seed {seed} are already in the corpus")
+
+        self._file.write(np.asarray(packed, dtype=np.uint8).tobytes())
+        offsets = self._offset + np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        for session, offset, length in zip(sessions, offsets.tolist(), lengths.tolist()):
+            self._index.append((seed, session, offset, length))
+            self._keys.add((seed, session))
+        self._offset += len(packed)
+
+    def close(self) -> None:
+        """Finish writing the rolls and write the index."""
+        if self._file.closed:
+            return
+        self._file.close()
+        np.save(
+            os.path.join(self.path, _INDEX_FILE),
+            np.array(self._index, dtype=INDEX_DTYPE),
+        )
+
+    def __enter__(self) -> "DiceCorpusWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class DiceCorpus:
+    """
+    Read-only, memory mapped dice corpus.
+
+    Args:
+        path: Directory written by :class:`DiceCorpusWriter`.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = path
+        self.index: np.ndarray = np.load(os.path.join(path, _INDEX_FILE))
+        faces_path = os.path.join(path, _FACES_FILE)
+        if os.path.getsize(faces_path) == 0:
+            self.faces: np.ndarray = np.zeros(0, dtype=np.uint8)
+        else:
+            self.faces = np.memmap(faces_path, dtype=np.uint8, mode="r")
+        """Packed rolls of all sessions."""
+        # sorted (seed, session) keys for lookups, built on first use
+        self._order: np.ndarray | None = None
+        self._seeds: np.ndarray | None = None
+        self._sessions: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def _position(self, seed: int, session: int) -> int | None:
+        """Row of the session in the index, None if it isn't in the corpus."""
+        if self._order is None:
+            self._order = np.lexsort((self.index["session"], self.index["seed"]))
+            self._seeds = self.index["seed"][self._order]
+            self._sessions = self.index["session"][self._order]
+        start = int(np.searchsorted(self._seeds, seed, side="left"))
+        end = int(np.searchsorted(self._seeds, seed, side="right"))
+        i = start + int(np.searchsorted(self._sessions[start:end], session))
+        if i < end and self._sessions[i] == session:
+            return int(self._order[i])
+        return None
+
+    def __contains__(self, key: tuple[int, int]) -> bool:
+        return self._position(*key) is not None
+
+    def keys(self) -> list[tuple[int, int]]:
+        """The ``(seed, session)`` of each session, in the order they were added."""
+        return list(zip(self.index["seed"].tolist(), self.index["session"].tolist()))
+
+    @property
+    def n_rolls(self) -> int:
+        """Total number of rolls in the corpus."""
+        return len(self.faces)
+
+    def session(self, seed: int, session: int) -> np.ndarray:
+        """Packed rolls for one session (a view into the memory map)."""
+        position = self._position(seed, session)
+        if position is None:
+            raise KeyError(f"Session {(seed, session)} is not in the corpus")
+        row = self.index[position]
+        offset, length = int(row["offset"]), int(row["length"])
+        return self.faces[offset : offset + length]
+
+    def outcomes(
+        self, seed: int, session: int
+    ) -> typing.Generator[tuple[int, int], None, None]:
+        """Dice outcomes for one session, e.g. for :py:meth:`Table.fixed_run`."""
+        for b in memoryview(self.session(seed, session)):
+            yield _UNPACKED[b]
+
+
+class ReplayDice(Dice):
+    """
+    Dice that replay packed rolls instead of rolling randomly.
+
+    Rolls are read one byte at a time from the (memory mapped) array and
+    mapped to pre-built result tuples, so replaying doesn't allocate per roll.
+
+    Args:
+        packed: Packed rolls, e.g. from :py:meth:`DiceCorpus.session`.
+    """
+
+    def __init__(self, packed: np.ndarray) -> None:
+        super().__init__()
+        self.packed: np.ndarray = np.asarray(packed, dtype=np.uint8)
+        self._view = memoryview(self.packed) if len(self.packed) else b""
+        self._position: int = 0
+
+    @property
+    def remaining(self) -> int:
+        """Number of rolls left to replay."""
+        return len(self.packed) - self._position
+
+    def roll(self) -> None:
+        """Replay the next roll."""
+        try:
+            index = _PACKED_OUTCOME[self._view[self._position]]
+        except IndexError:
+            raise IndexError(
+                f"All {len(self.packed)} rolls have been replayed"
+            ) from None
+        if index is None:
+            raise ValueError(f"Invalid packed roll at position {self._position}")
+        self._position += 1
+        self.n_rolls += 1
+        self._set_outcome(index)
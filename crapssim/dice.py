@@ -5,9 +5,21 @@ internally, but advanced users may access it (through the Table, as table.dice)
 for new bets or strategies as needed. 
 """
 
+import random
 import typing
 
-import numpy as np
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+DICE_BACKENDS = ("numpy", "python")
+"""Random number generators the dice can roll with"""
+
+_OUTCOMES = tuple((d1, d2) for d1 in range(1, 7) for d2 in range(1, 7))
+_TOTALS = tuple(d1 + d2 for d1, d2 in _OUTCOMES)
+_OUTCOME_INDEX = {outcome: i for i, outcome in enumerate(_OUTCOMES)}
+
+_PYTHON_LIMIT = (1 << 32) - (1 << 32) % 36
+"""32-bit draws at or above this are rejected so that all 36 outcomes are equally likely"""
 
 
 class Dice:
@@ -16,33 +28,98 @@ class Dice:
 
     Args:
         seed (int): The seed passed to the random number generator.
+        backend (str): Random number generator to roll with, either "numpy"
+            (numpy's PCG-64) or "python" (the standard library's Mersenne
+            Twister, which is faster for one roll at a time and doesn't
+            import numpy). Seeded rolls are reproducible within a backend,
+            but differ between backends.
     """
 
-    def __init__(self, seed=None) -> None:
-        self._result: typing.Iterable[int] | None = None
+    def __init__(self, seed=None, backend: str = "numpy") -> None:
+        if backend not in DICE_BACKENDS:
+            raise ValueError(f"Unknown dice backend {backend!r}, use one of {DICE_BACKENDS}")
+        self._result: tuple[int, int] | None = None
+        self._total: int | None = None
+        self._outcome: int | None = None
         self.n_rolls: int = 0
         """Number of rolls for the dice"""
-        self.rng: typing.Generator = np.random.default_rng(seed)
-        """Random number generated used when rolling"""
+        self._seed = seed
+        self.backend = backend
+        self._rng: "np.random.Generator | None" = None
+        self._python_rng: random.Random | None = None
+        self.probabilities: tuple[float, ...] | None = None
+        """Probability of each of the 36 outcomes, None for fair dice"""
+
+    @property
+    def rng(self) -> "np.random.Generator":
+        """Random number generated used when rolling, created on first use"""
+        if self._rng is None:
+            # numpy is imported here to keep `import crapssim` fast
+            import numpy as np
+
+            self._rng = np.random.default_rng(self._seed)
+        return self._rng
+
+    @rng.setter
+    def rng(self, value: "np.random.Generator") -> None:
+        self._rng = value
+
+    @property
+    def python_rng(self) -> random.Random:
+        """Standard library generator used by the "python" backend, created on first use"""
+        if self._python_rng is None:
+            seed = self._seed
+            if isinstance(seed, (list, tuple)):
+                # e.g. [seed, session] from run_sessions
+                seed = ",".join(map(str, seed))
+            self._python_rng = random.Random(seed)
+        return self._python_rng
 
     @property
     def total(self) -> int:
         """Sum of dice outcome, e.g. 8 for (2, 6)"""
-        if self._result is not None:
-            return sum(self.result)
+        return self._total
 
     @property
     def result(self) -> tuple[int, int]:
         """Most recent outcome of the roll of two dice, e.g. (2, 6)"""
-        if self._result is not None:
-            return tuple(self._result)
+        return self._result
 
     @result.setter
     def result(self, value: typing.Iterable[int]) -> tuple[int, int]:
         # Allows setting of result, used for some tests, but not recommended
         # NOTE: no checking is done here, so use with caution
         # NOTE: this does not increment the number of rolls
-        self._result = value
+        self._store(value)
+
+    @property
+    def outcome(self) -> int | None:
+        """
+        Index (0-35) of the most recent outcome, e.g. 0 for (1, 1) and 35 for
+        (6, 6), as in crapssim.kernel.outcome_index. None if the result isn't
+        a valid roll.
+        """
+        return self._outcome
+
+    def _set_outcome(self, index: int) -> None:
+        # the result, total and index are looked up once per roll so that
+        # reading them doesn't compute or allocate anything
+        self._result = _OUTCOMES[index]
+        self._total = _TOTALS[index]
+        self._outcome = index
+
+    def _store(self, value: typing.Iterable[int] | None) -> None:
+        if value is None:
+            self._result = self._total = self._outcome = None
+            return
+        result = tuple(value)
+        index = _OUTCOME_INDEX.get(result)
+        if index is not None:
+            self._set_outcome(index)
+        else:
+            self._result = result
+            self._total = sum(result)
+            self._outcome = None
 
     def roll(self) -> None:
         """
@@ -50,10 +127,19 @@ class Dice:
 
         The randomness of the dice is based on numpy.random,
         which uses the PCG-64 pseudo-random number generation
-        (see numpy.random.PCG64`).
+        (see numpy.random.PCG64`), or on the standard library's random
+        module with the "python" backend.
         """
         self.n_rolls += 1
-        self._result = self.rng.integers(1, 7, size=2).tolist()
+        if self.backend == "python":
+            getrandbits = self.python_rng.getrandbits
+            x = getrandbits(32)
+            while x >= _PYTHON_LIMIT:
+                x = getrandbits(32)
+            self._set_outcome(x % 36)
+        else:
+            d1, d2 = self.rng.integers(1, 7, size=2).tolist()
+            self._set_outcome((d1 - 1) * 6 + d2 - 1)
 
     def fixed_roll(self, outcome: typing.Iterable[int]) -> None:
         """
@@ -63,4 +149,199 @@ class Dice:
             outcome: The desired dice result to roll
         """
         self.n_rolls += 1
-        self._result = outcome
+        self._store(outcome)
+
+
+_STREAM_BLOCK = 256
+"""Rolls generated at a time by StreamDice, each from one 64-bit Philox output"""
+
+
+class StreamDice(Dice):
+    """
+    Dice whose rolls can be addressed directly by session and roll number.
+
+    Each ``(seed, session)`` pair gets its own key for numpy's counter-based
+    Philox bit generator, and roll ``n`` of the session always comes from the
+    ``n``-th 64-bit output of that stream. Any roll of any session can be
+    generated in O(1), without storing a seed per session or replaying the
+    rolls before it, so work can be split between processes arbitrarily and
+    a single session can be re-run on its own.
+
+    Args:
+        seed (int): Seed of the whole run.
+        session (int): Number of the session within the run.
+        roll (int): Number of rolls already made, the next roll is this one.
+    """
+
+    def __init__(self, seed: int, session: int = 0, roll: int = 0) -> None:
+        super().__init__([seed, session])
+        self.session = session
+        self._key = stream_key(seed, session)
+        self._block_start: int = 0
+        self._block: list[int] = []
+        self.seek(roll)
+
+    def seek(self, roll: int) -> None:
+        """
+        Move to a roll of the session, so the next roll is roll number
+        ``roll`` (counting from zero).
+
+        Args:
+            roll: Number of the next roll.
+        """
+        if roll < 0:
+            raise ValueError("The roll number can't be negative")
+        self.n_rolls = roll
+
+    def _load_block(self, start: int) -> None:
+        self._block = _stream_indices(self._key, start, _STREAM_BLOCK)
+        self._block_start = start
+
+    def roll(self) -> None:
+        """Make the next roll of the session."""
+        i = self.n_rolls - self._block_start
+        if not 0 <= i < len(self._block):
+            start = self.n_rolls - self.n_rolls % _STREAM_BLOCK
+            self._load_block(start)
+            i = self.n_rolls - start
+        self._set_outcome(self._block[i])
+        self.n_rolls += 1
+
+    @staticmethod
+    def outcome_at(seed: int, session: int, roll: int) -> tuple[int, int]:
+        """
+        Result of one roll of a session, without making any other roll.
+
+        Args:
+            seed: Seed of the whole run.
+            session: Number of the session within the run.
+            roll: Number of the roll within the session, counting from zero.
+        """
+        return _OUTCOMES[_stream_indices(stream_key(seed, session), roll, 1)[0]]
+
+
+def stream_key(seed: int, session: int) -> int:
+    """128-bit Philox key for the rolls of one session of a seeded run."""
+    import numpy as np
+
+    words = np.random.SeedSequence([seed, session]).generate_state(2, np.uint64)
+    return int(words[0]) | int(words[1]) << 64
+
+
+def _stream_indices(key: int, start: int, n: int) -> list[int]:
+    # Philox gives 4 outputs per counter value: the stream is positioned on
+    # the counter holding output `start` and the leading outputs are dropped
+    import numpy as np
+
+    skip = start % 4
+    bit_generator = np.random.Philox(counter=start // 4, key=key)
+    raw = bit_generator.random_raw(n + skip)[skip:]
+    # the outcome index is the high 64 bits of raw * 36, computed in 32-bit
+    # halves so that it doesn't overflow
+    high = (raw >> np.uint64(32)) * np.uint64(36)
+    low = ((raw & np.uint64(0xFFFFFFFF)) * np.uint64(36)) >> np.uint64(32)
+    index = (high + low) >> np.uint64(32)
+    return index.tolist()
+
+
+_WEIGHTED_BLOCK = 1024
+"""Rolls sampled at a time by WeightedDice"""
+
+
+class WeightedDice(Dice):
+    """
+    Dice with any distribution over the 36 outcomes, e.g. to study dice
+    setters or biased dice.
+
+    Outcomes are sampled with Walker's alias method: the alias table is built
+    once, and each roll then takes one uniform random number whatever the
+    distribution. Rolls are sampled in blocks of 1024 with numpy.
+
+    Args:
+        probabilities (Sequence[float]): Weight of each outcome, in the order
+            of crapssim.kernel.outcome_index ((1, 1), (1, 2), ..., (6, 6)).
+            Weights are normalized to sum to one.
+        seed (int): The seed passed to the random number generator.
+    """
+
+    def __init__(self, probabilities: typing.Sequence[float], seed=None) -> None:
+        super().__init__(seed)
+        weights = [float(p) for p in probabilities]
+        if len(weights) != 36:
+            raise ValueError("The dice need a probability for each of the 36 outcomes")
+        if min(weights) < 0 or sum(weights) <= 0:
+            raise ValueError("Probabilities must be non-negative and not all zero")
+        total = sum(weights)
+        self.probabilities = tuple(p / total for p in weights)
+        self._accept, self._alias = _alias_table(self.probabilities)
+        self._block: list[int] = []
+        self._position: int = 0
+
+    @classmethod
+    def from_faces(
+        cls,
+        die1: typing.Sequence[float],
+        die2: typing.Sequence[float] | None = None,
+        seed=None,
+    ) -> "WeightedDice":
+        """
+        Dice whose two dice land independently with the given face weights.
+
+        Args:
+            die1: Weight of each face (1 to 6) of the first die.
+            die2: Weight of each face of the second die, the same as the
+                first die if not given.
+            seed: The seed passed to the random number generator.
+        """
+        die2 = die1 if die2 is None else die2
+        if len(die1) != 6 or len(die2) != 6:
+            raise ValueError("Each die needs a weight for each of its 6 faces")
+        return cls([p1 * p2 for p1 in die1 for p2 in die2], seed)
+
+    def sample_indices(self, n: int) -> "np.ndarray":
+        """Outcome indices (0-35) of ``n`` independent rolls, without rolling the dice."""
+        import numpy as np
+
+        accept = np.asarray(self._accept)
+        alias = np.asarray(self._alias)
+        u = self.rng.random(n) * 36
+        column = u.astype(np.int64)
+        return np.where(u - column < accept[column], column, alias[column])
+
+    def sample(self, n: int) -> "np.ndarray":
+        """
+        Outcomes of ``n`` independent rolls as an array with shape (n, 2),
+        e.g. for crapssim.env.step_batch, without rolling the dice.
+        """
+        import numpy as np
+
+        index = self.sample_indices(n)
+        return np.stack([index // 6 + 1, index % 6 + 1], axis=1)
+
+    def roll(self) -> None:
+        """Roll the dice with the given distribution."""
+        if self._position == len(self._block):
+            self._block = self.sample_indices(_WEIGHTED_BLOCK).tolist()
+            self._position = 0
+        self._set_outcome(self._block[self._position])
+        self._position += 1
+        self.n_rolls += 1
+
+
+def _alias_table(probabilities: typing.Sequence[float]) -> tuple[list[float], list[int]]:
+    # Vose's construction: each of the n columns holds its own outcome with
+    # probability accept[i] and the outcome alias[i] otherwise
+    n = len(probabilities)
+    scaled = [p * n for p in probabilities]
+    accept = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1]
+    large = [i for i, p in enumerate(scaled) if p >= 1]
+    while small and large:
+        s, g = small.pop(), large.pop()
+        accept[s] = scaled[s]
+        alias[s] = g
+        scaled[g] -= 1 - scaled[s]
+        (small if scaled[g] < 1 else large).append(g)
+    # whatever is left is 1 up to rounding
+    return accept, alias
@@ -0,0 +1,267 @@
+"""
+Differential testing of table engines. A candidate engine (any
+:py:class:`~crapssim.table.TableUpdate`, e.g.
+:py:class:`~crapssim.kernel.KernelTableUpdate`) is run side by side with the
+reference ``TableUpdate`` on the same dice, and the bankroll, bets and point
+are compared after every roll. The first difference is reported along with the
+dice that reproduce it.
+
+Example::
+
+    mismatch = fuzz(KernelTableUpdate(), n_strategies=200)
+    assert mismatch is None, str(mismatch)
+"""
+
+import typing
+from dataclasses import dataclass
+
+import numpy as np
+
+from crapssim.bet import (
+    All,
+    Any7,
+    Bet,
+    Boxcars,
+    CAndE,
+    Come,
+    DontCome,
+    DontPass,
+    Field,
+    Fire,
+    HardWay,
+    Hop,
+    PassLine,
+    Place,
+    Small,
+    Tall,
+    Yo,
+)
+from crapssim.dice import Dice
+from crapssim.strategy.odds import (
+    ComeOddsMultiplier,
+    DontComeOddsMultiplier,
+    DontPassOddsMultiplier,
+    PassLineOddsMultiplier,
+)
+from crapssim.strategy.tools import (
+    AddIfNewShooter,
+    AddIfNotBet,
+    AddIfPointOff,
+    AddIfPointOn,
+    AggregateStrategy,
+    CountStrategy,
+    RemoveByType,
+    RemoveIfPointOff,
+    Strategy,
+)
+from crapssim.table import Table, TableUpdate
+
+__all__ = [
+    "Mismatch",
+    "roll_outcomes",
+    "compare_engines",
+    "differential_test",
+    "random_strategy",
+    "fuzz",
+]
+
+
+@dataclass(frozen=True)
+class Mismatch:
+    """The first difference between the reference and candidate engines."""
+
+    roll: int
+    """Roll number (starting at one) after which the engines differed."""
+    field: str
+    """What differed, one of "bankroll", "bets" or "point"."""
+    reference: typing.Any
+    """Value from the reference engine."""
+    candidate: typing.Any
+    """Value from the candidate engine."""
+    outcomes: list[tuple[int, int]]
+    """Dice outcomes up to and including the roll that differed."""
+    strategy: Strategy
+    """The strategy that was being played."""
+
+    def __str__(self) -> str:
+        return (
+            f"{self.field} differs after roll {self.roll} with {self.strategy!r}: "
+            f"reference={self.reference!r}, candidate={self.candidate!r}, "
+            f"outcomes={self.outcomes}"
+        )
+
+
+def roll_outcomes(seed: int | None, n_rolls: int) -> list[tuple[int, int]]:
+    """The first ``n_rolls`` outcomes of ``Dice(seed)``, the same as ``Table(seed)``."""
+    dice = Dice(seed)
+    outcomes = []
+    for _ in range(n_rolls):
+        dice.roll()
+        outcomes.append(dice.result)
+    return outcomes
+
+
+def _state(table: Table, field: str) -> typing.Any:
+    player = table.players[0]
+    if field == "bankroll":
+        return player.bankroll
+    if field == "bets":
+        return list(player.bets)
+    return table.point.number
+
+
+def compare_engines(
+    candidate: TableUpdate,
+    strategy: Strategy,
+    outcomes: typing.Iterable[typing.Iterable[int]],
+    bankroll: typing.SupportsFloat = 1000,
+    reference: TableUpdate | None = None,
+) -> Mismatch | None:
+    """
+    Run the strategy with both engines on the given dice and compare.
+
+    Args:
+        candidate: The engine being tested.
+        strategy: The strategy for the (single) player at each table.
+        outcomes: Dice outcomes to roll.
+        bankroll: Starting bankroll of the player.
+        reference: The engine to compare against, defaults to ``TableUpdate()``.
+
+    Returns:
+        The first mismatch, or None if the engines agreed on every roll.
+    """
+    if reference is None:
+        reference = TableUpdate()
+
+    reference_table, candidate_table = Table(), Table()
+    reference_table.add_player(bankroll, strategy=strategy)
+    candidate_table.add_player(bankroll, strategy=strategy)
+
+    rolled = []
+    for outcome in outcomes:
+        outcome = tuple(outcome)
+        rolled.append(outcome)
+        reference.run(reference_table, outcome)
+        candidate.run(candidate_table, outcome)
+
+        for field in ("bankroll", "bets", "point"):
+            expected = _state(reference_table, field)
+            actual = _state(candidate_table, field)
+            if expected != actual:
+                return Mismatch(
+                    len(rolled), field, expected, actual, list(rolled), strategy
+                )
+    return None
+
+
+def differential_test(
+    candidate: TableUpdate,
+    strategies: typing.Iterable[Strategy],
+    seeds: typing.Iterable[int] = range(10),
+    n_rolls: int = 500,
+    bankroll: typing.SupportsFloat = 1000,
+    reference: TableUpdate | None = None,
+) -> Mismatch | None:
+    """
+    Compare the engines for every strategy on every seed.
+
+    Returns:
+        The first mismatch found, or None if the engines always agreed.
+    """
+    outcomes = {seed: roll_outcomes(seed, n_rolls) for seed in seeds}
+    for strategy in strategies:
+        for seed_outcomes in outcomes.values():
+            mismatch = compare_engines(
+                candidate, strategy, seed_outcomes, bankroll, reference
+            )
+            if mismatch is not None:
+                return mismatch
+    return None
+
+
+def _random_bet(rng: np.random.Generator) -> Bet:
+    amount = float(rng.choice([1, 5, 6, 10, 12]))
+    number = int(rng.choice([4, 5, 6, 8, 9, 10]))
+    choices: list[typing.Callable[[], Bet]] = [
+        lambda: PassLine(amount),
+        lambda: DontPass(amount),
+        lambda: Come(amount),
+        lambda: DontCome(amount),
+        lambda: Place(number, amount),
+        lambda: Field(amount),
+        lambda: Any7(amount),
+        lambda: Yo(amount),
+        lambda: Boxcars(amount),
+        lambda: CAndE(amount),
+        lambda: HardWay(int(rng.choice([4, 6, 8, 10])), amount),
+        lambda: Hop(tuple(sorted(rng.integers(1, 7, size=2).tolist())), amount),
+        lambda: Fire(amount),
+        lambda: All(amount),
+        lambda: Tall(amount),
+        lambda: Small(amount),
+    ]
+    return choices[rng.integers(len(choices))]()
+
+
+def _random_part(rng: np.random.Generator) -> Strategy:
+    bet = _random_bet(rng)
+    multiplier = int(rng.integers(1, 4))
+    choices: list[typing.Callable[[], Strategy]] = [
+        lambda: AddIfNotBet(bet),
+        lambda: AddIfPointOff(bet),
+        lambda: AddIfPointOn(bet),
+        lambda: AddIfNewShooter(bet),
+        lambda: CountStrategy(type(bet), int(rng.integers(1, 4)), bet),
+        lambda: RemoveIfPointOff(bet),
+        lambda: RemoveByType(type(bet)),
+        lambda: PassLineOddsMultiplier(multiplier),
+        lambda: DontPassOddsMultiplier(multiplier),
+        lambda: ComeOddsMultiplier(multiplier, always_working=bool(rng.integers(2))),
+        lambda: DontComeOddsMultiplier(multiplier),
+    ]
+    return choices[rng.integers(len(choices))]()
+
+
+def random_strategy(rng: np.random.Generator, max_parts: int = 5) -> Strategy:
+    """
+    Random combination of building blocks from :py:mod:`crapssim.strategy.tools`
+    and :py:mod:`crapssim.strategy.odds`.
+
+    Args:
+        rng: Random number generator used to pick the building blocks.
+        max_parts: Maximum number of building blocks in the strategy.
+    """
+    n_parts = int(rng.integers(1, max_parts + 1))
+    return AggregateStrategy(*(_random_part(rng) for _ in range(n_parts)))
+
+
+def fuzz(
+    candidate: TableUpdate,
+    n_strategies: int = 100,
+    n_rolls: int = 500,
+    seed: int = 0,
+    bankroll: typing.SupportsFloat = 1000,
+    reference: TableUpdate | None = None,
+) -> Mismatch | None:
+    """
+    Compare the engines on random strategies, each with its own random dice.
+
+    Args:
+        candidate: The engine being tested.
+        n_strategies: Number of random strategies to try.
+        n_rolls: Number of rolls for each strategy.
+        seed: Seed for picking the strategies and dice.
+        bankroll: Starting bankroll of the player.
+        reference: The engine to compare against, defaults to ``TableUpdate()``.
+
+    Returns:
+        The first mismatch found, or None if the engines always agreed.
+    """
+    rng = np.random.default_rng(seed)
+    for _ in range(n_strategies):
+        strategy = random_strategy(rng)
+        outcomes = rng.integers(1, 7, size=(n_rolls, 2)).tolist()
+        mismatch = compare_engines(candidate, strategy, outcomes, bankroll, reference)
+        if mismatch is not None:
+            return mismatch
+    return None
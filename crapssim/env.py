@@ -0,0 +1,485 @@
+"""
+A pure-function step API for embedding crapssim in custom loops, such as
+reinforcement learning training, where the caller decides the bets on every
+roll instead of a :py:class:`~crapssim.strategy.tools.Strategy`.
+
+:py:func:`step` takes the state of one player at the table and an explicit
+:py:class:`Action` (bets to take down and bets to place), applies one roll
+with the same rules as :py:class:`~crapssim.table.TableUpdate`, and returns
+the new state along with the reward, the change in the player's total cash::
+
+    state = State(bankroll=100)
+    state, reward = step(state, Action(add=(PassLine(5),)), roll=(3, 4))
+
+:py:func:`step_batch` does the same for many independent environments at
+once. Their state is held in arrays (see :py:class:`BatchState`), with the
+bets as amounts in a fixed set of slots (:data:`SLOTS`), and the bets are
+settled with the lookup tables of :py:mod:`crapssim.kernel`::
+
+    rng = np.random.default_rng(0)
+    state = BatchState.initial(n_envs=10_000, bankroll=100)
+    add = np.zeros_like(state.amounts)
+    add[:, slot_index(PassLine(1))] = 5
+    state, reward = step_batch(state, rng.integers(1, 7, (10_000, 2)), add=add)
+
+Both functions leave their input state untouched, and given the same state,
+action and roll they return the same result. With amounts in
+:class:`~crapssim.money.Cents`, states hold exact integers, so equal states
+compare and hash equal and can be memoized, and batches use int64 arrays.
+"""
+
+import copy
+import dataclasses
+import typing
+
+import numpy as np
+
+from crapssim.bet import (
+    All,
+    Any7,
+    AnyCraps,
+    Bet,
+    Boxcars,
+    CAndE,
+    Come,
+    DontCome,
+    DontPass,
+    Field,
+    Fire,
+    HardWay,
+    Hop,
+    Odds,
+    PassLine,
+    Place,
+    Small,
+    Tall,
+    Three,
+    Two,
+    Yo,
+)
+from crapssim.kernel import (
+    _NO_ACTION,
+    _PUSH,
+    _WIN,
+    POINT_INDEX,
+    _ScratchTable,
+    _shape_id,
+    _shape_key,
+    get_kernel_tables,
+)
+from crapssim.money import Cents, exact_ratio
+from crapssim.strategy.tools import NullStrategy
+from crapssim.table import Table, TableSettings, TableUpdate
+
+__all__ = [
+    "SLOTS",
+    "Action",
+    "BatchState",
+    "State",
+    "slot_index",
+    "step",
+    "step_batch",
+]
+
+_STATEFUL_TYPES = (Fire, All, Tall, Small)
+
+_NULL_STRATEGY = NullStrategy()
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class State:
+    """
+    State of one player at the table between rolls.
+
+    Attributes:
+        bankroll: The player's bankroll, not counting the bets on the table.
+        bets: The player's bets on the table.
+        point: The point number, None when the point is Off.
+        new_shooter: Whether the next roll is by a new shooter.
+    """
+
+    bankroll: float
+    bets: tuple[Bet, ...] = ()
+    point: int | None = None
+    new_shooter: bool = True
+
+    @property
+    def total_cash(self) -> float:
+        """Bankroll plus the amount of the bets on the table."""
+        return self.bankroll + sum(bet.amount for bet in self.bets)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Action:
+    """
+    Bets to take down and to place before a roll.
+
+    Bets are taken down first, with :py:meth:`~crapssim.table.Player.remove_bet`,
+    then placed in order with :py:meth:`~crapssim.table.Player.add_bet`, so
+    bets that aren't removable, aren't allowed or can't be afforded are
+    ignored, as they would be for a strategy.
+    """
+
+    add: tuple[Bet, ...] = ()
+    remove: tuple[Bet, ...] = ()
+
+
+def _copy_bet(bet: Bet) -> Bet:
+    # bets like Come change their number when settled and Fire keeps track
+    # of the points made, so states never share bet objects
+    if isinstance(bet, _STATEFUL_TYPES):
+        return copy.deepcopy(bet)
+    return copy.copy(bet)
+
+
+def step(
+    state: State,
+    action: Action,
+    roll: tuple[int, int],
+    settings: TableSettings | None = None,
+) -> tuple[State, float]:
+    """
+    Apply the action and one roll of the dice to the state.
+
+    Args:
+        state: The state before the action.
+        action: Bets to take down and to place before the roll.
+        roll: The dice outcome, e.g. (3, 4).
+        settings: The table settings, the defaults of
+            :py:class:`~crapssim.table.Table` if None.
+
+    Returns:
+        The new state, and the reward: the change in the player's total cash
+        (bankroll plus bets on the table) over the roll.
+    """
+    table = Table()
+    if settings is not None:
+        table.settings = settings
+    table.point.number = state.point
+    table.new_shooter = state.new_shooter
+    table.add_player(state.bankroll, _NULL_STRATEGY)
+    player = table.players[0]
+    player.bets.extend(_copy_bet(bet) for bet in state.bets)
+
+    for bet in action.remove:
+        player.remove_bet(bet)
+    for bet in action.add:
+        player.add_bet(bet)
+
+    TableUpdate.roll(table, roll)
+    TableUpdate.update_bets(table)
+    TableUpdate.set_new_shooter(table)
+    TableUpdate.update_numbers(table, verbose=False)
+
+    new_state = State(
+        bankroll=player.bankroll,
+        bets=tuple(player.bets),
+        point=table.point.number,
+        new_shooter=table.new_shooter,
+    )
+    return new_state, new_state.total_cash - state.total_cash
+
+
+def _build_slots() -> tuple[Bet, ...]:
+    numbers = (4, 5, 6, 8, 9, 10)
+    slots: list[Bet] = [PassLine(1), DontPass(1), Come(1), DontCome(1)]
+    slots += [Come(1, n) for n in numbers]
+    slots += [DontCome(1, n) for n in numbers]
+    bases = (PassLine, DontPass, Come, DontCome)
+    slots += [Odds(base, n, 1) for base in bases for n in numbers]
+    slots += [Place(n, 1) for n in numbers]
+    slots += [cls(1) for cls in (Field, CAndE, Any7, Two, Three, Yo, Boxcars, AnyCraps)]
+    slots += [HardWay(n, 1) for n in (4, 6, 8, 10)]
+    slots += [Hop((d1, d2), 1) for d1 in range(1, 7) for d2 in range(d1, 7)]
+    return tuple(slots)
+
+
+SLOTS: tuple[Bet, ...] = _build_slots()
+"""The bets that can be held in a :py:class:`BatchState`, each with an amount
+of one. Base bets come before their odds, which is the order bets are placed
+by :py:func:`step_batch`."""
+
+_SLOT_INDEX: dict[tuple[int, int, int, int], int] = {
+    _shape_key(bet): i for i, bet in enumerate(SLOTS)
+}
+
+
+def slot_index(bet: Bet) -> int:
+    """
+    Index of the bet's slot in :data:`SLOTS`.
+
+    Raises:
+        ValueError: If the bet can't be held in a batch, e.g. a Fire bet or
+            an Odds bet that is always working.
+    """
+    try:
+        return _SLOT_INDEX[_shape_key(bet)]
+    except KeyError:
+        raise ValueError(f"{bet} isn't supported by step_batch") from None
+
+
+_POINT_INDEX = np.zeros(11, dtype=np.intp)
+for _number, _idx in POINT_INDEX.items():
+    if _number is not None:
+        _POINT_INDEX[_number] = _idx
+
+
+class _ScratchPlayer:
+    """Player without bets, to ask bets if they are allowed on a given point."""
+
+    def __init__(self, table: _ScratchTable) -> None:
+        self.table = table
+        self.bets: list[Bet] = []
+
+
+class _BatchRules:
+    """Per-slot rules of the table for each point status, as arrays."""
+
+    def __init__(self, settings: TableSettings) -> None:
+        self.settings: TableSettings = {k: dict(v) for k, v in settings.items()}
+        n_slots = len(SLOTS)
+        self.shapes = np.array([_shape_id(_shape_key(bet)) for bet in SLOTS])
+        self.allowed = np.ones((7, n_slots), dtype=bool)
+        self.removable = np.ones((7, n_slots), dtype=bool)
+        self.max_odds = np.zeros(n_slots)
+        self.odds_base = np.zeros((n_slots, 7, n_slots))
+        """Which slots count towards the base amount of each Odds slot."""
+
+        table = _ScratchTable(self.settings)
+        player = _ScratchPlayer(table)
+        for point_number, p in POINT_INDEX.items():
+            table.point.number = point_number
+            for i, bet in enumerate(SLOTS):
+                self.removable[p, i] = bet.is_removable(table)
+                if not isinstance(bet, Odds):
+                    self.allowed[p, i] = bet.is_allowed(player)
+                    continue
+                self.max_odds[i] = bet.get_max_odds(table)
+                numbers = tuple(bet.get_winning_numbers(table))
+                for j, base in enumerate(SLOTS):
+                    if isinstance(base, bet.base_type):
+                        if tuple(base.get_winning_numbers(table)) == numbers:
+                            self.odds_base[i, p, j] = 1.0
+        self.base_slots = {
+            i: np.flatnonzero(self.odds_base[i].any(axis=0))
+            for i in np.flatnonzero(self.max_odds)
+        }
+
+        # slot that each Come and Don't Come bet moves to for each dice total
+        self.moves: list[tuple[int, np.ndarray]] = []
+        for i, bet in enumerate(SLOTS):
+            if not isinstance(bet, (Come, DontCome)) or bet.number is not None:
+                continue
+            move = np.full(13, i, dtype=np.intp)
+            for total in range(2, 13):
+                moved = copy.copy(bet)
+                table.dice.result = (max(1, total - 6), min(6, total - 1))
+                moved.update_number(table)
+                # a Don't Come bet "moves" to the 7 only when it has lost
+                move[total] = _SLOT_INDEX.get(_shape_key(moved), i)
+            self.moves.append((i, move))
+
+
+_RULES_CACHE: list[_BatchRules] = []
+
+
+def _get_batch_rules(settings: TableSettings) -> _BatchRules:
+    for rules in _RULES_CACHE:
+        if rules.settings == settings:
+            return rules
+    rules = _BatchRules(settings)
+    _RULES_CACHE.append(rules)
+    return rules
+
+
+@dataclasses.dataclass(frozen=True)
+class BatchState:
+    """
+    State of many independent environments, one player each, as arrays.
+
+    Attributes:
+        bankroll: Bankroll of each environment, shape (n_envs,).
+        amounts: Amount bet in each slot of :data:`SLOTS`, shape
+            (n_envs, len(SLOTS)).
+        point: The point number, zero when the point is Off, shape (n_envs,).
+        new_shooter: Whether the next roll is by a new shooter, shape (n_envs,).
+    """
+
+    bankroll: np.ndarray
+    amounts: np.ndarray
+    point: np.ndarray
+    new_shooter: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.bankroll)
+
+    @property
+    def total_cash(self) -> np.ndarray:
+        """Bankroll plus the amount of the bets on the table, per environment."""
+        return self.bankroll + self.amounts.sum(axis=1)
+
+    @classmethod
+    def initial(cls, n_envs: int, bankroll: float = 100) -> "BatchState":
+        """
+        Environments with no bets, the point Off and a new shooter. If the
+        bankroll is in :class:`~crapssim.money.Cents`, the bankrolls and
+        amounts are int64 arrays of cents, and payouts are rounded down to
+        the cent as for bets in cents.
+        """
+        dtype = np.int64 if type(bankroll) is Cents else np.float64
+        return cls(
+            bankroll=np.full(n_envs, bankroll, dtype=dtype),
+            amounts=np.zeros((n_envs, len(SLOTS)), dtype=dtype, order="F"),
+            point=np.zeros(n_envs, dtype=np.int8),
+            new_shooter=np.ones(n_envs, dtype=bool),
+        )
+
+    @classmethod
+    def from_states(cls, states: typing.Sequence[State]) -> "BatchState":
+        """
+        Batch of the given states.
+
+        Raises:
+            ValueError: If a state has a bet without a slot, see :py:func:`slot_index`.
+        """
+        cents = bool(states) and type(states[0].bankroll) is Cents
+        batch = cls.initial(len(states), Cents(0) if cents else 0.0)
+        for i, state in enumerate(states):
+            batch.bankroll[i] = state.bankroll
+            batch.point[i] = state.point or 0
+            batch.new_shooter[i] = state.new_shooter
+            for bet in state.bets:
+                batch.amounts[i, slot_index(bet)] += bet.amount
+        return batch
+
+    def state(self, i: int) -> State:
+        """State of the i-th environment, with one bet per slot."""
+        money = Cents if self.bankroll.dtype.kind == "i" else float
+        bets = tuple(
+            SLOTS[j]._copy_with_amount(money(self.amounts[i, j]))
+            for j in np.flatnonzero(self.amounts[i])
+        )
+        return State(
+            bankroll=money(self.bankroll[i]),
+            bets=bets,
+            point=int(self.point[i]) or None,
+            new_shooter=bool(self.new_shooter[i]),
+        )
+
+
+_EXACT_RATIOS: dict[tuple, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+
+def _exact_ratios(tables: typing.Any, ratio: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Numerators and denominators of payout ratios taken from the kernel tables."""
+    key = (id(tables), tables.ratio.shape)
+    exact = _EXACT_RATIOS.get(key)
+    if exact is None:
+        values = np.unique(tables.ratio)
+        fractions = [exact_ratio(float(x)) for x in values]
+        exact = _EXACT_RATIOS[key] = (
+            values,
+            np.array([f.numerator for f in fractions], dtype=np.int64),
+            np.array([f.denominator for f in fractions], dtype=np.int64),
+        )
+    values, numerators, denominators = exact
+    index = np.searchsorted(values, ratio)
+    return numerators[index], denominators[index]
+
+
+def step_batch(
+    state: BatchState,
+    rolls: np.ndarray,
+    add: np.ndarray | None = None,
+    remove: np.ndarray | None = None,
+    settings: TableSettings | None = None,
+) -> tuple[BatchState, np.ndarray]:
+    """
+    Apply an action and one roll of the dice to each environment.
+
+    This follows the same rules as :py:func:`step`. Bets are placed in the
+    order of :data:`SLOTS`, and bets in the same slot (e.g. two Come bets
+    that moved to the 6) are combined. Payouts are summed per environment
+    rather than bet by bet, so bankrolls can differ from :py:func:`step` by
+    floating point rounding. In cents (see :py:meth:`BatchState.initial`)
+    they are the same.
+
+    Args:
+        state: The state of the environments before the action.
+        rolls: The dice outcome of each environment, shape (n_envs, 2).
+        add: Amount to bet in each slot, shape (n_envs, len(SLOTS)), in
+            cents if the state is. Bets that aren't allowed or can't be
+            afforded are ignored.
+        remove: Whether to take down the bet in each slot, shape
+            (n_envs, len(SLOTS)). Bets that aren't removable are kept.
+        settings: The table settings, the defaults of
+            :py:class:`~crapssim.table.Table` if None.
+
+    Returns:
+        The new state, and the reward of each environment: the change in
+        total cash (bankroll plus bets on the table) over the roll.
+    """
+    if settings is None:
+        settings = Table().settings
+    rules = _get_batch_rules(settings)
+    tables = get_kernel_tables(settings)
+    tables.ensure(int(rules.shapes.max()) + 1)
+
+    rows = np.arange(len(state))
+    p = _POINT_INDEX[state.point]
+    bankroll = state.bankroll.copy()
+    # column-major, since the bets are placed and moved slot by slot
+    amounts = np.asfortranarray(state.amounts).copy(order="F")
+
+    if remove is not None:
+        taken = remove & rules.removable[p] & (amounts > 0)
+        bankroll += np.where(taken, amounts, 0).sum(axis=1)
+        amounts[taken] = 0.0
+
+    if add is not None:
+        for i in np.flatnonzero((add > 0).any(axis=0)):
+            new = amounts[:, i] + add[:, i]
+            ok = (add[:, i] > 0) & rules.allowed[p, i] & (new <= bankroll + amounts[:, i])
+            if rules.max_odds[i]:
+                base_slots = rules.base_slots[i]
+                weights = rules.odds_base[i, p][:, base_slots]
+                base = (amounts[:, base_slots] * weights).sum(axis=1)
+                ok &= new <= rules.max_odds[i] * base
+            bankroll[ok] -= add[ok, i]
+            amounts[ok, i] = new[ok]
+
+    rolls = np.asarray(rolls)
+    total = rolls[:, 0] + rolls[:, 1]
+    outcome = (rolls[:, 0] - 1) * 6 + (rolls[:, 1] - 1)
+
+    # only settle the slots that some environment has a bet in
+    cols = np.flatnonzero(amounts.any(axis=0))
+    bets = amounts[:, cols]
+    shapes = rules.shapes[cols]
+    kind = tables.kind[shapes[None, :], p[:, None], outcome[:, None]]
+    ratio = tables.ratio[shapes[None, :], p[:, None], outcome[:, None]]
+    if bankroll.dtype.kind == "i":
+        numerator, denominator = _exact_ratios(tables, ratio)
+        won = bets * numerator // denominator + bets
+    else:
+        won = bets * ratio + bets
+    returned = np.where(kind == _WIN, won, 0)
+    returned = np.where(kind == _PUSH, bets, returned)
+    bankroll += returned.sum(axis=1)
+    amounts[:, cols] = np.where(kind != _NO_ACTION, 0, bets)
+
+    for i, move in rules.moves:
+        dest = move[total]
+        moving = (dest != i) & (amounts[:, i] > 0)
+        amounts[rows[moving], dest[moving]] += amounts[moving, i]
+        amounts[moving, i] = 0.0
+
+    point_on = state.point != 0
+    new_shooter = point_on & (total == 7)
+    point = state.point.copy()
+    established = ~point_on & np.isin(total, (4, 5, 6, 8, 9, 10))
+    point[established] = total[established]
+    point[point_on & ((total == 7) | (total == state.point))] = 0
+
+    new_state = BatchState(bankroll, amounts, point, new_shooter)
+    return new_state, new_state.total_cash - state.total_cash
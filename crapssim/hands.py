@@ -0,0 +1,224 @@
+"""
+A library of pre-generated shooter hands for assembling sessions by
+bootstrap.
+
+A shooter's hand (every roll from their first come-out roll up to and
+including the seven-out) doesn't depend on any other hand, so a session is
+just a sequence of hands. Generating a large library of hands once and then
+sampling hands from it lets a sweep over many strategies and bankrolls reuse
+one random generation pass.
+
+The library is stored as a dice corpus (see :py:mod:`crapssim.corpus`) with
+one session per hand, so the rolls are memory mapped and each hand is found
+through the offset index. Build one from the command line with::
+
+    python -m crapssim.hands library --hands 1000000 --seed 1
+
+and play sessions from it with::
+
+    library = HandLibrary("library")
+    table = Table(dice=HandLibraryDice(library, seed=7))
+
+or with ``run_sessions(..., hand_library=library)``.
+"""
+
+import os
+import typing
+
+import numpy as np
+
+from crapssim.corpus import _PACKED_OUTCOME, DiceCorpus, DiceCorpusWriter
+from crapssim.dice import Dice
+
+__all__ = ["generate_hands", "build_hand_library", "HandLibrary", "HandLibraryDice"]
+
+_POINTS = frozenset((4, 5, 6, 8, 9, 10))
+
+
+def generate_hands(
+    rng: np.random.Generator, n_hands: int, chunk_size: int = 1 << 20
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Roll ``n_hands`` complete shooter hands.
+
+    Args:
+        rng: Random number generator for the rolls.
+        n_hands: Number of hands to roll.
+        chunk_size: Number of rolls drawn from the generator at a time.
+
+    Returns:
+        The packed rolls of all hands back to back (see
+        :func:`~crapssim.corpus.pack_outcomes`) and the number of rolls in
+        each hand.
+    """
+    chunks: list[np.ndarray] = []
+    lengths: list[int] = []
+    length = 0
+    point = 0
+    while len(lengths) < n_hands:
+        faces = rng.integers(1, 7, size=(chunk_size, 2), dtype=np.uint8)
+        totals = (faces[:, 0] + faces[:, 1]).tolist()
+        end = chunk_size
+        for i, total in enumerate(totals):
+            length += 1
+            if point == 0:
+                if total in _POINTS:
+                    point = total
+            elif total == 7:
+                lengths.append(length)
+                length = point = 0
+                if len(lengths) == n_hands:
+                    end = i + 1
+                    break
+            elif total == point:
+                point = 0
+        chunks.append((faces[:end, 0] << 3) | faces[:end, 1])
+    packed = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.uint8)
+    return packed, np.array(lengths, dtype=np.int64)
+
+
+def build_hand_library(
+    path: str | os.PathLike,
+    n_hands: int,
+    seed: int | None = None,
+    chunk_hands: int = 100_000,
+) -> "HandLibrary":
+    """
+    Generate a library of shooter hands and write it to a new directory.
+
+    Args:
+        path: Directory for the library, created if it doesn't exist.
+        n_hands: Number of hands in the library.
+        seed: Seed for the random number generator, also stored as the seed
+            of every hand in the index.
+        chunk_hands: Number of hands generated and written at a time, which
+            bounds the memory used.
+
+    Returns:
+        The library, opened for reading.
+    """
+    rng = np.random.default_rng(seed)
+    with DiceCorpusWriter(path) as writer:
+        for first in range(0, n_hands, chunk_hands):
+            packed, lengths = generate_hands(rng, min(chunk_hands, n_hands - first))
+            writer.add_sessions(seed or 0, packed, lengths, first_session=first)
+    return HandLibrary(path)
+
+
+class HandLibrary(DiceCorpus):
+    """
+    Read-only, memory mapped library of shooter hands.
+
+    Args:
+        path: Directory written by :func:`build_hand_library`.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        super().__init__(path)
+        self.offsets: np.ndarray = np.ascontiguousarray(self.index["offset"])
+        """Position of the first roll of each hand."""
+        self.lengths: np.ndarray = np.ascontiguousarray(self.index["length"])
+        """Number of rolls in each hand."""
+
+    @property
+    def n_hands(self) -> int:
+        """Number of hands in the library."""
+        return len(self.index)
+
+    def hand(self, i: int) -> np.ndarray:
+        """Packed rolls of the ``i``-th hand (a view into the memory map)."""
+        offset = int(self.offsets[i])
+        return self.faces[offset : offset + int(self.lengths[i])]
+
+
+class HandLibraryDice(Dice):
+    """
+    Dice that play whole shooter hands drawn at random from a library.
+
+    Each time a hand ends (with a seven-out) the next hand is drawn, so a
+    session with ``max_shooter=10`` plays exactly ten hands from the library.
+
+    Args:
+        library: The library of hands.
+        seed: Seed for drawing hands (and for rolling fresh hands).
+        replace: If True, hands are drawn with replacement and the library
+            is never exhausted. If False, each hand is played at most once.
+        fresh: What to do once every hand has been played (only possible
+            with ``replace=False``): if True, roll fresh random hands,
+            otherwise raise IndexError.
+    """
+
+    def __init__(
+        self,
+        library: HandLibrary,
+        seed: typing.Any = None,
+        replace: bool = True,
+        fresh: bool = False,
+    ) -> None:
+        super().__init__(seed)
+        if library.n_hands == 0:
+            raise ValueError("The hand library is empty")
+        self.library = library
+        self.replace = replace
+        self.fresh = fresh
+        self.n_hands: int = 0
+        """Number of hands started from the library."""
+        self._view = memoryview(library.faces)
+        self._position: int = 0
+        self._end: int = 0
+        self._draws: list[int] = []
+        self._played: set[int] = set()
+        self._exhausted: bool = False
+
+    def _draw_hand(self) -> int:
+        n = self.library.n_hands
+        while True:
+            if not self._draws:
+                self._draws = self.rng.integers(n, size=256).tolist()
+            hand = self._draws.pop()
+            if self.replace:
+                return hand
+            if hand not in self._played:
+                self._played.add(hand)
+                return hand
+
+    def _next_hand(self) -> bool:
+        if not self.replace and len(self._played) == self.library.n_hands:
+            if not self.fresh:
+                raise IndexError(
+                    f"All {self.library.n_hands} hands of the library have been played"
+                )
+            self._exhausted = True
+            return False
+        hand = self._draw_hand()
+        self._position = int(self.library.offsets[hand])
+        self._end = self._position + int(self.library.lengths[hand])
+        self.n_hands += 1
+        return True
+
+    def roll(self) -> None:
+        """Play the next roll of the current hand, drawing a new hand if needed."""
+        if self._position == self._end and (self._exhausted or not self._next_hand()):
+            super().roll()
+            return
+        self._set_outcome(_PACKED_OUTCOME[self._view[self._position]])
+        self._position += 1
+        self.n_rolls += 1
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Build a hand library from the command line."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build a library of shooter hands.")
+    parser.add_argument("path", help="directory for the library")
+    parser.add_argument("--hands", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    library = build_hand_library(args.path, args.hands, seed=args.seed)
+    print(f"{library.n_hands} hands, {library.n_rolls} rolls written to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,395 @@
+"""
+The kernel is a compact, array-based representation of a player's bets. Each
+bet becomes one row of a structured NumPy array (see :data:`BET_DTYPE`) and all
+rows are settled against a roll at once with array operations, instead of one
+:py:meth:`~crapssim.bet.Bet.get_result` call per bet.
+
+Stateless bets are resolved through lookup tables that hold the outcome and
+payout ratio of every bet "shape" (type, number, base type and flags) for each
+point status and each of the 36 dice outcomes. The tables are built once per
+set of table settings by asking the bets themselves, so results are identical
+to the ones produced by :py:meth:`~crapssim.bet.Bet.get_result`. Stateful bets
+(Fire, All, Tall, Small) and unknown bet classes fall back to ``get_result``.
+
+Bet types are identified by the codes of :py:mod:`crapssim.registry`.
+"""
+
+import typing
+
+import numpy as np
+
+from crapssim.bet import (
+    Any7,
+    AnyCraps,
+    Bet,
+    BetResult,
+    Boxcars,
+    CAndE,
+    Come,
+    DontCome,
+    DontPass,
+    Field,
+    HardWay,
+    Hop,
+    Odds,
+    PassLine,
+    Place,
+    Three,
+    Two,
+    Yo,
+    _payout_ratio,
+)
+from crapssim.dice import Dice
+from crapssim.money import Cents
+from crapssim.point import Point
+from crapssim.registry import (
+    BET_TYPE_CODES,
+    FLAG_ALWAYS_WORKING,
+    decode_bet,
+    hop_number,
+)
+from crapssim.table import TableSettings, TableUpdate
+
+__all__ = [
+    "BET_DTYPE",
+    "BET_TYPE_CODES",
+    "FLAG_ALWAYS_WORKING",
+    "FLAG_FALLBACK",
+    "KERNEL_MIN_BETS",
+    "BetKernel",
+    "KernelTables",
+    "KernelTableUpdate",
+    "get_kernel_tables",
+    "settle_player",
+]
+
+BET_DTYPE = np.dtype(
+    [
+        ("type", np.int8),
+        ("number", np.int8),
+        ("amount", np.float64),
+        ("base", np.int8),
+        ("flags", np.uint8),
+        ("shape", np.int32),
+    ]
+)
+"""One row per bet: type code, number (or packed Hop result), amount, base type
+code (for Odds), flags and the index of the bet's shape in the lookup tables."""
+
+FLAG_FALLBACK = 2
+"""Flag for bets that can't be resolved from the lookup tables."""
+
+_TABLE_TYPES = frozenset(
+    (
+        PassLine,
+        Come,
+        DontPass,
+        DontCome,
+        Odds,
+        Place,
+        Field,
+        CAndE,
+        Any7,
+        Two,
+        Three,
+        Yo,
+        Boxcars,
+        AnyCraps,
+        HardWay,
+        Hop,
+    )
+)
+"""Bet types resolved through the lookup tables. Stateful bets (Fire, All, Tall
+and Small) and bet types defined outside crapssim fall back to ``get_result``."""
+
+_NO_ACTION, _WIN, _LOSE, _PUSH = 0, 1, 2, 3
+
+KERNEL_MIN_BETS = 8
+"""Number of bets from which :py:func:`settle_player` uses the kernel. With
+fewer bets, the fixed cost of the array operations is more than settling the
+bets one by one."""
+
+POINT_INDEX: dict[int | None, int] = {None: 0, 4: 1, 5: 2, 6: 3, 8: 4, 9: 5, 10: 6}
+"""Index of the table point in the lookup tables, zero when the point is Off."""
+
+
+def outcome_index(result: typing.Iterable[int]) -> int:
+    """Index (0-35) of the dice result, e.g. 0 for (1, 1) and 35 for (6, 6)."""
+    d1, d2 = result
+    return (d1 - 1) * 6 + (d2 - 1)
+
+
+def _shape_key(bet: Bet) -> tuple[int, int, int, int]:
+    cls = type(bet)
+    code = BET_TYPE_CODES.get(cls, 0)
+    if cls not in _TABLE_TYPES:
+        return code, 0, 0, FLAG_FALLBACK
+
+    if cls is Hop:
+        number = hop_number(bet.result)
+    else:
+        number = getattr(bet, "number", None) or 0
+
+    if cls is Odds:
+        return (
+            code,
+            number,
+            BET_TYPE_CODES[bet.base_type],
+            FLAG_ALWAYS_WORKING if bet.always_working else 0,
+        )
+    return code, number, 0, 0
+
+
+def _bet_from_shape(key: tuple[int, int, int, int]) -> Bet:
+    """Representative bet (with an amount of one) for the given shape key."""
+    code, number, base, flags = key
+    return decode_bet((code, number, base, flags & FLAG_ALWAYS_WORKING, 0, 1.0))
+
+
+_SHAPES: dict[tuple[int, int, int, int], int] = {}
+_SHAPE_KEYS: list[tuple[int, int, int, int]] = []
+
+
+def _shape_id(key: tuple[int, int, int, int]) -> int:
+    try:
+        return _SHAPES[key]
+    except KeyError:
+        _SHAPES[key] = len(_SHAPE_KEYS)
+        _SHAPE_KEYS.append(key)
+        return _SHAPES[key]
+
+
+class _ScratchTable:
+    """Minimal table used to ask a bet for its result on a given point and roll."""
+
+    def __init__(self, settings: TableSettings) -> None:
+        self.dice = Dice()
+        self.point = Point()
+        self.settings = settings
+        self.new_shooter = False
+        self.last_roll = None
+
+
+class KernelTables:
+    """
+    Lookup tables of outcome kind and payout ratio for every known bet shape.
+
+    The tables are indexed by ``[shape, point index, outcome index]``. The
+    tables are specific to one set of table settings and grow as new shapes
+    are encountered.
+    """
+
+    def __init__(self, settings: TableSettings) -> None:
+        self.settings: TableSettings = {k: dict(v) for k, v in settings.items()}
+        self.kind: np.ndarray = np.zeros((0, 7, 36), dtype=np.int8)
+        self.ratio: np.ndarray = np.zeros((0, 7, 36), dtype=np.float64)
+        self.sign: np.ndarray = np.zeros((0, 7, 36), dtype=np.float64)
+        """1 for wins and pushes, -1 for losses and 0 when nothing happens."""
+        self.coefficients: np.ndarray = np.zeros((7, 36, 0, 3), dtype=np.float64)
+        """Ratio, sign and whether the bet is removed, indexed by ``[point index,
+        outcome index, shape]``, so the values for one roll are contiguous."""
+
+    def ensure(self, n_shapes: int) -> None:
+        """Build the table rows for any shapes that don't have one yet."""
+        n_built = self.kind.shape[0]
+        if n_shapes <= n_built:
+            return
+
+        kind = np.zeros((n_shapes, 7, 36), dtype=np.int8)
+        ratio = np.zeros((n_shapes, 7, 36), dtype=np.float64)
+        kind[:n_built] = self.kind
+        ratio[:n_built] = self.ratio
+
+        table = _ScratchTable(self.settings)
+        for shape in range(n_built, n_shapes):
+            key = _SHAPE_KEYS[shape]
+            if key[3] & FLAG_FALLBACK:
+                continue
+            bet = _bet_from_shape(key)
+            for point_number, point_idx in POINT_INDEX.items():
+                table.point.number = point_number
+                for d1 in range(1, 7):
+                    for d2 in range(1, 7):
+                        table.dice.result = (d1, d2)
+                        outcome = outcome_index((d1, d2))
+                        result = bet.get_result(table)
+                        if result.won:
+                            kind[shape, point_idx, outcome] = _WIN
+                            ratio[shape, point_idx, outcome] = _payout_ratio(
+                                bet, table
+                            )
+                        elif result.lost:
+                            kind[shape, point_idx, outcome] = _LOSE
+                        elif result.remove:
+                            kind[shape, point_idx, outcome] = _PUSH
+
+        self.kind = kind
+        self.ratio = ratio
+        self.sign = np.select([kind == _LOSE, kind != _NO_ACTION], [-1.0, 1.0], 0.0)
+        coefficients = np.stack([ratio, self.sign, kind != _NO_ACTION], axis=-1)
+        self.coefficients = np.ascontiguousarray(coefficients.transpose(1, 2, 0, 3))
+
+
+_TABLES_CACHE: list[KernelTables] = []
+
+
+def get_kernel_tables(settings: TableSettings) -> KernelTables:
+    """Return the (shared) lookup tables for the given table settings."""
+    for tables in _TABLES_CACHE:
+        if tables.settings == settings:
+            return tables
+    tables = KernelTables(settings)
+    _TABLES_CACHE.append(tables)
+    return tables
+
+
+def _encode(bet: Bet) -> tuple:
+    key = _shape_key(bet)
+    return key[0], key[1], bet.amount, key[2], key[3], _shape_id(key)
+
+
+class BetKernel:
+    """
+    Structured array of bets, one row per bet, along with the original bets.
+
+    The kernel can be kept up to date as bets are added and removed, so each
+    bet is only encoded once: :py:func:`settle_player` keeps one kernel per
+    player, which the player's list of bets updates whenever it changes.
+
+    Args:
+        bets: The bets to encode, in the order they should be settled.
+    """
+
+    def __init__(self, bets: typing.Sequence[Bet]) -> None:
+        self.bets: list[Bet] = list(bets)
+        self._rows: list[tuple] = [_encode(bet) for bet in self.bets]
+        self._array: np.ndarray | None = None
+        self._fallback: np.ndarray | None = None
+        self._shape: np.ndarray | None = None
+        self._amount: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.bets)
+
+    @property
+    def rows(self) -> np.ndarray:
+        """One row per bet, see :data:`BET_DTYPE`."""
+        if self._array is None:
+            self._array = np.array(self._rows, dtype=BET_DTYPE)
+            self._fallback = np.flatnonzero(self._array["flags"] & FLAG_FALLBACK)
+            self._shape = np.ascontiguousarray(self._array["shape"])
+            self._amount = np.ascontiguousarray(self._array["amount"])
+        return self._array
+
+    @property
+    def fallback(self) -> np.ndarray:
+        """Positions of the rows that need to be resolved with ``get_result``."""
+        self.rows
+        return self._fallback
+
+    def insert(self, index: int, bet: Bet) -> None:
+        """Add a bet at the given position, e.g. ``len(kernel)`` to append it."""
+        self.bets.insert(index, bet)
+        self._rows.insert(index, _encode(bet))
+        self._array = None
+
+    def pop(self, index: int) -> Bet:
+        """Remove the bet at the given position."""
+        del self._rows[index]
+        self._array = None
+        return self.bets.pop(index)
+
+    def refresh(self, index: int) -> None:
+        """Encode the bet at the given position again, after its number changed."""
+        self._rows[index] = _encode(self.bets[index])
+        self._array = None
+
+    def clear(self) -> None:
+        """Remove all bets."""
+        self.bets.clear()
+        self._rows.clear()
+        self._array = None
+
+    def resolve(self, table: typing.Any) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Settle all bets against the table's current roll.
+
+        Args:
+            table: The table, after the dice have been rolled and before the
+                point is updated.
+
+        Returns:
+            The result amounts (same as ``BetResult.amount``) and whether
+            each bet should be removed from the table.
+        """
+        tables = get_kernel_tables(table.settings)
+        tables.ensure(len(_SHAPE_KEYS))
+
+        self.rows
+        amount = self._amount
+        coefficients = tables.coefficients[
+            POINT_INDEX[table.point.number], table.dice.outcome
+        ].take(self._shape, axis=0)
+
+        # ratio * amount + amount for wins, -amount for losses and amount for
+        # pushes, with the same floating point operations as get_result
+        result = coefficients[:, 0] * amount
+        result += coefficients[:, 1] * amount
+        remove = coefficients[:, 2] != 0.0
+
+        for i in self.fallback:
+            bet_result = self.bets[i].get_result(table)
+            result[i] = bet_result.amount
+            remove[i] = bet_result.remove
+
+        return result, remove
+
+
+def settle_player(player: typing.Any, verbose: bool = False) -> None:
+    """
+    Settle all of the player's bets against the current roll using the kernel.
+
+    This is equivalent to :py:meth:`crapssim.table.Player.update_bet`.
+    """
+    if type(player.bankroll) is Cents:
+        # the kernel settles in floats, so exact money is settled bet by bet
+        player.update_bet(verbose)
+        return
+    bets = player.bets
+    kernel = bets.kernel
+    if kernel is None:
+        if len(bets) < KERNEL_MIN_BETS:
+            player.update_bet(verbose)
+            return
+        # kept up to date by the list of bets from now on
+        kernel = bets.kernel = BetKernel(bets)
+    if len(kernel) == 0:
+        return
+    result, remove = kernel.resolve(player.table)
+
+    # add in bet order so the bankroll matches Player.update_bet exactly
+    bankroll = player.bankroll
+    for amount in result.tolist():
+        if amount > 0:
+            bankroll += amount
+    player.bankroll = bankroll
+
+    if verbose:
+        for bet, amount, should_remove in zip(
+            kernel.bets, result.tolist(), remove.tolist()
+        ):
+            player.print_bet_update(bet, BetResult(amount, should_remove, bet.amount))
+
+    if remove.any():
+        # from the end, so the positions of the other bets don't change
+        for i in np.flatnonzero(remove)[::-1].tolist():
+            bets.pop(i)
+
+
+class KernelTableUpdate(TableUpdate):
+    """TableUpdate that settles each player's bets with the kernel."""
+
+    @staticmethod
+    def update_bets(table: "typing.Any", verbose=False):
+        for player in table.players:
+            settle_player(player, verbose=verbose)
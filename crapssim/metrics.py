@@ -0,0 +1,100 @@
+"""
+Risk metrics are kept for every player and updated after each roll, so
+drawdown, peak bankroll, time to bust and the largest amount at risk are known
+at the end of a run without storing the bankroll path. The metrics for each
+player are returned by :py:meth:`~crapssim.table.Table.run` and are available
+as ``player.metrics``.
+"""
+
+from crapssim.money import as_amount
+
+__all__ = ["RiskMetrics"]
+
+
+class RiskMetrics:
+    """
+    Running risk metrics for one player.
+
+    The metrics track the player's total cash (bankroll plus the amount of
+    their bets on the table) so that placing a bet isn't counted as a loss.
+
+    Args:
+        start: Starting cash for the player. The metrics are in
+            :class:`~crapssim.money.Cents` if it is.
+        ruin_level: The player counts as busted once their cash is at or
+            below this level. Defaults to zero.
+    """
+
+    money_fields: tuple[str, ...] = (
+        "start",
+        "final",
+        "peak",
+        "low",
+        "max_drawdown",
+        "max_at_risk",
+    )
+    """Keys of :py:meth:`as_dict` that are amounts of money."""
+
+    def __init__(self, start: float, ruin_level: float = 0.0) -> None:
+        self.start: float = as_amount(start)
+        """Cash when the metrics started."""
+        self.ruin_level: float = ruin_level
+        """Cash at or below which the player counts as busted."""
+        self.final: float = self.start
+        """Cash after the most recent roll."""
+        self.peak: float = self.start
+        """Highest cash so far."""
+        self.low: float = self.start
+        """Lowest cash so far."""
+        self.max_drawdown: float = as_amount(0, like=self.start)
+        """Largest drop in cash from a previous peak."""
+        self.max_at_risk: float = as_amount(0, like=self.start)
+        """Largest total amount of bets on the table for a roll."""
+        self.busted_at: int | None = None
+        """Roll number when the player first busted, None if they haven't."""
+        self.n_rolls: int = 0
+        """Number of rolls recorded."""
+
+    def update_at_risk(self, amount: float) -> None:
+        """Record the total amount of bets on the table before a roll."""
+        if amount > self.max_at_risk:
+            self.max_at_risk = amount
+
+    def update(self, roll: int, cash: float) -> None:
+        """Record the player's cash after the given roll."""
+        self.n_rolls += 1
+        self.final = cash
+        if cash > self.peak:
+            self.peak = cash
+        elif cash < self.low:
+            self.low = cash
+        if self.peak - cash > self.max_drawdown:
+            self.max_drawdown = self.peak - cash
+        if self.busted_at is None and cash <= self.ruin_level:
+            self.busted_at = roll
+
+    def update_unchanged(self, n_rolls: int = 1) -> None:
+        """Record rolls after which the player's cash didn't change."""
+        self.n_rolls += n_rolls
+
+    @property
+    def busted(self) -> bool:
+        """True if the player has busted at any point."""
+        return self.busted_at is not None
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        """The metrics as a dictionary, e.g. for building a data frame."""
+        return {
+            "start": self.start,
+            "final": self.final,
+            "peak": self.peak,
+            "low": self.low,
+            "max_drawdown": self.max_drawdown,
+            "max_at_risk": self.max_at_risk,
+            "busted_at": self.busted_at,
+            "n_rolls": self.n_rolls,
+        }
+
+    def __repr__(self) -> str:
+        items = ", ".join(f"{k}={v}" for k, v in self.as_dict().items())
+        return f"{self.__class__.__name__}({items})"
@@ -0,0 +1,127 @@
+"""
+Exact money amounts in whole cents.
+
+Bankrolls and bet amounts are floats by default. Passing :class:`Cents`
+instead (e.g. ``table.add_player(Cents(100_00), BetPassLine(Cents(5_00)))``)
+switches a player to integer money: bets keep their amounts in cents, payouts
+are rounded down to the cent like a casino keeps the breakage, and the
+bankroll stays an exact integer that can be compared with ``==`` and used as a
+key for memoizing states. Bets and bankrolls of one player should all use the
+same kind of money.
+
+Batch engines accept cents too, see :py:meth:`crapssim.env.BatchState.initial`,
+which then keep their amounts in int64 arrays.
+"""
+
+import functools
+import math
+import numbers
+import typing
+
+if typing.TYPE_CHECKING:
+    import fractions
+
+__all__ = ["Cents", "as_amount", "exact_ratio"]
+
+
+@functools.cache
+def exact_ratio(ratio: float) -> "fractions.Fraction":
+    """
+    Payout ratio as an exact fraction, e.g. 7/6 for the float ``7 / 6``.
+    Ratios are table odds, so their denominators are small.
+    """
+    # imported here to keep `import crapssim` fast
+    import fractions
+
+    if isinstance(ratio, float):
+        return fractions.Fraction(ratio).limit_denominator(1_000)
+    return fractions.Fraction(ratio)
+
+
+class Cents(int):
+    """
+    An amount of money as a whole number of cents, e.g. ``Cents(5_00)`` for
+    $5.
+
+    Adding, subtracting or multiplying by an int gives Cents. Multiplying by
+    a payout ratio (a float or Fraction) rounds down to the cent, so the
+    player never gets a fraction of a cent.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, value: typing.SupportsInt = 0) -> "Cents":
+        if not isinstance(value, int) and value != int(value):
+            raise ValueError(f"{value} isn't a whole number of cents")
+        return super().__new__(cls, int(value))
+
+    @classmethod
+    def from_dollars(cls, dollars: typing.SupportsFloat | str) -> "Cents":
+        """
+        Cents for an amount in dollars, e.g. ``Cents.from_dollars("5.25")``.
+
+        Raises:
+            ValueError: If the amount isn't a whole number of cents.
+        """
+        import decimal
+
+        cents = decimal.Decimal(str(dollars)) * 100
+        if cents != cents.to_integral_value():
+            raise ValueError(f"{dollars} isn't a whole number of cents")
+        return cls(int(cents))
+
+    @property
+    def dollars(self) -> float:
+        """The amount in dollars."""
+        return int(self) / 100
+
+    def __add__(self, other: typing.Any) -> typing.Any:
+        if isinstance(other, int):
+            return Cents(int(self) + int(other))
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other: typing.Any) -> typing.Any:
+        if isinstance(other, int):
+            return Cents(int(self) - int(other))
+        return NotImplemented
+
+    def __rsub__(self, other: typing.Any) -> typing.Any:
+        if isinstance(other, int):
+            return Cents(int(other) - int(self))
+        return NotImplemented
+
+    def __mul__(self, other: typing.Any) -> typing.Any:
+        if isinstance(other, int):
+            return Cents(int(self) * int(other))
+        if isinstance(other, (float, numbers.Rational)):
+            return Cents(math.floor(int(self) * exact_ratio(other)))
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "Cents":
+        return Cents(-int(self))
+
+    def __abs__(self) -> "Cents":
+        return Cents(abs(int(self)))
+
+    def __repr__(self) -> str:
+        return f"Cents({int(self)})"
+
+
+def as_amount(value: typing.SupportsFloat, like: typing.Any = None) -> float | Cents:
+    """
+    A money amount: Cents stay Cents and other numbers become floats, or
+    Cents if ``like`` is in Cents.
+
+    Args:
+        value: The amount.
+        like: An amount whose kind of money the result should have.
+    """
+    if type(value) is Cents:
+        return value
+    if type(like) is Cents:
+        return Cents(value)
+    return float(value)
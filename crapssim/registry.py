@@ -0,0 +1,247 @@
+"""
+Stable integer codes for bet types, and a compact encoding of bets.
+
+Bets are identified by their Python classes, which can't be stored in NumPy
+arrays or files or sent to other processes cheaply. The registry gives every
+bet type a small integer code that never changes between versions, and
+:func:`encode_bets` packs bets into records of :data:`BET_RECORD_DTYPE`: the
+type code, the number (or the packed result of a Hop bet), the base type code
+of an Odds bet, flags, the state of a Fire or All/Tall/Small bet, and the
+amount. :func:`decode_bets` turns the records back into equal bets::
+
+    records = encode_bets([PassLine(5), Odds(PassLine, 6, 10)])
+    data = records.tobytes()
+    bets = decode_bets(np.frombuffer(data, dtype=BET_RECORD_DTYPE))
+
+Bet classes defined outside crapssim can be given a code with
+:func:`register_bet_type`, their records hold the amount only.
+"""
+
+import typing
+
+import numpy as np
+
+from crapssim.bet import (
+    All,
+    Any7,
+    AnyCraps,
+    Bet,
+    Boxcars,
+    CAndE,
+    Come,
+    DontCome,
+    DontPass,
+    Field,
+    Fire,
+    HardWay,
+    Hop,
+    Odds,
+    PassLine,
+    Place,
+    Small,
+    Tall,
+    Three,
+    Two,
+    Yo,
+    _ATSBet,
+)
+from crapssim.money import Cents
+
+__all__ = [
+    "BET_RECORD_DTYPE",
+    "BET_TYPE_CODES",
+    "FLAG_ALWAYS_WORKING",
+    "FLAG_CENTS",
+    "FLAG_ENDED",
+    "bet_type",
+    "bet_type_code",
+    "register_bet_type",
+    "hop_number",
+    "encode_bet",
+    "decode_bet",
+    "encode_bets",
+    "decode_bets",
+]
+
+BET_RECORD_DTYPE = np.dtype(
+    [
+        ("type", np.int8),
+        ("number", np.int8),
+        ("base", np.int8),
+        ("flags", np.uint8),
+        ("state", np.uint16),
+        ("amount", np.float64),
+    ]
+)
+"""One record per bet: type code, number (or packed Hop result), base type code
+(for Odds), flags, state (the bitmask of a Fire or All/Tall/Small bet) and
+amount (in cents if the ``FLAG_CENTS`` flag is set)."""
+
+BET_TYPE_CODES: dict[type, int] = {
+    PassLine: 1,
+    Come: 2,
+    DontPass: 3,
+    DontCome: 4,
+    Odds: 5,
+    Place: 6,
+    Field: 7,
+    CAndE: 8,
+    Any7: 9,
+    Two: 10,
+    Three: 11,
+    Yo: 12,
+    Boxcars: 13,
+    AnyCraps: 14,
+    HardWay: 15,
+    Hop: 16,
+    Fire: 17,
+    All: 18,
+    Tall: 19,
+    Small: 20,
+}
+"""Type code of each bet type. Codes are never reused or changed, zero is used
+for unknown bets."""
+
+_CODE_TYPES: dict[int, type] = {code: cls for cls, code in BET_TYPE_CODES.items()}
+
+_MAX_CODE = np.iinfo(np.int8).max
+
+FLAG_ALWAYS_WORKING = 1
+"""Flag for Odds bets that are working when the point is Off."""
+FLAG_CENTS = 4
+"""Flag for bets with an amount in :class:`~crapssim.money.Cents`."""
+FLAG_ENDED = 8
+"""Flag for Fire bets that have ended."""
+
+
+def register_bet_type(cls: type, code: int | None = None) -> int:
+    """
+    Give a bet class defined outside crapssim a type code.
+
+    Args:
+        cls: The bet class. It must be constructed with the amount only.
+        code: The code, the first unused code if None. Give the code
+            explicitly if the encoding is stored, so it doesn't depend on
+            the order classes are registered in.
+
+    Returns:
+        The code of the class.
+
+    Raises:
+        ValueError: If the class or the code is already registered, or the
+            code is out of range.
+    """
+    if cls in BET_TYPE_CODES:
+        if code is None or BET_TYPE_CODES[cls] == code:
+            return BET_TYPE_CODES[cls]
+        raise ValueError(f"{cls.__name__} already has code {BET_TYPE_CODES[cls]}")
+    if code is None:
+        code = next(c for c in range(1, _MAX_CODE + 2) if c not in _CODE_TYPES)
+    if not 0 < code <= _MAX_CODE:
+        raise ValueError(f"bet type code must be between 1 and {_MAX_CODE}, not {code}")
+    if code in _CODE_TYPES:
+        raise ValueError(f"code {code} is already used by {_CODE_TYPES[code].__name__}")
+    BET_TYPE_CODES[cls] = code
+    _CODE_TYPES[code] = cls
+    return code
+
+
+def bet_type_code(cls: type) -> int:
+    """Type code of the bet class, zero if it isn't registered."""
+    return BET_TYPE_CODES.get(cls, 0)
+
+
+def bet_type(code: int) -> type:
+    """
+    Bet class with the given type code.
+
+    Raises:
+        KeyError: If no class has the code.
+    """
+    return _CODE_TYPES[code]
+
+
+def hop_number(result: typing.Sequence[int]) -> int:
+    """Packed result of a Hop bet, e.g. 23 for (2, 3)."""
+    return result[0] * 10 + result[1]
+
+
+def encode_bet(bet: Bet) -> tuple[int, int, int, int, int, float]:
+    """
+    Record of a bet, as a tuple of the fields of :data:`BET_RECORD_DTYPE`.
+
+    Raises:
+        KeyError: If the bet's class isn't registered.
+    """
+    cls = type(bet)
+    code = BET_TYPE_CODES[cls]
+    number = base = flags = state = 0
+    if cls is Hop:
+        number = hop_number(bet.result)
+    elif cls is Odds:
+        number = bet.number
+        base = BET_TYPE_CODES[bet.base_type]
+        if bet.always_working:
+            flags = FLAG_ALWAYS_WORKING
+    elif cls is Fire:
+        state = bet.points_mask
+        if bet.ended:
+            flags = FLAG_ENDED
+    elif isinstance(bet, _ATSBet):
+        state = bet.rolled_mask
+    else:
+        number = getattr(bet, "number", None) or 0
+    amount = bet.amount
+    if type(amount) is Cents:
+        flags |= FLAG_CENTS
+    return code, number, base, flags, state, amount
+
+
+def decode_bet(record: typing.Sequence) -> Bet:
+    """
+    Bet for a record, as returned by :func:`encode_bet` or a row of an array
+    of :data:`BET_RECORD_DTYPE`.
+
+    Raises:
+        KeyError: If the record's type code isn't registered.
+    """
+    code, number, base, flags, state = (int(x) for x in record[:5])
+    amount = record[5]
+    cls = _CODE_TYPES[code]
+    amount = Cents(amount) if flags & FLAG_CENTS else float(amount)
+
+    if cls is Odds:
+        return Odds(_CODE_TYPES[base], number, amount, bool(flags & FLAG_ALWAYS_WORKING))
+    if cls in (Come, DontCome):
+        return cls(amount, number or None)
+    if cls in (Place, HardWay):
+        return cls(number, amount)
+    if cls is Hop:
+        return Hop((number // 10, number % 10), amount)
+    bet = cls(amount)
+    if cls is Fire:
+        bet.points_mask = state
+        bet.ended = bool(flags & FLAG_ENDED)
+    elif isinstance(bet, _ATSBet):
+        bet.rolled_mask = state
+    return bet
+
+
+def encode_bets(bets: typing.Iterable[Bet]) -> np.ndarray:
+    """
+    Array of records of :data:`BET_RECORD_DTYPE`, one per bet.
+
+    Raises:
+        KeyError: If a bet's class isn't registered.
+    """
+    return np.array([encode_bet(bet) for bet in bets], dtype=BET_RECORD_DTYPE)
+
+
+def decode_bets(records: np.ndarray) -> list[Bet]:
+    """
+    Bets for an array of records of :data:`BET_RECORD_DTYPE`.
+
+    Raises:
+        KeyError: If a record's type code isn't registered.
+    """
+    return [decode_bet(record) for record in records.tolist()]
@@ -0,0 +1,170 @@
+"""
+Helpers for running many sessions of the same strategies, e.g. to compare
+final bankrolls and risk metrics across a set of strategies.
+"""
+
+import typing
+import warnings
+
+from crapssim.cache import cache_key
+from crapssim.dice import StreamDice, WeightedDice
+from crapssim.metrics import RiskMetrics
+from crapssim.money import Cents, as_amount
+from crapssim.strategy import Strategy
+from crapssim.table import Table
+
+if typing.TYPE_CHECKING:
+    from crapssim.cache import ResultCache
+    from crapssim.hands import HandLibrary
+
+__all__ = ["run_sessions"]
+
+
+def run_sessions(
+    strategies: dict[str, "Strategy | dict[str, typing.Any]"],
+    n_sim: int,
+    bankroll: typing.SupportsFloat = 100,
+    max_rolls: float | int = float("inf"),
+    max_shooter: float | int = float("inf"),
+    runout: bool = False,
+    seed: int | None = None,
+    first_session: int = 0,
+    cache: "ResultCache | None" = None,
+    skip_quiet_rolls: bool = False,
+    hand_library: "HandLibrary | None" = None,
+    stream_dice: bool = False,
+    dice_probabilities: typing.Sequence[float] | None = None,
+    ruin_level: typing.SupportsFloat = 0,
+) -> list[dict[str, typing.Any]]:
+    """
+    Run ``n_sim`` sessions with one player per strategy at the table.
+
+    Args:
+        strategies: Strategies by player name, either Strategy objects or
+            declarative specs (see :py:mod:`crapssim.strategy.spec`).
+        n_sim: Number of sessions to run.
+        bankroll: Starting bankroll for every player.
+        max_rolls: Maximum number of rolls per session.
+        max_shooter: Maximum number of shooters per session. At least one of
+            max_rolls and max_shooter must be finite, so every session ends.
+        runout: If True, continue past max_rolls until players have no bets.
+        seed: If given, session ``i`` uses the seed ``[seed, i]`` so that
+            results are reproducible and sessions are independent.
+        first_session: Number of the first session, so that a large run can
+            be split into chunks that give the same results as one call.
+        cache: If given, results are looked up in (and saved to) the cache,
+            see :py:mod:`crapssim.cache`. Only seeded runs of strategies with
+            a stable identity are cached.
+        skip_quiet_rolls: If True, jump over rolls where nothing happens,
+            see :py:mod:`crapssim.skip`. Not possible with ``hand_library``
+            or ``stream_dice``.
+        hand_library: If given, sessions are assembled from shooter hands
+            drawn (with replacement) from the library instead of rolling
+            random dice, see :py:mod:`crapssim.hands`. Such runs aren't
+            cached.
+        stream_dice: If True, session ``i`` rolls
+            :class:`~crapssim.dice.StreamDice` for ``(seed, i)``, so any
+            roll of any session can be regenerated on its own. Needs a seed.
+        dice_probabilities: If given, sessions roll
+            :class:`~crapssim.dice.WeightedDice` with this probability for
+            each of the 36 outcomes instead of fair dice.
+        ruin_level: Players count as busted in their metrics once their cash
+            is at or below this level.
+
+    Returns:
+        One record per session and player with the session number, player
+        name, final bankroll, number of rolls and the player's risk metrics
+        (see :class:`~crapssim.metrics.RiskMetrics`).
+    """
+    if max_rolls == float("inf") and max_shooter == float("inf"):
+        raise ValueError("Give a finite max_rolls or max_shooter")
+    if skip_quiet_rolls and (hand_library is not None or stream_dice):
+        raise ValueError("Can't skip quiet rolls with stream dice or a hand library")
+    if stream_dice and (seed is None or hand_library is not None):
+        raise ValueError("Stream dice need a seed and can't play hands from a library")
+    if dice_probabilities is not None and (stream_dice or hand_library is not None):
+        raise ValueError("Weighted dice can't be combined with stream dice or a hand library")
+
+    key = None
+    if cache is not None and seed is not None and hand_library is None:
+        try:
+            key = cache_key(
+                strategies,
+                Table().settings,
+                bankroll=float(bankroll),
+                money=type(as_amount(bankroll)).__name__,
+                n_sim=n_sim,
+                max_rolls=max_rolls,
+                max_shooter=max_shooter,
+                runout=runout,
+                seed=seed,
+                first_session=first_session,
+                skip_quiet_rolls=skip_quiet_rolls,
+                stream_dice=stream_dice,
+                dice_probabilities=None
+                if dice_probabilities is None
+                else [float(p) for p in dice_probabilities],
+                ruin_level=float(ruin_level),
+            )
+        except ValueError as e:
+            warnings.warn(f"Not caching results: {e}")
+        else:
+            records = cache.get(key)
+            if records is not None:
+                if type(bankroll) is Cents:
+                    # cached as JSON, where cents are plain ints
+                    for record in records:
+                        for field in ("bankroll", *RiskMetrics.money_fields):
+                            record[field] = Cents(record[field])
+                return records
+
+    compiled = {
+        name: _compile(strategy) if isinstance(strategy, dict) else strategy
+        for name, strategy in strategies.items()
+    }
+    records = []
+    for i in range(first_session, first_session + n_sim):
+        session_seed = None if seed is None else [seed, i]
+        if stream_dice:
+            table = Table(dice=StreamDice(seed, i))
+        elif dice_probabilities is not None:
+            table = Table(dice=WeightedDice(dice_probabilities, seed=session_seed))
+        elif hand_library is None:
+            table = Table(seed=session_seed)
+        else:
+            from crapssim.hands import HandLibraryDice
+
+            table = Table(dice=HandLibraryDice(hand_library, seed=session_seed))
+        for name, strategy in compiled.items():
+            table.add_player(
+                bankroll, strategy=strategy, name=name, ruin_level=ruin_level
+            )
+
+        metrics = table.run(
+            max_rolls=max_rolls,
+            max_shooter=max_shooter,
+            verbose=False,
+            runout=runout,
+            skip_quiet_rolls=skip_quiet_rolls,
+        )
+
+        for player in table.players:
+            records.append(
+                {
+                    "session": i,
+                    "name": player.name,
+                    "bankroll": player.bankroll,
+                    "rolls": table.dice.n_rolls,
+                    **metrics[player.name].as_dict(),
+                }
+            )
+
+    if key is not None:
+        cache.put(key, records)
+    return records
+
+
+def _compile(spec: dict[str, typing.Any]) -> Strategy:
+    from crapssim.strategy.spec import compile_strategy
+
+    return compile_strategy(spec)
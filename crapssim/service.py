@@ -0,0 +1,518 @@
+"""
+A local simulation service, so that long simulation jobs can run in a process
+pool without blocking the caller (e.g. a notebook kernel).
+
+The service is an asyncio HTTP server on localhost (or a Unix socket) with two
+endpoints:
+
+- ``GET /health`` returns ``{"status": "ok"}``.
+- ``POST /jobs`` takes a JSON job spec and streams newline-delimited JSON
+  (NDJSON): one ``"progress"`` message with the aggregated results so far
+  each time a chunk of sessions finishes, then a final ``"done"`` message.
+
+A job spec looks like::
+
+    {
+        "strategies": {"pass": {"name": "BetPassLine", "args": [5]}},
+        "bankroll": 100,
+        "n_sessions": 1000,
+        "max_rolls": 144,
+        "max_shooter": null,
+        "runout": false,
+        "seed": 42,
+        "chunk_size": 100
+    }
+
+Strategies are given either as declarative specs (see
+:py:mod:`crapssim.strategy.spec`), or by the name of a strategy class in
+:py:mod:`crapssim.strategy` (including the examples) along with its JSON
+``args`` and ``kwargs``; a list of specs is added together into one strategy.
+Stopping rules that are ``null`` or missing are unlimited, but at least one
+of ``max_rolls`` and ``max_shooter`` must be given, so that every session ends,
+and a job can have at most ``MAX_SESSIONS`` sessions. Sessions are run with
+:py:func:`~crapssim.runner.run_sessions`, so a job with a seed gives the same
+results however it is chunked.
+
+Start a server with ``python -m crapssim.service --port 8765`` or with
+:py:class:`SimulationService` inside a running event loop, and read the
+results with :py:func:`stream_job`::
+
+    async for message in stream_job(job, port=8765):
+        print(message["sessions"], message["results"]["pass"]["mean_bankroll"])
+"""
+
+import asyncio
+import concurrent.futures
+import dataclasses
+import json
+import math
+import multiprocessing
+import secrets
+import typing
+
+from crapssim.runner import run_sessions
+from crapssim.strategy import Strategy
+
+__all__ = [
+    "MAX_SESSIONS",
+    "JobSpec",
+    "parse_job",
+    "build_strategy",
+    "Aggregate",
+    "SimulationService",
+    "stream_job",
+    "main",
+]
+
+_MAX_BODY = 1 << 20
+
+MAX_SESSIONS = 10_000_000
+"""Maximum number of sessions in one job."""
+
+
+@dataclasses.dataclass(frozen=True)
+class JobSpec:
+    """A validated simulation job, see the module docs for the JSON format."""
+
+    strategies: dict[str, typing.Any]
+    """Strategy specs by player name."""
+    bankroll: float = 100
+    """Starting bankroll of every player."""
+    n_sessions: int = 100
+    """Number of sessions to run."""
+    max_rolls: float = float("inf")
+    """Maximum number of rolls per session."""
+    max_shooter: float = float("inf")
+    """Maximum number of shooters per session."""
+    runout: bool = False
+    """Continue past max_rolls until players have no bets."""
+    seed: int | None = None
+    """Seed for the sessions, a random seed is chosen if None."""
+    chunk_size: int = 100
+    """Number of sessions sent to a worker at a time."""
+
+
+def parse_job(data: dict[str, typing.Any]) -> JobSpec:
+    """
+    Validate a job spec from JSON.
+
+    Raises:
+        ValueError: If the spec is malformed, names an unknown strategy, has
+            no finite stopping rule or too many sessions.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("job spec must be a JSON object")
+    data = dict(data)
+
+    if "strategy" in data:
+        if "strategies" in data:
+            raise ValueError("give either 'strategy' or 'strategies', not both")
+        data["strategies"] = {"Player": data.pop("strategy")}
+    strategies = data.pop("strategies", None)
+    if not isinstance(strategies, dict) or not strategies:
+        raise ValueError("'strategies' must be a non-empty object")
+    for spec in strategies.values():
+        build_strategy(spec)
+
+    unknown = set(data) - {f.name for f in dataclasses.fields(JobSpec)}
+    if unknown:
+        raise ValueError(f"unknown job fields: {sorted(unknown)}")
+
+    for key in ("max_rolls", "max_shooter"):
+        if data.get(key, None) is None:
+            data.pop(key, None)
+    try:
+        job = JobSpec(strategies=strategies, **data)
+        job = dataclasses.replace(
+            job,
+            bankroll=float(job.bankroll),
+            n_sessions=int(job.n_sessions),
+            max_rolls=float(job.max_rolls),
+            max_shooter=float(job.max_shooter),
+            runout=bool(job.runout),
+            chunk_size=int(job.chunk_size),
+        )
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"invalid job spec: {e}") from e
+
+    if job.n_sessions < 1 or job.chunk_size < 1:
+        raise ValueError("'n_sessions' and 'chunk_size' must be positive")
+    if job.n_sessions > MAX_SESSIONS:
+        raise ValueError(f"'n_sessions' must be at most {MAX_SESSIONS}")
+    if math.isinf(job.max_rolls) and math.isinf(job.max_shooter):
+        raise ValueError("give a finite 'max_rolls' or 'max_shooter'")
+    if job.seed is not None and not isinstance(job.seed, int):
+        raise ValueError("'seed' must be an integer")
+    return job
+
+
+def _strategy_class(name: str) -> type[Strategy]:
+    import crapssim.strategy
+    import crapssim.strategy.examples
+
+    for module in (crapssim.strategy, crapssim.strategy.examples):
+        cls = getattr(module, name, None)
+        if isinstance(cls, type) and issubclass(cls, Strategy):
+            return cls
+    raise ValueError(f"unknown strategy {name!r}")
+
+
+def build_strategy(spec: dict[str, typing.Any] | list) -> Strategy:
+    """
+    Build a strategy from its JSON spec.
+
+    Args:
+        spec: A declarative spec with a ``type`` (see
+            :py:mod:`crapssim.strategy.spec`), ``{"name": ..., "args": [...],
+            "kwargs": {...}}`` for a strategy class in
+            :py:mod:`crapssim.strategy`, or a list of such specs, which are
+            added together.
+
+    Raises:
+        ValueError: If the spec is malformed or the strategy can't be built.
+    """
+    if isinstance(spec, list):
+        if not spec:
+            raise ValueError("strategy list must not be empty")
+        strategies = [build_strategy(x) for x in spec]
+        return sum(strategies[1:], strategies[0])
+
+    if isinstance(spec, dict) and "type" in spec:
+        from crapssim.strategy.spec import compile_strategy
+
+        try:
+            return compile_strategy(spec)
+        except (TypeError, KeyError) as e:
+            raise ValueError(f"invalid strategy spec: {e!r}") from e
+    if not isinstance(spec, dict) or not isinstance(spec.get("name"), str):
+        raise ValueError("strategy spec must be an object with a 'name'")
+    cls = _strategy_class(spec["name"])
+    try:
+        return cls(*spec.get("args", []), **spec.get("kwargs", {}))
+    except Exception as e:
+        raise ValueError(f"can't build strategy {spec['name']!r}: {e}") from e
+
+
+def _run_chunk(job: JobSpec, first_session: int, n_sessions: int) -> list[dict]:
+    """Run a chunk of the job's sessions, in a worker process."""
+    strategies = {name: build_strategy(x) for name, x in job.strategies.items()}
+    return run_sessions(
+        strategies,
+        n_sessions,
+        bankroll=job.bankroll,
+        max_rolls=job.max_rolls,
+        max_shooter=job.max_shooter,
+        runout=job.runout,
+        seed=job.seed,
+        first_session=first_session,
+    )
+
+
+class Aggregate:
+    """
+    Running summary of session records for one player name.
+
+    The mean and variance of the final bankroll are updated one record at a
+    time, so partial results can be reported while the job runs.
+    """
+
+    def __init__(self) -> None:
+        self.n: int = 0
+        self.mean_bankroll: float = 0.0
+        self._m2: float = 0.0
+        self.n_busted: int = 0
+        self.total_drawdown: float = 0.0
+        self.total_rolls: int = 0
+
+    def update(self, record: dict[str, typing.Any]) -> None:
+        """Add one session record from :py:func:`~crapssim.runner.run_sessions`."""
+        self.n += 1
+        delta = record["bankroll"] - self.mean_bankroll
+        self.mean_bankroll += delta / self.n
+        self._m2 += delta * (record["bankroll"] - self.mean_bankroll)
+        self.n_busted += record["busted_at"] is not None
+        self.total_drawdown += record["max_drawdown"]
+        self.total_rolls += record["rolls"]
+
+    @property
+    def std_bankroll(self) -> float:
+        """Sample standard deviation of the final bankroll."""
+        return math.sqrt(self._m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+    def as_dict(self) -> dict[str, float | int]:
+        """The summary as a JSON-friendly dictionary."""
+        n = max(self.n, 1)
+        return {
+            "sessions": self.n,
+            "mean_bankroll": self.mean_bankroll,
+            "std_bankroll": self.std_bankroll,
+            "stderr_bankroll": self.std_bankroll / math.sqrt(n),
+            "bust_rate": self.n_busted / n,
+            "mean_max_drawdown": self.total_drawdown / n,
+            "mean_rolls": self.total_rolls / n,
+        }
+
+
+class SimulationService:
+    """
+    Asyncio server that runs simulation jobs in a process pool.
+
+    Args:
+        host: Host to listen on, defaults to localhost.
+        port: Port to listen on, 0 picks a free port (see :py:attr:`port`).
+        path: If given, listen on this Unix socket instead of host/port.
+        executor: Executor to run sessions in. Defaults to a
+            ``ProcessPoolExecutor``, which is shut down on :py:meth:`close`.
+        max_workers: Number of worker processes for the default executor.
+        max_pending: Maximum number of chunks of a job that are submitted to
+            the executor at a time. The next chunk is submitted as soon as
+            one finishes.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str | None = None,
+        executor: concurrent.futures.Executor | None = None,
+        max_workers: int | None = None,
+        max_pending: int = 16,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.path = path
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._max_workers = max_workers
+        self.max_pending = max_pending
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> None:
+        """Start listening; the actual port is then available as ``port``."""
+        if self._executor is None:
+            # forked workers would inherit (and hold open) client connections
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                self._max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        if self.path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, self.path)
+        else:
+            self._server = await asyncio.start_server(
+                self._handle, self.host, self.port
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Start (if needed) and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop the server and shut down the default executor."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def __aenter__(self) -> "SimulationService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def run_job(self, job: JobSpec) -> typing.AsyncIterator[dict]:
+        """
+        Run a job, yielding a progress message after each chunk of sessions
+        and a final message once all sessions are done.
+        """
+        if job.seed is None:
+            job = dataclasses.replace(job, seed=secrets.randbits(63))
+
+        loop = asyncio.get_running_loop()
+        starts = iter(range(0, job.n_sessions, job.chunk_size))
+        pending: set[asyncio.Future] = set()
+
+        def submit() -> None:
+            # only a few chunks are queued at a time, however large the job
+            for start in starts:
+                size = min(job.chunk_size, job.n_sessions - start)
+                pending.add(
+                    loop.run_in_executor(self._executor, _run_chunk, job, start, size)
+                )
+                if len(pending) >= self.max_pending:
+                    return
+
+        aggregates = {name: Aggregate() for name in job.strategies}
+        done = 0
+        try:
+            submit()
+            while pending:
+                finished, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in finished:
+                    pending.remove(future)
+                    for record in future.result():
+                        aggregates[record["name"]].update(record)
+                    submit()
+                    done = next(iter(aggregates.values())).n
+                    yield {
+                        "type": "done" if done == job.n_sessions else "progress",
+                        "sessions": done,
+                        "n_sessions": job.n_sessions,
+                        "seed": job.seed,
+                        "results": {k: v.as_dict() for k, v in aggregates.items()},
+                    }
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            method, target, body = await _read_request(reader)
+            if method == "GET" and target == "/health":
+                await _write_response(writer, 200, [{"status": "ok"}])
+            elif method == "POST" and target == "/jobs":
+                try:
+                    job = parse_job(json.loads(body))
+                except ValueError as e:  # includes JSONDecodeError
+                    await _write_response(writer, 400, [_error(e)])
+                else:
+                    messages = _report_errors(self.run_job(job))
+                    await _write_response(writer, 200, messages)
+            else:
+                await _write_response(writer, 404, [_error("not found")])
+        except ValueError as e:
+            await _write_response(writer, 400, [_error(e)])
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def _error(message: object) -> dict[str, str]:
+    return {"type": "error", "message": str(message)}
+
+
+async def _report_errors(
+    messages: typing.AsyncIterator[dict],
+) -> typing.AsyncIterator[dict]:
+    # the response has already started, so errors are sent as a message
+    try:
+        async for message in messages:
+            yield message
+    except Exception as e:
+        yield _error(f"{type(e).__name__}: {e}")
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, bytes]:
+    request_line = (await reader.readline()).decode("latin-1").split()
+    if len(request_line) != 3:
+        raise ValueError("malformed request line")
+    method, target, _ = request_line
+
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    if length > _MAX_BODY:
+        raise ValueError("request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method, target, body
+
+
+async def _write_response(
+    writer: asyncio.StreamWriter,
+    status: int,
+    messages: typing.Iterable[dict] | typing.AsyncIterable[dict],
+) -> None:
+    reason = {200: "OK", 400: "Bad Request", 404: "Not Found"}[status]
+    writer.write(
+        f"HTTP/1.1 {status} {reason}\r\n"
+        "Content-Type: application/x-ndjson\r\n"
+        "Connection: close\r\n\r\n".encode("latin-1")
+    )
+    if isinstance(messages, typing.AsyncIterable):
+        async for message in messages:
+            writer.write(json.dumps(message).encode() + b"\n")
+            await writer.drain()
+    else:
+        for message in messages:
+            writer.write(json.dumps(message).encode() + b"\n")
+    await writer.drain()
+
+
+async def stream_job(
+    job: dict[str, typing.Any],
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    path: str | None = None,
+) -> typing.AsyncIterator[dict]:
+    """
+    Submit a job to a running :py:class:`SimulationService` and yield the
+    messages it streams back.
+
+    Raises:
+        ValueError: If the service rejects the job.
+    """
+    if path is not None:
+        reader, writer = await asyncio.open_unix_connection(path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    try:
+        body = json.dumps(job).encode()
+        writer.write(
+            f"POST /jobs HTTP/1.1\r\nHost: {host}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1")
+            + body
+        )
+        await writer.drain()
+
+        status = int((await reader.readline()).split()[1])
+        while await reader.readline() not in (b"\r\n", b"\n", b""):
+            pass
+        async for line in reader:
+            message = json.loads(line)
+            if status != 200 or message.get("type") == "error":
+                raise ValueError(message.get("message", f"HTTP {status}"))
+            yield message
+    finally:
+        writer.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the service from the command line until interrupted."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the crapssim simulation service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix-socket", default=None, help="listen on a Unix socket")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    async def serve() -> None:
+        service = SimulationService(
+            args.host, args.port, path=args.unix_socket, max_workers=args.workers
+        )
+        async with service:
+            print(f"Serving on {args.unix_socket or f'{args.host}:{service.port}'}")
+            await service.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+Skipping of rolls where nothing happens. With a point On, most rolls don't
+resolve or move any bets, and for many strategies (e.g. a Pass Line bet with
+odds, or a Don't Pass bet) the player doesn't change their bets either. The
+table is then in the same state after the roll as before it.
+
+:py:class:`SkipTableUpdate` recognizes these stretches: when no player's
+strategy changed anything before the roll, and the strategies only depend on
+the bets, bankroll, point and new shooter status (see
+:py:attr:`~crapssim.strategy.tools.Strategy.update_is_pure`), the number of
+quiet rolls before the next roll where something happens is geometric. It is
+drawn in one go, along with that next roll from the outcomes where something
+happens, and the roll count, shooter count and risk metrics are advanced as
+if each quiet roll was played. Results are statistically identical to
+rolling every roll, but use the random numbers differently, so they aren't
+identical for a given seed. The stretches follow the distribution of
+weighted dice (see :class:`~crapssim.dice.WeightedDice`) too.
+
+Use it with ``Table.run(..., skip_quiet_rolls=True)``. Skipping draws the
+rolls itself, so it only works with random dice (:class:`~crapssim.dice.Dice`
+and :class:`~crapssim.dice.WeightedDice`), not with dice that replay or
+address their rolls.
+"""
+
+import bisect
+import itertools
+import math
+import typing
+
+import numpy as np
+
+from crapssim.dice import Dice, WeightedDice
+from crapssim.kernel import (
+    _NO_ACTION,
+    FLAG_FALLBACK,
+    POINT_INDEX,
+    _shape_id,
+    _shape_key,
+    get_kernel_tables,
+)
+from crapssim.table import TableUpdate
+
+if typing.TYPE_CHECKING:
+    from crapssim.table import Table
+
+__all__ = ["SkipTableUpdate", "quiet_outcomes", "check_skippable_dice"]
+
+_OUTCOMES = [(d1, d2) for d1 in range(1, 7) for d2 in range(1, 7)]
+_TOTALS = np.array([d1 + d2 for d1, d2 in _OUTCOMES])
+_POINT_NUMBERS = (4, 5, 6, 8, 9, 10)
+
+
+class _Stretch(typing.NamedTuple):
+    """Quiet outcomes of a table state, and what's needed to sample a stretch of them."""
+
+    quiet: np.ndarray
+    log_quiet: float
+    quiet_outcomes: list[tuple[int, int]]
+    active_outcomes: list[tuple[int, int]]
+    quiet_cumulative: list[float] | None = None
+    """Cumulative probabilities of the quiet outcomes for weighted dice, None for fair dice."""
+    active_cumulative: list[float] | None = None
+
+
+_STRETCH_CACHE: dict[tuple, _Stretch] = {}
+
+
+def _get_stretch(table: "Table") -> _Stretch | None:
+    shapes = set()
+    for _, bet in table.yield_player_bets():
+        key = _shape_key(bet)
+        # Come and Don't Come bets move to their number on any roll that
+        # doesn't resolve them
+        if key[3] & FLAG_FALLBACK or getattr(bet, "number", 0) is None:
+            return None
+        shapes.add(_shape_id(key))
+
+    tables = get_kernel_tables(table.settings)
+    probabilities = table.dice.probabilities
+    cache_key = (id(tables), table.point.number, frozenset(shapes), probabilities)
+    stretch = _STRETCH_CACHE.get(cache_key)
+    if stretch is not None:
+        return stretch
+
+    if table.point.number is None:
+        quiet = ~np.isin(_TOTALS, _POINT_NUMBERS)
+    else:
+        quiet = (_TOTALS != 7) & (_TOTALS != table.point.number)
+    if shapes:
+        tables.ensure(max(shapes) + 1)
+        kind = tables.kind[sorted(shapes), POINT_INDEX[table.point.number]]
+        quiet &= (kind == _NO_ACTION).all(axis=0)
+
+    quiet_index = np.flatnonzero(quiet)
+    active_index = np.flatnonzero(~quiet)
+    if probabilities is None:
+        p_quiet = len(quiet_index) / 36
+        quiet_cumulative = active_cumulative = None
+    else:
+        p = np.asarray(probabilities)
+        p_quiet = float(p[quiet_index].sum())
+        quiet_cumulative = list(itertools.accumulate(p[quiet_index].tolist()))
+        active_cumulative = list(itertools.accumulate(p[active_index].tolist()))
+    stretch = _Stretch(
+        quiet=quiet,
+        # the point changes on some outcomes, so with fair dice never all of
+        # them are quiet
+        log_quiet=math.log(p_quiet) if 0 < p_quiet < 1 else -math.inf,
+        quiet_outcomes=[_OUTCOMES[i] for i in quiet_index],
+        active_outcomes=[_OUTCOMES[i] for i in active_index],
+        quiet_cumulative=quiet_cumulative,
+        active_cumulative=active_cumulative,
+    )
+    _STRETCH_CACHE[cache_key] = stretch
+    return stretch
+
+
+def quiet_outcomes(table: "Table") -> np.ndarray:
+    """
+    Which of the 36 dice outcomes (see :py:func:`crapssim.kernel.outcome_index`)
+    leave the table unchanged: the point stays the same and none of the bets
+    resolve or move. Stateful bets (e.g. Fire) make every outcome count.
+    """
+    stretch = _get_stretch(table)
+    if stretch is None:
+        return np.zeros(36, dtype=bool)
+    return stretch.quiet.copy()
+
+
+_SKIPPABLE_DICE = (Dice, WeightedDice)
+
+
+def check_skippable_dice(dice: Dice) -> None:
+    """
+    Check that quiet rolls can be skipped with the dice.
+
+    Raises:
+        ValueError: If the dice aren't plain random dice, e.g. ReplayDice,
+            StreamDice or HandLibraryDice, whose rolls would be replaced by
+            random draws.
+    """
+    if type(dice) not in _SKIPPABLE_DICE:
+        raise ValueError(f"Can't skip quiet rolls with {type(dice).__name__}")
+
+
+def _pick(
+    outcomes: list[tuple[int, int]], cumulative: list[float] | None, u: float
+) -> tuple[int, int]:
+    """Outcome for the uniform number ``u``, weighted by the cumulative probabilities if given."""
+    if cumulative is None:
+        return outcomes[int(u * len(outcomes))]
+    i = bisect.bisect_right(cumulative, u * cumulative[-1])
+    return outcomes[min(i, len(outcomes) - 1)]
+
+
+class SkipTableUpdate(TableUpdate):
+    """
+    TableUpdate that skips rolls where nothing happens.
+
+    Args:
+        roll_limit: Total number of rolls (``Dice.n_rolls``) that the table
+            may reach, so that skipping never goes past the end of a run.
+    """
+
+    def __init__(self, roll_limit: float = math.inf) -> None:
+        self.roll_limit = roll_limit
+
+    def run(
+        self,
+        table: "Table",
+        dice_outcome: typing.Iterable[int] | None = None,
+        run_complete: bool = False,
+        verbose: bool = False,
+    ):
+        versions = [player.version for player in table.players]
+        self.run_strategies(table, run_complete, verbose)
+        if dice_outcome is None and not verbose and self.can_skip(table, versions):
+            dice_outcome = self.skip_quiet_rolls(table, run_complete)
+
+        self.print_player_summary(table, verbose)
+        self.before_roll(table)
+        self.record_bets_at_risk(table)
+        self.update_table_stats(table)
+        self.roll(table, dice_outcome, verbose)
+        self.after_roll(table)
+        self.update_bets(table, verbose)
+        self.set_new_shooter(table)
+        self.update_numbers(table, verbose)
+        self.record_players(table)
+
+    @staticmethod
+    def can_skip(table: "Table", versions: list[int]) -> bool:
+        """
+        True if the state before the roll will be the same after a quiet roll:
+        there is no new shooter and every player's strategy is pure and
+        didn't change their bets.
+        """
+        if table.new_shooter:
+            return False
+        for player, version in zip(table.players, versions):
+            strategy = player.strategy
+            if not (strategy.update_is_pure and strategy.completed_is_pure):
+                return False
+            if player.version != version:
+                return False
+        return True
+
+    def skip_quiet_rolls(
+        self, table: "Table", run_complete: bool = False
+    ) -> tuple[int, int] | None:
+        """
+        Advance the table over a geometric number of quiet rolls.
+
+        Returns:
+            The outcome of the next roll, which is one where something
+            happens unless the roll limit is reached first, or None if no
+            outcome is quiet.
+        """
+        stretch = _get_stretch(table)
+        if stretch is None or stretch.log_quiet == -math.inf:
+            return None
+
+        # number of quiet rolls before the next roll where something happens,
+        # from inverse transform sampling of the geometric distribution
+        rng = table.dice.rng
+        n_skip = math.floor(math.log(1.0 - rng.random()) / stretch.log_quiet)
+        limit = math.inf if run_complete else self.roll_limit - table.dice.n_rolls - 1
+        if n_skip >= limit:
+            # the run ends during the stretch, so the last roll is quiet too
+            n_skip = max(int(limit), 0)
+            outcomes, cumulative = stretch.quiet_outcomes, stretch.quiet_cumulative
+        else:
+            outcomes, cumulative = stretch.active_outcomes, stretch.active_cumulative
+
+        if n_skip > 0:
+            self.record_quiet_rolls(table, n_skip)
+            table.dice.result = _pick(
+                stretch.quiet_outcomes, stretch.quiet_cumulative, rng.random()
+            )
+            table.last_roll = table.dice.total
+        return _pick(outcomes, cumulative, rng.random())
+
+    def record_quiet_rolls(self, table: "Table", n_rolls: int) -> None:
+        """Advance the roll count, table stats and risk metrics over quiet rolls."""
+        self.record_bets_at_risk(table)
+        # the first quiet roll can reset the pass rolls after the previous roll
+        self.update_table_stats(table)
+        table.pass_rolls += n_rolls - 1
+        for player in table.players:
+            if player.recorder is not None:
+                break
+        else:
+            table.dice.n_rolls += 1
+            self.record_players(table)
+            table.dice.n_rolls += n_rolls - 1
+            for player in table.players:
+                player.metrics.update_unchanged(n_rolls - 1)
+            return
+
+        for _ in range(n_rolls):
+            table.dice.n_rolls += 1
+            self.record_players(table)
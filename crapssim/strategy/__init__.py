@@ -26,4 +26,14 @@ from crapssim.strategy.tools import (
     Strategy,
 )
 
-from . import examples, odds
+from . import odds
+
+
+def __getattr__(name: str):
+    # examples has many strategies that most users don't need, so it's only
+    # imported on first use (e.g. crapssim.strategy.examples.IronCross)
+    if name == "examples":
+        import importlib
+
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
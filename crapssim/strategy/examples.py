@@ -4,6 +4,7 @@ in order to do the intended"""
 import typing
 
 from crapssim.bet import Come, DontCome, DontPass, Field, PassLine, Place
+from crapssim.money import as_amount
 from crapssim.strategy.odds import (
     DontPassOddsMultiplier,
     OddsMultiplier,
@@ -135,6 +136,9 @@ class Place68Move59(Strategy):
     """Strategy that makes place bets on the six and eight, and then if a PassLine or Come bet with
     that point comes up, moves the place bet to 5 or 9."""
 
+    completed_is_pure = True
+    update_is_pure = True
+
     def __init__(
         self,
         pass_come_amount: float = 5,
@@ -388,6 +392,9 @@ class HammerLock(Strategy):
     taken down.
     """
 
+    completed_is_pure = True
+    update_is_pure = True
+
     def __init__(self, base_amount: float):
         """Creates the HammerLock strategy with all bet amounts being created from the given
         base_amount.
@@ -490,6 +497,9 @@ class Risk12(Strategy):
     is established, places either the 6 the 8, or both depending on if the player won enough
     pre-point to cover those bets."""
 
+    completed_is_pure = True
+    update_is_pure = True
+
     def __init__(self, base_amount: float = 5) -> None:
         """Pass line and field bet before the point is established. Once the point is established
         place the 6 and 8.
@@ -611,6 +621,8 @@ class Place68PR(Strategy):
     it is reduced to the original bet amount.
     """
 
+    completed_is_pure = True
+
     def __init__(self, base_amount: float = 6) -> None:
         """If point is on place the 6 & 8 of the amount. If you win press the bet to double. If you win
         again reduce the bet back to starting amount.
@@ -620,12 +632,14 @@ class Place68PR(Strategy):
         base_amount
             The starting amount of bet to place.
         """
-        self.base_amount = float(base_amount)
-        self.starting_amount = float(base_amount)
+        self.base_amount = as_amount(base_amount)
+        self.starting_amount = as_amount(base_amount)
         self.press_amount = 2 * self.starting_amount
 
-        self.win_one_amount = base_amount * (7 / 6)
-        self.win_two_amount = base_amount * 2 * (7 / 6)
+        # the winnings of the place bets, which are compared exactly when the
+        # amounts are in crapssim.money.Cents
+        self.win_one_amount = self.starting_amount * (7 / 6)
+        self.win_two_amount = self.press_amount * (7 / 6)
 
         self.six_winnings = 0.0
         self.eight_winnings = 0.0
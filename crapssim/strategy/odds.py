@@ -1,12 +1,16 @@
 import typing
 
 from crapssim.bet import Bet, Come, DontCome, DontPass, Odds, PassLine
+from crapssim.money import as_amount
 from crapssim.strategy.tools import Player, Strategy, Table
 
 
 class OddsAmount(Strategy):
     """Strategy that takes places odds on a given number for a given bet type."""
 
+    completed_is_pure = True
+    update_is_pure = True
+
     def __init__(
         self,
         base_type: typing.Type[PassLine | DontPass | Come | DontCome],
@@ -33,7 +37,7 @@ class OddsAmount(Strategy):
 
     def update_bets(self, player: Player) -> None:
         for number, amount in self.odds_amounts.items():
-            bet = Odds(self.base_type, number, float(amount), self.always_working)
+            bet = Odds(self.base_type, number, as_amount(amount), self.always_working)
             if bet.is_allowed(player) and not player.already_placed(bet):
                 player.add_bet(bet)
 
@@ -58,7 +62,7 @@ class PassLineOddsAmount(OddsAmount):
         numbers: tuple[int] = (4, 5, 6, 8, 9, 10),
         always_working: bool = False,
     ):
-        self.bet_amount = float(bet_amount)
+        self.bet_amount = as_amount(bet_amount)
         self.numbers = numbers
         super().__init__(PassLine, {x: bet_amount for x in numbers}, always_working)
 
@@ -76,7 +80,7 @@ class DontPassOddsAmount(OddsAmount):
         numbers: tuple[int] = (4, 5, 6, 8, 9, 10),
         always_working: bool = False,
     ):
-        self.bet_amount = float(bet_amount)
+        self.bet_amount = as_amount(bet_amount)
         self.numbers = numbers
         super().__init__(DontPass, {x: bet_amount for x in numbers}, always_working)
 
@@ -94,7 +98,7 @@ class ComeOddsAmount(OddsAmount):
         numbers: tuple[int] = (4, 5, 6, 8, 9, 10),
         always_working: bool = False,
     ):
-        self.bet_amount = float(bet_amount)
+        self.bet_amount = as_amount(bet_amount)
         self.numbers = numbers
         super().__init__(DontPass, {x: bet_amount for x in numbers}, always_working)
 
@@ -112,7 +116,7 @@ class DontComeOddsAmount(OddsAmount):
         numbers: tuple[int] = (4, 5, 6, 8, 9, 10),
         always_working: bool = False,
     ):
-        self.bet_amount = float(bet_amount)
+        self.bet_amount = as_amount(bet_amount)
         self.numbers = numbers
         super().__init__(DontCome, {x: bet_amount for x in numbers}, always_working)
 
@@ -127,6 +131,9 @@ class OddsMultiplier(Strategy):
     """Strategy that takes an AllowsOdds object and places Odds on it given either a multiplier,
     or a dictionary of points and multipliers."""
 
+    completed_is_pure = True
+    update_is_pure = True
+
     def __init__(
         self,
         base_type: typing.Type[PassLine | DontPass | Come | DontCome],
@@ -170,7 +177,9 @@ class OddsMultiplier(Strategy):
         player
             The player to add the odds bet to.
         """
-        for bet in [x for x in player.bets if isinstance(x, self.base_type)]:
+        # the base bet amounts that limit the odds are computed once per roll by the
+        # player (see Player.base_bet_amounts), so each bet is checked in O(1)
+        for bet in player.get_bets_by_type(self.base_type):
             point = self.get_point_number(bet, player.table)
 
             if point in self.odds_multiplier:
@@ -179,9 +188,9 @@ class OddsMultiplier(Strategy):
                 return
 
             amount = bet.amount * multiplier
-            OddsAmount(
-                self.base_type, {point: amount}, self.always_working
-            ).update_bets(player)
+            odds = Odds(self.base_type, point, as_amount(amount), self.always_working)
+            if odds.is_allowed(player) and not player.already_placed(odds):
+                player.add_bet(odds)
 
     def completed(self, player: Player) -> bool:
         """Return True if there are no bets of base_type on the table.
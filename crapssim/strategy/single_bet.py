@@ -48,6 +48,9 @@ class StrategyMode(enum.Enum):
 
 
 class _BaseSingleBet(Strategy):
+    completed_is_pure = True
+    update_is_pure = True
+
     def __init__(
         self,
         bet: Bet,
@@ -96,6 +99,9 @@ class BetPlace(Strategy):
     """Strategy that makes multiple Place bets of given amounts. It can also skip making the bet
     if the point is the same as the given bet number."""
 
+    completed_is_pure = True
+    update_is_pure = True
+
     def __init__(
         self,
         place_bet_amounts: dict[int, float],
@@ -0,0 +1,759 @@
+"""Declarative strategy specs: plain dictionaries (or JSON) describing a strategy built from the
+building blocks in :py:mod:`crapssim.strategy.tools`, :py:mod:`~crapssim.strategy.single_bet`
+and :py:mod:`~crapssim.strategy.odds`.
+
+Unlike strategies built with lambdas, specs can be sent to worker processes, stored, and hashed
+(see :func:`spec_hash`) so that results can be cached by strategy identity. A spec compiles to
+the existing Strategy classes with :func:`compile_strategy`, and most specs can also be lowered
+to a table of rules with :func:`compile_rules`, for engines that evaluate the strategy for many
+tables at once with array operations.
+
+Bets are given as ``{"type": "Place", "number": 6, "amount": 6}``, with ``number`` for
+Come/DontCome (optional), Place, HardWay and Odds, ``base`` and ``always_working`` for Odds and
+``result`` for Hop. Strategies are given by their ``type``:
+
+======================  ====================================================================
+``all``                 ``strategies``: list of specs, run in order (AggregateStrategy)
+``null``                does nothing (NullStrategy)
+``add``                 ``bet``, optional ``when`` condition; adds the bet if it isn't already
+                        on the table (AddIfNotBet, AddIfPointOn, ..., AddIfTrue)
+``remove``              ``bet``, optional ``when``; removes bets of the same type and number
+``remove_by_type``      ``types``: list of bet types (RemoveByType)
+``single``              ``bet``, optional ``mode``: a StrategyMode name, with the same default
+                        as the matching class (BetPassLine, BetCome, ...)
+``place``               ``amounts``: number to amount, ``mode``, ``skip_point``, ``skip_come``
+                        (BetPlace)
+``odds``                ``base``, ``amounts``: number to amount, ``always_working``
+                        (OddsAmount)
+``odds_multiplier``     ``base``, ``multiplier``: number or number to multiplier,
+                        ``always_working`` (OddsMultiplier)
+``count``               ``types``, ``count``, ``bet`` (CountStrategy)
+``progression``         ``bet``, ``multipliers`` (WinProgression)
+======================  ====================================================================
+
+Conditions are ``{"point": "On"}`` (or ``"Off"``), ``{"point_in": [4, 10]}``,
+``{"new_shooter": true}``, ``{"has_bet": bet}`` (that exact bet is on the table),
+``{"placed": bet}`` (a bet of that type and number is on the table, any amount),
+``{"count_less_than": {"types": [...], "count": n}}``, ``{"bankroll_at_least": x}``, and
+``{"all": [...]}``, ``{"any": [...]}`` and ``{"not": condition}`` to combine them.
+
+For example, :class:`~crapssim.strategy.examples.IronCross` with a base amount of 5 is::
+
+    {
+        "type": "all",
+        "strategies": [
+            {"type": "single", "bet": {"type": "PassLine", "amount": 5}},
+            {"type": "odds_multiplier", "base": "PassLine", "multiplier": 2},
+            {"type": "place", "amounts": {"5": 10, "6": 12, "8": 12}},
+            {"type": "add", "bet": {"type": "Field", "amount": 5}, "when": {"point": "On"}},
+        ],
+    }
+"""
+
+import hashlib
+import json
+import typing
+
+import numpy as np
+
+import crapssim.bet
+from crapssim.bet import Bet, Come, DontCome, DontPass, HardWay, Hop, Odds, PassLine, Place
+from crapssim.kernel import FLAG_ALWAYS_WORKING, POINT_INDEX
+from crapssim.registry import BET_TYPE_CODES, hop_number
+from crapssim.strategy.odds import OddsAmount, OddsMultiplier
+from crapssim.strategy.single_bet import BetPlace, StrategyMode, _BaseSingleBet
+from crapssim.strategy.tools import (
+    AddIfNewShooter,
+    AddIfNotBet,
+    AddIfPointOff,
+    AddIfPointOn,
+    AddIfTrue,
+    AggregateStrategy,
+    CountStrategy,
+    NullStrategy,
+    Player,
+    RemoveByType,
+    RemoveIfPointOff,
+    RemoveIfTrue,
+    Strategy,
+    WinProgression,
+)
+
+__all__ = [
+    "RULE_DTYPE",
+    "RULE_ADD",
+    "RULE_ADD_OR_INCREASE",
+    "RULE_REMOVE",
+    "RULE_ODDS_MULTIPLIER",
+    "SpecCondition",
+    "normalize_spec",
+    "spec_hash",
+    "compile_bet",
+    "compile_strategy",
+    "compile_rules",
+    "evaluate_rules",
+]
+
+_BET_CLASSES: dict[str, type[Bet]] = {
+    name: cls
+    for name in crapssim.bet.__all__
+    if not name.startswith("_")
+    and name != "Bet"
+    and isinstance(cls := getattr(crapssim.bet, name), type)
+    and issubclass(cls, Bet)
+}
+_ODDS_BASES = ("PassLine", "DontPass", "Come", "DontCome")
+_POINT_NUMBERS = (4, 5, 6, 8, 9, 10)
+_MODES = {mode.name: mode for mode in StrategyMode}
+_DEFAULT_MODES = {
+    "PassLine": "ADD_IF_POINT_OFF",
+    "DontPass": "ADD_IF_POINT_OFF",
+    "Come": "ADD_IF_POINT_ON",
+    "DontCome": "ADD_IF_POINT_ON",
+}
+"""Default modes of the single bet strategies (e.g. BetPassLine) that differ from AddIfNotBet"""
+
+RULE_ADD = 1
+"""Add the rule's bet if it isn't on the table."""
+RULE_ADD_OR_INCREASE = 2
+"""Add the rule's bet, increasing a bet that is already on the table."""
+RULE_REMOVE = 3
+"""Remove bets with the same type and number as the rule's bet."""
+RULE_ODDS_MULTIPLIER = 4
+"""Add odds of ``amount`` times the base bet to the rule's base bet type."""
+
+RULE_DTYPE = np.dtype(
+    [
+        ("action", np.int8),
+        ("type", np.int8),
+        ("number", np.int8),
+        ("base", np.int8),
+        ("flags", np.uint8),
+        ("amount", np.float64),
+        ("point_mask", np.uint8),
+        ("new_shooter", np.int8),
+    ]
+)
+"""One row per rule: the action, the bet (encoded as in :data:`crapssim.kernel.BET_DTYPE`, the
+amount is the multiplier for odds multiplier rules), a bit mask of the point states the rule
+applies in (bit :data:`crapssim.kernel.POINT_INDEX` of the point, bit 0 when the point is Off),
+and whether it applies only with a new shooter (1), only without one (0) or either way (-1)."""
+
+_ALL_POINTS = 0b1111111
+
+
+# Normalizing ---------------------------------------------------------------------------------
+
+
+def _number_key(key: object) -> int:
+    try:
+        number = int(key)
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid number {key!r}") from None
+    if number not in _POINT_NUMBERS:
+        raise ValueError(f"invalid point number {number}")
+    return number
+
+
+def _amount(value: object) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"invalid amount {value!r}")
+    return float(value)
+
+
+def _count(value: object, key: str) -> int:
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"{key!r} must be an integer, got {value!r}")
+    return value
+
+
+def _number_map(value: object) -> dict[str, float]:
+    if not isinstance(value, dict) or not value:
+        raise ValueError("expected a non-empty mapping of numbers to amounts")
+    items = sorted((_number_key(k), _amount(v)) for k, v in value.items())
+    return {str(k): v for k, v in items}
+
+
+def _bet_type(name: object, allowed: typing.Iterable[str] | None = None) -> str:
+    if not isinstance(name, str) or name not in _BET_CLASSES or (allowed is not None and name not in allowed):
+        raise ValueError(f"unknown bet type {name!r}")
+    return name
+
+
+def _get(spec: dict, key: str, kind: str) -> typing.Any:
+    if key not in spec:
+        raise ValueError(f"{kind} spec is missing {key!r}")
+    return spec[key]
+
+
+def _check_keys(spec: dict, allowed: set[str], kind: str) -> None:
+    unknown = set(spec) - allowed - {"type"}
+    if unknown:
+        raise ValueError(f"unknown keys for {kind}: {sorted(unknown)}")
+
+
+def _normalize_bet(spec: object) -> dict:
+    if not isinstance(spec, dict):
+        raise ValueError("bet spec must be a mapping")
+    name = _bet_type(spec.get("type"))
+    bet = {"type": name, "amount": _amount(_get(spec, "amount", name))}
+    cls = _BET_CLASSES[name]
+    if cls in (Come, DontCome):
+        _check_keys(spec, {"amount", "number"}, name)
+        number = spec.get("number")
+        bet["number"] = None if number is None else _number_key(number)
+    elif cls in (Place, HardWay):
+        _check_keys(spec, {"amount", "number"}, name)
+        bet["number"] = _number_key(_get(spec, "number", name))
+        if cls is HardWay and bet["number"] not in (4, 6, 8, 10):
+            raise ValueError(f"invalid HardWay number {bet['number']}")
+    elif cls is Odds:
+        _check_keys(spec, {"amount", "number", "base", "always_working"}, name)
+        bet["base"] = _bet_type(_get(spec, "base", name), _ODDS_BASES)
+        bet["number"] = _number_key(_get(spec, "number", name))
+        bet["always_working"] = bool(spec.get("always_working", False))
+    elif cls is Hop:
+        _check_keys(spec, {"amount", "result"}, name)
+        result = _get(spec, "result", name)
+        if not isinstance(result, list) or len(result) != 2:
+            raise ValueError(f"'result' must be a list of two dice, got {result!r}")
+        if not all(x in range(1, 7) for x in result):
+            raise ValueError(f"invalid Hop result {result!r}")
+        bet["result"] = sorted(int(x) for x in result)
+    else:
+        _check_keys(spec, {"amount"}, name)
+    return bet
+
+
+def _normalize_types(types: object) -> list[str]:
+    if isinstance(types, str):
+        types = [types]
+    if not isinstance(types, list) or not types:
+        raise ValueError("expected a bet type or a list of bet types")
+    return sorted(set(_bet_type(x) for x in types))
+
+
+def _normalize_condition(cond: object) -> dict:
+    if not isinstance(cond, dict) or len(cond) != 1:
+        raise ValueError(f"condition must be a mapping with one key, got {cond!r}")
+    ((key, value),) = cond.items()
+    match key:
+        case "point":
+            if value not in ("On", "Off"):
+                raise ValueError(f"point must be 'On' or 'Off', got {value!r}")
+            return {key: value}
+        case "point_in":
+            if not isinstance(value, list):
+                raise ValueError(f"{key!r} needs a list of point numbers, got {value!r}")
+            return {key: sorted(set(_number_key(x) for x in value))}
+        case "new_shooter":
+            return {key: bool(value)}
+        case "has_bet" | "placed":
+            return {key: _normalize_bet(value)}
+        case "count_less_than":
+            if not isinstance(value, dict):
+                raise ValueError(f"{key!r} needs a mapping with 'types' and 'count'")
+            return {
+                key: {
+                    "types": _normalize_types(_get(value, "types", key)),
+                    "count": _count(_get(value, "count", key), "count"),
+                }
+            }
+        case "bankroll_at_least":
+            return {key: _amount(value)}
+        case "all" | "any":
+            if not isinstance(value, list) or not value:
+                raise ValueError(f"{key!r} needs a non-empty list of conditions")
+            return {key: [_normalize_condition(x) for x in value]}
+        case "not":
+            return {key: _normalize_condition(value)}
+    raise ValueError(f"unknown condition {key!r}")
+
+
+def normalize_spec(spec: typing.Mapping[str, typing.Any]) -> dict:
+    """Validate a strategy spec and return it in canonical form, with all defaults filled in.
+
+    Equivalent specs (e.g. with integer and string number keys, or with and without default
+    values) have the same canonical form.
+
+    Parameters
+    ----------
+    spec
+        The strategy spec, see the module documentation.
+
+    Returns
+    -------
+    The canonical spec, which only contains JSON types.
+
+    Raises
+    ------
+    ValueError
+        If the spec is invalid.
+    """
+    if not isinstance(spec, typing.Mapping):
+        raise ValueError("strategy spec must be a mapping")
+    spec = dict(spec)
+    kind = spec.get("type")
+    match kind:
+        case "all":
+            _check_keys(spec, {"strategies"}, kind)
+            strategies = _get(spec, "strategies", kind)
+            if not isinstance(strategies, list):
+                raise ValueError("'strategies' must be a list")
+            return {"type": kind, "strategies": [normalize_spec(x) for x in strategies]}
+        case "null":
+            _check_keys(spec, set(), kind)
+            return {"type": kind}
+        case "add" | "remove":
+            _check_keys(spec, {"bet", "when"}, kind)
+            when = spec.get("when")
+            return {
+                "type": kind,
+                "bet": _normalize_bet(_get(spec, "bet", kind)),
+                "when": None if when is None else _normalize_condition(when),
+            }
+        case "remove_by_type":
+            _check_keys(spec, {"types"}, kind)
+            return {"type": kind, "types": _normalize_types(_get(spec, "types", kind))}
+        case "single":
+            _check_keys(spec, {"bet", "mode"}, kind)
+            bet = _normalize_bet(_get(spec, "bet", kind))
+            mode = spec.get("mode", _DEFAULT_MODES.get(bet["type"], "ADD_IF_NOT_BET"))
+            if not isinstance(mode, str) or mode not in _MODES:
+                raise ValueError(f"unknown mode {mode!r}")
+            return {"type": kind, "bet": bet, "mode": mode}
+        case "place":
+            _check_keys(spec, {"amounts", "mode", "skip_point", "skip_come"}, kind)
+            mode = spec.get("mode", StrategyMode.BET_IF_POINT_ON.name)
+            if not isinstance(mode, str) or mode not in _MODES:
+                raise ValueError(f"unknown mode {mode!r}")
+            return {
+                "type": kind,
+                "amounts": _number_map(_get(spec, "amounts", kind)),
+                "mode": mode,
+                "skip_point": bool(spec.get("skip_point", True)),
+                "skip_come": bool(spec.get("skip_come", False)),
+            }
+        case "odds" | "odds_multiplier":
+            key = "amounts" if kind == "odds" else "multiplier"
+            _check_keys(spec, {"base", key, "always_working"}, kind)
+            value = _get(spec, key, kind)
+            if kind == "odds_multiplier" and not isinstance(value, dict):
+                value = {x: value for x in _POINT_NUMBERS}
+            return {
+                "type": kind,
+                "base": _bet_type(_get(spec, "base", kind), _ODDS_BASES),
+                key: _number_map(value),
+                "always_working": bool(spec.get("always_working", False)),
+            }
+        case "count":
+            _check_keys(spec, {"types", "count", "bet"}, kind)
+            return {
+                "type": kind,
+                "types": _normalize_types(_get(spec, "types", kind)),
+                "count": _count(_get(spec, "count", kind), "count"),
+                "bet": _normalize_bet(_get(spec, "bet", kind)),
+            }
+        case "progression":
+            _check_keys(spec, {"bet", "multipliers"}, kind)
+            multipliers = _get(spec, "multipliers", kind)
+            if not isinstance(multipliers, list) or not multipliers:
+                raise ValueError("'multipliers' must be a non-empty list")
+            return {
+                "type": kind,
+                "bet": _normalize_bet(_get(spec, "bet", kind)),
+                "multipliers": [_amount(x) for x in multipliers],
+            }
+    raise ValueError(f"unknown strategy type {kind!r}")
+
+
+def spec_hash(spec: typing.Mapping[str, typing.Any]) -> str:
+    """Content hash of a strategy spec, the same for all equivalent specs.
+
+    Parameters
+    ----------
+    spec
+        The strategy spec.
+
+    Returns
+    -------
+    Hex digest of the SHA-256 hash of the canonical spec.
+    """
+    canonical = json.dumps(normalize_spec(spec), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+# Compiling to strategies ---------------------------------------------------------------------
+
+
+def _build_bet(bet: dict) -> Bet:
+    cls = _BET_CLASSES[bet["type"]]
+    if cls in (Come, DontCome):
+        return cls(bet["amount"], bet["number"])
+    if cls in (Place, HardWay):
+        return cls(bet["number"], bet["amount"])
+    if cls is Odds:
+        base = _BET_CLASSES[bet["base"]]
+        return Odds(base, bet["number"], bet["amount"], bet["always_working"])
+    if cls is Hop:
+        return Hop(tuple(bet["result"]), bet["amount"])
+    return cls(bet["amount"])
+
+
+def compile_bet(spec: typing.Mapping[str, typing.Any]) -> Bet:
+    """Create the bet described by a bet spec.
+
+    Parameters
+    ----------
+    spec
+        The bet spec, e.g. ``{"type": "Place", "number": 6, "amount": 6}``.
+
+    Returns
+    -------
+    A new bet.
+    """
+    return _build_bet(_normalize_bet(spec))
+
+
+def _numbers(mapping: dict[str, float]) -> dict[int, float]:
+    return {int(k): v for k, v in mapping.items()}
+
+
+class SpecCondition:
+    """A condition from a strategy spec, callable on a player like the keys of AddIfTrue.
+
+    Unlike a lambda, the condition can be pickled and compared, and its repr shows the spec.
+    """
+
+    def __init__(self, condition: typing.Mapping[str, typing.Any]):
+        """
+        Parameters
+        ----------
+        condition
+            The condition spec, see the module documentation.
+        """
+        self.condition = _normalize_condition(condition)
+        ((self._key, value),) = self.condition.items()
+        match self._key:
+            case "has_bet" | "placed":
+                self._value = _build_bet(value)
+            case "count_less_than":
+                types = tuple(_BET_CLASSES[x] for x in value["types"])
+                self._value = (types, value["count"])
+            case "all" | "any":
+                self._value = [SpecCondition(x) for x in value]
+            case "not":
+                self._value = SpecCondition(value)
+            case _:
+                self._value = value
+
+    def __call__(self, player: Player) -> bool:
+        value = self._value
+        match self._key:
+            case "point":
+                return player.table.point.status == value
+            case "point_in":
+                return player.table.point.number in value
+            case "new_shooter":
+                return player.table.new_shooter == value
+            case "has_bet":
+                return value in player.bets
+            case "placed":
+                return player.already_placed(value)
+            case "count_less_than":
+                return len(player.get_bets_by_type(value[0])) < value[1]
+            case "bankroll_at_least":
+                return player.bankroll >= value
+            case "all":
+                return all(x(player) for x in value)
+            case "any":
+                return any(x(player) for x in value)
+            case "not":
+                return not value(player)
+        raise NotImplementedError
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SpecCondition):
+            return self.condition == other.condition
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.condition})"
+
+
+class _MatchesBet:
+    """Remove key matching bets with the same type and number as a bet, if a condition holds."""
+
+    def __init__(self, bet: Bet, condition: SpecCondition | None):
+        self.bet = bet
+        self.condition = condition
+
+    def __call__(self, bet: Bet, player: Player) -> bool:
+        return bet._placed_key == self.bet._placed_key and (
+            self.condition is None or self.condition(player)
+        )
+
+
+def _compile_add(bet: Bet, when: dict | None) -> Strategy:
+    if when is None:
+        return AddIfNotBet(bet)
+    if when == {"point": "Off"}:
+        return AddIfPointOff(bet)
+    if when == {"point": "On"}:
+        return AddIfPointOn(bet)
+    if when == {"new_shooter": True}:
+        return AddIfNewShooter(bet)
+    cond = SpecCondition({"all": [when, {"not": {"has_bet": _bet_spec(bet)}}]})
+    return _pure(AddIfTrue(bet, cond))
+
+
+def _pure(strategy: Strategy) -> Strategy:
+    # spec conditions only depend on the point, new shooter, bets and bankroll
+    strategy.update_is_pure = True
+    return strategy
+
+
+def _bet_spec(bet: Bet) -> dict:
+    spec: dict[str, typing.Any] = {"type": type(bet).__name__, "amount": bet.amount}
+    if isinstance(bet, Odds):
+        spec |= {"base": bet.base_type.__name__, "always_working": bet.always_working}
+    if isinstance(bet, Hop):
+        spec["result"] = list(bet.result)
+    elif isinstance(bet, (Come, DontCome, Place, HardWay, Odds)):
+        spec["number"] = bet.number
+    return spec
+
+
+def _compile(spec: dict) -> Strategy:
+    match spec["type"]:
+        case "all":
+            return AggregateStrategy(*(_compile(x) for x in spec["strategies"]))
+        case "null":
+            return NullStrategy()
+        case "add":
+            return _compile_add(_build_bet(spec["bet"]), spec["when"])
+        case "remove":
+            bet = _build_bet(spec["bet"])
+            if spec["when"] == {"point": "Off"}:
+                return RemoveIfPointOff(bet)
+            when = None if spec["when"] is None else SpecCondition(spec["when"])
+            return _pure(RemoveIfTrue(_MatchesBet(bet, when)))
+        case "remove_by_type":
+            return RemoveByType(tuple(_BET_CLASSES[x] for x in spec["types"]))
+        case "single":
+            return _BaseSingleBet(_build_bet(spec["bet"]), _MODES[spec["mode"]])
+        case "place":
+            return BetPlace(
+                _numbers(spec["amounts"]),
+                mode=_MODES[spec["mode"]],
+                skip_point=spec["skip_point"],
+                skip_come=spec["skip_come"],
+            )
+        case "odds":
+            base = _BET_CLASSES[spec["base"]]
+            return OddsAmount(base, _numbers(spec["amounts"]), spec["always_working"])
+        case "odds_multiplier":
+            base = _BET_CLASSES[spec["base"]]
+            multiplier = _numbers(spec["multiplier"])
+            return OddsMultiplier(base, multiplier, spec["always_working"])
+        case "count":
+            types = tuple(_BET_CLASSES[x] for x in spec["types"])
+            return CountStrategy(types, spec["count"], _build_bet(spec["bet"]))
+        case "progression":
+            return WinProgression(_build_bet(spec["bet"]), spec["multipliers"])
+    raise NotImplementedError
+
+
+def compile_strategy(spec: typing.Mapping[str, typing.Any]) -> Strategy:
+    """Compile a strategy spec to the equivalent Strategy object.
+
+    Parameters
+    ----------
+    spec
+        The strategy spec, see the module documentation.
+
+    Returns
+    -------
+    A new strategy, built from the classes in :py:mod:`crapssim.strategy`.
+
+    Raises
+    ------
+    ValueError
+        If the spec is invalid.
+    """
+    return _compile(normalize_spec(spec))
+
+
+# Compiling to rules --------------------------------------------------------------------------
+
+
+def _point_bit(number: int | None) -> int:
+    return 1 << POINT_INDEX[number]
+
+
+def _condition_mask(when: dict | None) -> tuple[int, int]:
+    """Point mask and new shooter value for a condition that only depends on the table."""
+    if when is None:
+        return _ALL_POINTS, -1
+    ((key, value),) = when.items()
+    match key:
+        case "point":
+            off = _point_bit(None)
+            return (off if value == "Off" else _ALL_POINTS & ~off), -1
+        case "point_in":
+            return sum(_point_bit(x) for x in value), -1
+        case "new_shooter":
+            return _ALL_POINTS, int(value)
+        case "all":
+            mask, shooter = _ALL_POINTS, -1
+            for part in value:
+                part_mask, part_shooter = _condition_mask(part)
+                mask &= part_mask
+                if part_shooter != -1:
+                    if shooter not in (-1, part_shooter):
+                        mask = 0
+                    shooter = part_shooter
+            return mask, shooter
+    raise ValueError(f"condition {key!r} depends on the player and can't be compiled to rules")
+
+
+def _rule(action: int, bet: dict, mask: int = _ALL_POINTS, new_shooter: int = -1) -> tuple:
+    cls = _BET_CLASSES[bet["type"]]
+    if cls is Hop:
+        number = hop_number(bet["result"])
+    else:
+        number = bet.get("number") or 0
+    base = BET_TYPE_CODES[_BET_CLASSES[bet["base"]]] if "base" in bet else 0
+    flags = FLAG_ALWAYS_WORKING if bet.get("always_working") else 0
+    return (action, BET_TYPE_CODES[cls], number, base, flags, bet["amount"], mask, new_shooter)
+
+
+def _odds_mask(base: str, number: int) -> int:
+    # odds on the line bets are only allowed on the table point
+    return _point_bit(number) if base in ("PassLine", "DontPass") else _ALL_POINTS
+
+
+def _rules(spec: dict) -> list[tuple]:
+    kind = spec["type"]
+    match kind:
+        case "all":
+            return [rule for x in spec["strategies"] for rule in _rules(x)]
+        case "null":
+            return []
+        case "add" | "remove":
+            action = RULE_ADD if kind == "add" else RULE_REMOVE
+            return [_rule(action, spec["bet"], *_condition_mask(spec["when"]))]
+        case "single":
+            bet = spec["bet"]
+            match spec["mode"]:
+                case "ADD_IF_NOT_BET":
+                    return [_rule(RULE_ADD, bet)]
+                case "ADD_IF_POINT_OFF":
+                    return [_rule(RULE_ADD, bet, *_condition_mask({"point": "Off"}))]
+                case "ADD_IF_POINT_ON":
+                    return [_rule(RULE_ADD, bet, *_condition_mask({"point": "On"}))]
+                case "ADD_IF_NEW_SHOOTER":
+                    return [_rule(RULE_ADD, bet, new_shooter=1)]
+                case "ADD_OR_INCREASE":
+                    return [_rule(RULE_ADD_OR_INCREASE, bet)]
+                case "BET_IF_POINT_ON":
+                    return [
+                        _rule(RULE_ADD, bet, *_condition_mask({"point": "On"})),
+                        _rule(RULE_REMOVE, bet, *_condition_mask({"point": "Off"})),
+                    ]
+        case "place":
+            if spec["skip_come"]:
+                raise ValueError("place with skip_come depends on the player's bets")
+            rules = []
+            for number, amount in _numbers(spec["amounts"]).items():
+                bet = {"type": "Place", "number": number, "amount": amount}
+                if spec["skip_point"]:
+                    rules.append(_rule(RULE_REMOVE, bet, _point_bit(number)))
+                single = {"type": "single", "bet": bet, "mode": spec["mode"]}
+                for rule in _rules(single):
+                    rule = list(rule)
+                    if spec["skip_point"] and rule[0] != RULE_REMOVE:
+                        rule[6] &= ~_point_bit(number)
+                    rules.append(tuple(rule))
+            return rules
+        case "odds" | "odds_multiplier":
+            action = RULE_ADD if kind == "odds" else RULE_ODDS_MULTIPLIER
+            key = "amounts" if kind == "odds" else "multiplier"
+            return [
+                _rule(
+                    action,
+                    {
+                        "type": "Odds",
+                        "base": spec["base"],
+                        "number": number,
+                        "amount": amount,
+                        "always_working": spec["always_working"],
+                    },
+                    _odds_mask(spec["base"], number),
+                )
+                for number, amount in _numbers(spec[key]).items()
+            ]
+    raise ValueError(f"{kind!r} strategies can't be compiled to rules")
+
+
+def compile_rules(spec: typing.Mapping[str, typing.Any]) -> np.ndarray:
+    """Lower a strategy spec to a table of rules for vectorized engines.
+
+    Each rule is a bet action along with the table states (point and new shooter) it applies
+    in, see :data:`RULE_DTYPE`. Rules are in the order the strategy would apply them. Whether a
+    rule applies can also depend on the player's bets (e.g. an add rule only applies if the bet
+    isn't on the table yet), which the engine checks, along with whether the bet is allowed and
+    the player can afford it.
+
+    Specs with conditions on the player (``has_bet``, ``count_less_than``, ...), counts,
+    progressions, removals by type, ``skip_come`` and the ``REPLACE`` mode can't be lowered.
+
+    Parameters
+    ----------
+    spec
+        The strategy spec.
+
+    Returns
+    -------
+    Array of rules with dtype :data:`RULE_DTYPE`.
+
+    Raises
+    ------
+    ValueError
+        If the spec is invalid or can't be lowered to rules.
+    """
+    return np.array(_rules(normalize_spec(spec)), dtype=RULE_DTYPE)
+
+
+def evaluate_rules(
+    rules: np.ndarray,
+    point: np.ndarray,
+    new_shooter: np.ndarray,
+    applicable: np.ndarray | None = None,
+) -> np.ndarray:
+    """Find the rules that fire for many tables at once.
+
+    Parameters
+    ----------
+    rules
+        Rules from :func:`compile_rules`.
+    point
+        Point number of each table, 0 (or None) when the point is Off.
+    new_shooter
+        Whether each table has a new shooter.
+    applicable
+        Optional boolean array with one row per table and one column per rule, True where the
+        player's bets allow the rule (see :func:`compile_rules`).
+
+    Returns
+    -------
+    Boolean array with one row per table and one column per rule.
+    """
+    bits = np.array([POINT_INDEX[x or None] for x in point], dtype=np.uint8)[:, None]
+    shooter = np.asarray(new_shooter, dtype=np.int8)[:, None]
+
+    fires = ((rules["point_mask"][None, :] >> bits) & 1).astype(bool)
+    fires &= (rules["new_shooter"][None, :] == -1) | (rules["new_shooter"][None, :] == shooter)
+    if applicable is not None:
+        fires &= applicable
+    return fires
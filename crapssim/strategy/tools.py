@@ -61,6 +61,30 @@ class Strategy(ABC):
     is going to make, remove, or change.
     """
 
+    completed_is_pure: bool = False
+    """True if :func:`completed` only depends on the player's bankroll and bets (and settings
+    of the strategy that don't change). The table then only checks completed again after the
+    player's bankroll or bets change. A subclass that overrides completed is not pure unless it
+    sets this to True again itself."""
+
+    update_is_pure: bool = False
+    """True if :func:`update_bets` only depends on the player's bankroll and bets and the table's
+    point and new shooter status (and settings of the strategy that don't change), and
+    :func:`after_roll` changes nothing on rolls that don't resolve or move any bets. Rolls where
+    nothing happens can then be skipped, see :py:mod:`crapssim.skip`. A subclass that overrides
+    update_bets or after_roll is not pure unless it sets this to True again itself."""
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # the flags describe the methods of the class that set them, so they
+        # aren't inherited by subclasses that replace those methods
+        if "completed" in cls.__dict__ and "completed_is_pure" not in cls.__dict__:
+            cls.completed_is_pure = False
+        if (
+            "update_bets" in cls.__dict__ or "after_roll" in cls.__dict__
+        ) and "update_is_pure" not in cls.__dict__:
+            cls.update_is_pure = False
+
     def after_roll(self, player: Player) -> None:
         """
         Update the Strategy after the dice are rolled but before the bets and the table are updated.
@@ -117,6 +141,8 @@ class AggregateStrategy(Strategy):
             The strategies to combine to make the new strategy.
         """
         self.strategies = strategies
+        self.completed_is_pure = all(x.completed_is_pure for x in strategies)
+        self.update_is_pure = all(x.update_is_pure for x in strategies)
 
     def update_bets(self, player: Player) -> None:
         """Go through each of the strategies and run its update_bets method if the strategy has
@@ -154,6 +180,9 @@ class AggregateStrategy(Strategy):
 class NullStrategy(Strategy):
     """Strategy that bets nothing."""
 
+    completed_is_pure = True
+    update_is_pure = True
+
     def update_bets(self, player: Player) -> None:
         pass
 
@@ -167,6 +196,8 @@ class NullStrategy(Strategy):
 class AddIfTrue(Strategy):
     """Strategy that places a bet if a given key taking Player as a parameter is True."""
 
+    completed_is_pure = True
+
     def __init__(self, bet: Bet, key: typing.Callable[[Player], bool]):
         """The strategy will place the given bet if the given key is True.
 
@@ -225,6 +256,8 @@ class RemoveIfTrue(Strategy):
     """Strategy that removes all bets that are True for a given key. The key takes the Bet and the
     Player as parameters."""
 
+    completed_is_pure = True
+
     def __init__(self, key: typing.Callable[["Bet", Player], bool]):
         """The strategy will remove all bets that are true for the given key.
 
@@ -274,6 +307,8 @@ class ReplaceIfTrue(Strategy):
     """Strategy that iterates through the bets on the table and if the given key is true, replaces
     the bet with the given bet."""
 
+    completed_is_pure = True
+
     def __init__(self, bet: Bet, key: typing.Callable[[Bet, Player], bool]):
         self.key = key
         self.bet = bet
@@ -315,6 +350,8 @@ class AddIfNotBet(AddIfTrue):
     """Strategy that adds a bet if it isn't on the table for that player. Equivalent of
     AddIfTrue(bet, lambda p: bet not in p.bets)"""
 
+    update_is_pure = True
+
     def __init__(self, bet: Bet):
         """The strategy adds the given bet object to the table if it is not already on the table.
 
@@ -334,6 +371,8 @@ class AddIfPointOff(AddIfTrue):
     table. Equivalent to AddIfTrue(bet, lambda p: p.table.point.status == "Off"
                                         and bet not in p.bets)"""
 
+    update_is_pure = True
+
     def __init__(self, bet: Bet):
         """Adds the given bet if the table point is Off and the player doesn't have that bet on the
         table.
@@ -356,6 +395,8 @@ class AddIfPointOn(AddIfTrue):
     table. Equivalent to AddIfTrue(bet, lambda p: p.table.point.status == "On"
                                         and bet not in p.bets)"""
 
+    update_is_pure = True
+
     def __init__(self, bet: Bet):
         """Add a bet if the point is On.
 
@@ -377,6 +418,8 @@ class AddIfNewShooter(AddIfTrue):
     table. Equivalent to AddIfTrue(bet, lambda p: p.table.new_shooter and bet not in p.bets)
     """
 
+    update_is_pure = True
+
     def __init__(self, bet: Bet):
         """Add a bet if the point is On.
 
@@ -396,6 +439,8 @@ class CountStrategy(AddIfTrue):
     type is less than the given count, it places the bet (if the bet isn't already on the table.)
     """
 
+    update_is_pure = True
+
     def __init__(
         self,
         bet_type: typing.Type[Bet] | tuple[typing.Type[Bet], ...],
@@ -451,6 +496,8 @@ class RemoveIfPointOff(RemoveIfTrue):
     This will match bets based on type, and number for Place and Hardway bets.
     It will not consider bet amounts when matching."""
 
+    update_is_pure = True
+
     def __init__(self, bet: Bet):
         if not any([isinstance(bet, x) for x in [Place, HardWay, Hop]]):
             key = (
@@ -487,6 +534,8 @@ class RemoveIfPointOff(RemoveIfTrue):
 class RemoveByType(RemoveIfTrue):
     """Remove any bets that are of the given type(s)."""
 
+    update_is_pure = True
+
     def __init__(self, bet_type: typing.Type[Bet] | tuple[typing.Type[Bet], ...]):
         super().__init__(lambda b, p: isinstance(b, bet_type))
 
@@ -495,6 +544,8 @@ class WinProgression(Strategy):
     """Strategy that every time a bet is won, moves to the next amount in the progression and
     places a Field bet for that amount."""
 
+    completed_is_pure = True
+
     def __init__(self, first_bet: Bet, multipliers: list[typing.SupportsFloat]) -> None:
         """Creates the given the progression.
 
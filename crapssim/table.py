@@ -5,8 +5,15 @@ from crapssim.dice import Dice
 
 from .bet import Bet, BetResult
 from .point import Point
+from .metrics import RiskMetrics
+from .money import as_amount
 from .strategy import BetPassLine, Strategy
 
+if typing.TYPE_CHECKING:
+    # only needed for type hints, and importing them would import numpy
+    from .kernel import BetKernel
+    from .trajectory import TrajectoryRecorder
+
 __all__ = ["TableUpdate", "TableSettings", "Table", "Player"]
 
 
@@ -24,12 +31,14 @@ class TableUpdate:
         self.run_strategies(table, run_complete, verbose)
         self.print_player_summary(table, verbose)
         self.before_roll(table)
+        self.record_bets_at_risk(table)
         self.update_table_stats(table)
         self.roll(table, dice_outcome, verbose)
         self.after_roll(table)
         self.update_bets(table, verbose)
         self.set_new_shooter(table)
         self.update_numbers(table, verbose)
+        self.record_players(table)
 
     @staticmethod
     def run_strategies(table: "Table", run_complete=False, verbose=False):
@@ -54,6 +63,15 @@ class TableUpdate:
     def before_roll(table: "Table"):
         pass
 
+    @staticmethod
+    def record_bets_at_risk(table: "Table"):
+        for player in table.players:
+            # the bets can only have changed if the player's version has
+            version = player.version
+            if version != player._at_risk_version:
+                player._at_risk_version = version
+                player.metrics.update_at_risk(player.total_bet_amount)
+
     @staticmethod
     def update_table_stats(table: "Table"):
         table.pass_rolls += 1
@@ -86,8 +104,10 @@ class TableUpdate:
 
     @staticmethod
     def update_bets(table: "Table", verbose=False):
+        # identical bets have the same outcome, so players share results
+        results: dict | None = {} if len(table.players) > 1 else None
         for player in table.players:
-            player.update_bet(verbose=verbose)
+            player.update_bet(verbose=verbose, results=results)
 
     @staticmethod
     def set_new_shooter(table: "Table"):
@@ -100,13 +120,27 @@ class TableUpdate:
     @staticmethod
     def update_numbers(table: "Table", verbose: bool):
         "For Come and DontCome bets that 'move' to their number"
-        for player, bet in table.yield_player_bets():
-            bet.update_number(table)
+        for player in table.players:
+            if player._bets.moving:
+                player._bets.update_numbers(table)
         table.point.update(table.dice)
 
         if verbose:
             print(f"Point is {table.point.status} ({table.point.number})")
 
+    @staticmethod
+    def record_players(table: "Table"):
+        "Update each player's risk metrics and trajectory recorder (if they have one)"
+        for player in table.players:
+            version = player.version
+            if version != player._metrics_version:
+                player._metrics_version = version
+                player.metrics.update(table.dice.n_rolls, player.total_player_cash)
+            else:
+                player.metrics.update_unchanged()
+            if player.recorder is not None:
+                player.recorder.record(table.dice.n_rolls, player.bankroll)
+
 
 class TableSettings(typing.TypedDict):
     """
@@ -151,13 +185,25 @@ class Table:
         How many shooters the table has had.
     new_shooter : bool
         Returns True if the previous shooters roll just ended and the next shooter hasn't shot.
+
+    Parameters
+    ----------
+    seed : int | None
+        Seed for the dice
+    dice : Dice | None
+        Dice to use instead of new dice, e.g. crapssim.corpus.ReplayDice to
+        replay recorded rolls. The seed is ignored when dice are given.
+    dice_backend : str
+        Random number generator for new dice, "numpy" or "python", see Dice.
     """
 
-    def __init__(self, seed: int | None = None) -> None:
+    def __init__(
+        self, seed: int | None = None, dice: Dice | None = None, dice_backend: str = "numpy"
+    ) -> None:
         self.players: list[Player] = []
         self.point: Point = Point()
         self.seed = seed
-        self.dice: Dice = Dice(self.seed)
+        self.dice: Dice = Dice(self.seed, dice_backend) if dice is None else dice
         self.settings: TableSettings = {
             "ATS_payouts": {"all": 150, "tall": 30, "small": 30},
             "field_payouts": {2: 2, 3: 1, 4: 1, 9: 1, 10: 1, 11: 1, 12: 2},
@@ -181,6 +227,8 @@ class Table:
         bankroll: typing.SupportsFloat = 100,
         strategy: Strategy = BetPassLine(5),
         name: str = None,
+        recorder: "TrajectoryRecorder | None" = None,
+        ruin_level: typing.SupportsFloat = 0,
     ) -> None:
         """Add player object to the table
 
@@ -193,12 +241,25 @@ class Table:
         name
             The players name, if None defaults to "Player x" with x being the current number
             of players starting with 0 (ex. Player 0, Player 1, Player 2).
+        recorder
+            Optional recorder for the players bankroll after every roll, see
+            crapssim.trajectory.
+        ruin_level
+            The player counts as busted in their metrics once their cash is at or
+            below this level, defaults to 0.
 
         """
         if name is None:
             name = f"Player {len(self.players)}"
         self.players.append(
-            Player(table=self, bankroll=bankroll, bet_strategy=strategy, name=name)
+            Player(
+                table=self,
+                bankroll=bankroll,
+                bet_strategy=strategy,
+                name=name,
+                recorder=recorder,
+                ruin_level=ruin_level,
+            )
         )
 
     def _setup_run(self, verbose: bool) -> None:
@@ -228,7 +289,9 @@ class Table:
         max_shooter: float | int = float("inf"),
         verbose: bool = True,
         runout: bool = False,
-    ) -> None:
+        skip_quiet_rolls: bool = False,
+        table_update: TableUpdate | None = None,
+    ) -> dict[str, RiskMetrics]:
         """
         Runs the craps table until a stopping condition is met.
 
@@ -242,6 +305,17 @@ class Table:
             If true, print results from table during each roll
         runout : bool
             If true, continue past max_rolls until player has no more bets on the table
+        skip_quiet_rolls : bool
+            If true, jump over stretches of rolls where nothing happens, see crapssim.skip.
+            Results are statistically the same, but differ for a given seed.
+            Only possible with random dice (Dice or WeightedDice).
+        table_update : TableUpdate | None
+            Roll logic to run, e.g. crapssim.kernel.KernelTableUpdate to settle
+            bets with the kernel. Defaults to TableUpdate.
+
+        Returns
+        -------
+        The risk metrics of each player, by player name.
         """
 
         self._setup_run(verbose)
@@ -249,10 +323,20 @@ class Table:
         # logic needs to count starting run as 0 shooters, not easy to set new_shooter in better way
         n_shooter_start = self.n_shooters if self.n_shooters != 1 else 0
 
+        if skip_quiet_rolls:
+            if table_update is not None:
+                raise ValueError("Can't skip quiet rolls with a custom table_update")
+            from crapssim.skip import SkipTableUpdate, check_skippable_dice
+
+            check_skippable_dice(self.dice)
+            table_update = SkipTableUpdate(roll_limit=max_rolls + n_rolls_start)
+        elif table_update is None:
+            table_update = TableUpdate()
+
         run_complete = False
         continue_rolling = True
         while continue_rolling:
-            TableUpdate().run(self, run_complete=run_complete, verbose=verbose)
+            table_update.run(self, run_complete=run_complete, verbose=verbose)
 
             run_complete = self.is_run_complete(
                 max_rolls + n_rolls_start, max_shooter + n_shooter_start
@@ -262,9 +346,11 @@ class Table:
                 self.n_shooters -= 1  # count was added but this shooter never rolled
                 TableUpdate().print_player_summary(self, verbose=verbose)
 
+        return self.player_metrics
+
     def fixed_run(
         self, dice_outcomes: typing.Iterable[typing.Iterable], verbose: bool = False
-    ) -> None:
+    ) -> dict[str, RiskMetrics]:
         """
         Give a series of fixed dice outcome and run as if that is what was rolled.
 
@@ -274,12 +360,18 @@ class Table:
             Iterable with two integers representing the dice faces.
         verbose
             If true, print results from table during each roll
+
+        Returns
+        -------
+        The risk metrics of each player, by player name.
         """
         self._setup_run(verbose=verbose)
 
         for dice_outcome in dice_outcomes:
             TableUpdate().run(self, dice_outcome, verbose=verbose)
 
+        return self.player_metrics
+
     def is_run_complete(
         self,
         max_rolls: float | int,
@@ -302,7 +394,7 @@ class Table:
         return (
             self.dice.n_rolls >= max_rolls
             or self.n_shooters > max_shooter
-            or all(x.strategy.completed(x) for x in self.players)
+            or all(x.strategy_completed() for x in self.players)
         )
 
     def should_keep_rolling(self, run_complete: bool, runout: bool) -> bool:
@@ -341,6 +433,13 @@ class Table:
         """
         return sum([len(p.bets) for p in self.players]) > 0
 
+    @property
+    def player_metrics(self) -> dict[str, RiskMetrics]:
+        """
+        Returns the risk metrics of each player, by player name.
+        """
+        return {p.name: p.metrics for p in self.players}
+
     @property
     def total_player_cash(self) -> float:
         """
@@ -353,6 +452,134 @@ class Table:
         return sum([p.total_player_cash for p in self.players])
 
 
+class _TrackedBets(list):
+    """
+    List of a player's bets that updates the player's version when changed.
+
+    The bets whose number can still change (see :py:attr:`crapssim.bet.Bet.moving`)
+    are also kept in ``moving``, so the table only visits those bets when
+    updating numbers after a roll. If the bets are settled with
+    :py:mod:`crapssim.kernel`, the list also keeps the player's
+    :py:class:`~crapssim.kernel.BetKernel` in ``kernel`` up to date, so each
+    bet is only encoded once.
+    """
+
+    __slots__ = ("_player", "moving", "kernel")
+
+    def __init__(self, player: "Player", bets: typing.Iterable[Bet] = ()) -> None:
+        super().__init__(bets)
+        self._player = player
+        self.moving: list[Bet] = [bet for bet in self if bet.moving]
+        self.kernel: "BetKernel | None" = None
+
+    def __reduce__(self) -> tuple:
+        # rebuilt with its player and bets, so copies and pickles don't go
+        # through append, which needs a complete player, and the index of
+        # moving bets is built once from the bets
+        return type(self), (self._player, list(self))
+
+    def _changed(self) -> None:
+        self._player._version += 1
+
+    def _reindex(self) -> None:
+        self.moving = [bet for bet in self if bet.moving]
+        self.kernel = None
+        self._changed()
+
+    def _discard(self, bet: Bet) -> None:
+        # by identity, since equal bets can be different objects
+        moving = self.moving
+        for i, x in enumerate(moving):
+            if x is bet:
+                del moving[i]
+                return
+
+    def update_numbers(self, table: "Table") -> None:
+        """Update the numbers of the moving bets, and drop the ones that moved."""
+        moving = self.moving
+        for bet in moving:
+            bet.update_number(table)
+        moved = [bet for bet in moving if not bet.moving]
+        if not moved:
+            return
+        # bets that have moved to their number stay there
+        self.moving = [bet for bet in moving if bet.moving]
+        kernel = self.kernel
+        if kernel is not None:
+            for bet in moved:
+                kernel.refresh(next(i for i, x in enumerate(self) if x is bet))
+
+    def append(self, bet: Bet) -> None:
+        super().append(bet)
+        if bet.moving:
+            self.moving.append(bet)
+        if self.kernel is not None:
+            self.kernel.insert(len(self.kernel), bet)
+        self._changed()
+
+    def extend(self, bets: typing.Iterable[Bet]) -> None:
+        bets = list(bets)
+        super().extend(bets)
+        self.moving.extend(bet for bet in bets if bet.moving)
+        if self.kernel is not None:
+            for bet in bets:
+                self.kernel.insert(len(self.kernel), bet)
+        self._changed()
+
+    def insert(self, index: typing.SupportsIndex, bet: Bet) -> None:
+        super().insert(index, bet)
+        if bet.moving:
+            self.moving.append(bet)
+        if self.kernel is not None:
+            self.kernel.insert(index, bet)
+        self._changed()
+
+    def remove(self, bet: Bet) -> None:
+        self.pop(self.index(bet))
+
+    def pop(self, index: typing.SupportsIndex = -1) -> Bet:
+        bet = super().pop(index)
+        self._discard(bet)
+        if self.kernel is not None:
+            self.kernel.pop(index)
+        self._changed()
+        return bet
+
+    def clear(self) -> None:
+        super().clear()
+        self.moving.clear()
+        if self.kernel is not None:
+            self.kernel.clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self.kernel = None
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.kernel = None
+        self._changed()
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._reindex()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._reindex()
+
+    def __iadd__(self, bets: typing.Iterable[Bet]) -> "_TrackedBets":
+        self.extend(bets)
+        return self
+
+    def __imul__(self, n: typing.SupportsIndex) -> "_TrackedBets":
+        super().__imul__(n)
+        self._reindex()
+        return self
+
+
 class Player:
     """
     Player standing at the craps table
@@ -360,11 +587,17 @@ class Player:
     Parameters
     ----------
     bankroll : typing.SupportsFloat
-        Starting amount of cash for the player
+        Starting amount of cash for the player, in crapssim.money.Cents for
+        exact integer money
     bet_strategy : function(table, player, unit=5)
         A function that implements a particular betting strategy.  See betting_strategies.py
     name : string, default = "Player"
         Name of the player
+    recorder : TrajectoryRecorder | None, default = None
+        Records the bankroll after every roll, starting with the initial bankroll
+    ruin_level : typing.SupportsFloat, default = 0
+        The player counts as busted in their metrics once their cash is at or below
+        this level
 
     Attributes
     ----------
@@ -376,6 +609,10 @@ class Player:
         A function that implements a particular betting strategy. See betting_strategies.py.
     bets : list
         List of betting objects for the player
+    metrics : RiskMetrics
+        Drawdown, peak and other risk metrics, updated after every roll
+    version : int
+        Changes whenever the bankroll or the list of bets changes
     """
 
     def __init__(
@@ -384,16 +621,65 @@ class Player:
         bankroll: typing.SupportsFloat,
         bet_strategy: Strategy = BetPassLine(5),
         name: str = "Player",
+        recorder: "TrajectoryRecorder | None" = None,
+        ruin_level: typing.SupportsFloat = 0,
     ):
-        self.bankroll: float = float(bankroll)
+        self._version: int = 0
+        self._version_bankroll: float = as_amount(bankroll)
+        self._completed_cache: tuple[int, Strategy | None, bool] = (-1, None, False)
+        self.bankroll: float = as_amount(bankroll)
         self.strategy: Strategy = copy.deepcopy(bet_strategy)
         self.name: str = name
         self.bets: list[Bet] = []
         self._table: Table = table
+        self.recorder: "TrajectoryRecorder | None" = recorder
+        self.metrics: RiskMetrics = RiskMetrics(self.bankroll, float(ruin_level))
+        self._metrics_version: int = self._version
+        self._at_risk_version: int = -1
+        self._base_amounts_key: tuple = ()
+        self._base_amounts: dict[type, dict[tuple[int, ...], float]] = {}
+        if recorder is not None:
+            recorder.record(table.dice.n_rolls, self.bankroll)
+
+    @property
+    def version(self) -> int:
+        """Changes whenever the player's bankroll or bets change."""
+        # changes to the list of bets update the version right away, while the
+        # bankroll (a plain attribute, since it's updated so often) is checked here
+        if self.bankroll != self._version_bankroll:
+            self._version_bankroll = self.bankroll
+            self._version += 1
+        return self._version
+
+    @property
+    def bets(self) -> list[Bet]:
+        return self._bets
+
+    @bets.setter
+    def bets(self, bets: typing.Iterable[Bet]) -> None:
+        self._bets = _TrackedBets(self, bets)
+        self._version += 1
+
+    def strategy_completed(self) -> bool:
+        """
+        Returns strategy.completed(player). If the strategy's completed only
+        depends on the bankroll and bets (Strategy.completed_is_pure), the result
+        is reused until the player's version changes.
+        """
+        strategy = self.strategy
+        if not strategy.completed_is_pure:
+            return strategy.completed(self)
+
+        version = self.version
+        cached_version, cached_strategy, completed = self._completed_cache
+        if cached_version != version or cached_strategy is not strategy:
+            completed = strategy.completed(self)
+            self._completed_cache = (version, strategy, completed)
+        return completed
 
     @property
     def total_bet_amount(self) -> float:
-        return sum(x.amount for x in self.bets)
+        return sum(x.amount for x in self._bets)
 
     @property
     def total_player_cash(self) -> float:
@@ -409,10 +695,34 @@ class Player:
         amount_available_to_bet = self.bankroll + sum(x.amount for x in existing_bets)
 
         if new_bet.is_allowed(self) and new_bet.amount <= amount_available_to_bet:
-            for bet in existing_bets:
-                self.bets.remove(bet)
+            for existing_bet in existing_bets:
+                self._bets.remove(existing_bet)
             self.bankroll -= bet.amount
-            self.bets.append(new_bet)
+            self._bets.append(new_bet)
+
+    def base_bet_amounts(
+        self, base_type: typing.Type[Bet]
+    ) -> dict[tuple[int, ...], float]:
+        """
+        Total amount of the player's bets of base_type (e.g. Come) by the bets'
+        winning numbers, which limits the odds on those bets. The amounts are
+        computed once and shared by all odds bets and strategies until the
+        player's bets, the point or the roll changes.
+        """
+        table = self._table
+        key = (table.dice.n_rolls, self.version, table.point.number)
+        if key != self._base_amounts_key:
+            self._base_amounts_key = key
+            self._base_amounts = {}
+
+        amounts = self._base_amounts.get(base_type)
+        if amounts is None:
+            amounts = self._base_amounts[base_type] = {}
+            for bet in self._bets:
+                if isinstance(bet, base_type):
+                    numbers = tuple(bet.get_winning_numbers(table))
+                    amounts[numbers] = amounts.get(numbers, 0) + bet.amount
+        return amounts
 
     def already_placed_bets(self, bet: Bet) -> list[Bet]:
         """
@@ -420,7 +730,7 @@ class Player:
 
         Notably, bets like Place(4, 1.0) will not match to Place(6, 1.0).
         """
-        return [x for x in self.bets if x._placed_key == bet._placed_key]
+        return [x for x in self._bets if x._placed_key == bet._placed_key]
 
     def already_placed(self, bet: Bet) -> bool:
         return len(self.already_placed_bets(bet)) > 0
@@ -433,7 +743,7 @@ class Player:
 
         Notably, bets like Place(4, 1.0) will match to Place(6, 1.0).
         """
-        return [x for x in self.bets if isinstance(x, bet_type)]
+        return [x for x in self._bets if isinstance(x, bet_type)]
 
     def has_bets(self, bet_type: typing.Type[Bet] | tuple[typing.Type[Bet], ...]):
         return len(self.get_bets_by_type(bet_type)) > 0
@@ -448,16 +758,31 @@ class Player:
         if self.strategy is not None:
             self.strategy.update_bets(self)
 
-    def update_bet(self, verbose: bool = False) -> None:
-        for bet in self.bets[:]:
-            result: BetResult = bet.get_result(self.table)
+    def update_bet(self, verbose: bool = False, results: dict | None = None) -> None:
+        """
+        Resolve the player's bets for the current roll.
+
+        Parameters
+        ----------
+        verbose
+            Print the result of each bet.
+        results
+            Results shared between players for this roll, see
+            :py:meth:`crapssim.bet.Bet.get_shared_result`. If None, each bet's
+            result is computed on its own.
+        """
+        for bet in self._bets[:]:
+            if results is None:
+                result: BetResult = bet.get_result(self._table)
+            else:
+                result = bet.get_shared_result(self._table, results)
             self.bankroll += result.bankroll_change
 
             if verbose:
                 self.print_bet_update(bet, result)
 
             if result.remove:
-                self.bets.remove(bet)
+                self._bets.remove(bet)
 
     def print_bet_update(self, bet: Bet, result: BetResult) -> None:
         if result.won:
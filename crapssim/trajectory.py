@@ -0,0 +1,235 @@
+"""
+Recorders capture a player's bankroll over the course of a run with bounded
+memory. A recorder is given to a player when they are added to the table
+(``table.add_player(..., recorder=RingBufferRecorder(1_000))``) and is updated
+after every roll. Recorders from many sessions can be combined into a 2-D
+array with :func:`stack_trajectories`, e.g. for plotting percentile bands.
+"""
+
+import typing
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+__all__ = [
+    "TrajectoryRecorder",
+    "RingBufferRecorder",
+    "DecimatingRecorder",
+    "MinMaxRecorder",
+    "stack_trajectories",
+]
+
+
+class TrajectoryRecorder(ABC):
+    """Records a bankroll (or any value) along with the roll it was recorded on."""
+
+    @abstractmethod
+    def record(self, roll: int, value: float) -> None:
+        """Record the value after the given roll (zero for the starting value)."""
+
+    @property
+    @abstractmethod
+    def rolls(self) -> np.ndarray:
+        """Roll numbers of the recorded values, in increasing order."""
+
+    @property
+    @abstractmethod
+    def values(self) -> np.ndarray:
+        """Recorded values, one for each of the rolls."""
+
+    def to_array(self) -> np.ndarray:
+        """Two row array with the roll numbers and the recorded values."""
+        return np.vstack([self.rolls, self.values])
+
+    def __len__(self) -> int:
+        return len(self.rolls)
+
+
+class RingBufferRecorder(TrajectoryRecorder):
+    """
+    Keeps the most recent values in a fixed size buffer.
+
+    Args:
+        capacity: Maximum number of values kept.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._rolls = np.zeros(capacity, dtype=np.int64)
+        self._values = np.zeros(capacity, dtype=np.float64)
+        self._n_recorded = 0
+
+    def record(self, roll: int, value: float) -> None:
+        i = self._n_recorded % self.capacity
+        self._rolls[i] = roll
+        self._values[i] = value
+        self._n_recorded += 1
+
+    def _order(self) -> np.ndarray:
+        if self._n_recorded <= self.capacity:
+            return np.arange(self._n_recorded)
+        start = self._n_recorded % self.capacity
+        return np.roll(np.arange(self.capacity), -start)
+
+    @property
+    def rolls(self) -> np.ndarray:
+        return self._rolls[self._order()]
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values[self._order()]
+
+
+class DecimatingRecorder(TrajectoryRecorder):
+    """
+    Keeps every ``stride``-th value. When the buffer fills up, every other
+    value is dropped and the stride doubles, so the whole run is covered with
+    at most ``max_points`` values.
+
+    Args:
+        max_points: Maximum number of values kept, must be even.
+        stride: Starting number of rolls between kept values.
+    """
+
+    def __init__(self, max_points: int, stride: int = 1) -> None:
+        if max_points < 2 or max_points % 2:
+            raise ValueError("max_points must be an even number of at least 2")
+        self.max_points = max_points
+        self.stride = stride
+        self._rolls = np.zeros(max_points, dtype=np.int64)
+        self._values = np.zeros(max_points, dtype=np.float64)
+        self._n = 0
+        self._n_seen = 0
+
+    def record(self, roll: int, value: float) -> None:
+        n_seen = self._n_seen
+        self._n_seen += 1
+        if n_seen % self.stride:
+            return
+        if self._n == self.max_points:
+            half = self.max_points // 2
+            self._rolls[:half] = self._rolls[::2]
+            self._values[:half] = self._values[::2]
+            self._n = half
+            self.stride *= 2
+            if n_seen % self.stride:
+                return
+        self._rolls[self._n] = roll
+        self._values[self._n] = value
+        self._n += 1
+
+    @property
+    def rolls(self) -> np.ndarray:
+        return self._rolls[: self._n].copy()
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values[: self._n].copy()
+
+
+class MinMaxRecorder(TrajectoryRecorder):
+    """
+    Min-max downsampling: the run is split into buckets of ``bucket_size``
+    values, and the minimum, maximum and last value of each bucket are kept.
+    When all buckets are used, neighbouring buckets are merged and the bucket
+    size doubles, so memory stays bounded while extremes are never lost.
+
+    Args:
+        max_buckets: Maximum number of buckets kept, must be even.
+        bucket_size: Starting number of values per bucket.
+    """
+
+    def __init__(self, max_buckets: int, bucket_size: int = 1) -> None:
+        if max_buckets < 2 or max_buckets % 2:
+            raise ValueError("max_buckets must be an even number of at least 2")
+        self.max_buckets = max_buckets
+        self.bucket_size = bucket_size
+        self._rolls = np.zeros(max_buckets, dtype=np.int64)
+        self._values = np.zeros(max_buckets, dtype=np.float64)
+        self._minimums = np.zeros(max_buckets, dtype=np.float64)
+        self._maximums = np.zeros(max_buckets, dtype=np.float64)
+        self._n = 0
+        self._n_in_bucket = 0
+
+    def _merge_buckets(self) -> None:
+        half = self.max_buckets // 2
+        self._rolls[:half] = self._rolls[1::2]
+        self._values[:half] = self._values[1::2]
+        self._minimums[:half] = np.minimum(self._minimums[::2], self._minimums[1::2])
+        self._maximums[:half] = np.maximum(self._maximums[::2], self._maximums[1::2])
+        self._n = half
+        self.bucket_size *= 2
+
+    def record(self, roll: int, value: float) -> None:
+        if self._n == 0 or self._n_in_bucket == self.bucket_size:
+            if self._n == self.max_buckets:
+                # all buckets are full, so each merged bucket is full too
+                self._merge_buckets()
+            self._minimums[self._n] = value
+            self._maximums[self._n] = value
+            self._n += 1
+            self._n_in_bucket = 0
+
+        i = self._n - 1
+        self._rolls[i] = roll
+        self._values[i] = value
+        self._minimums[i] = min(self._minimums[i], value)
+        self._maximums[i] = max(self._maximums[i], value)
+        self._n_in_bucket += 1
+
+    @property
+    def rolls(self) -> np.ndarray:
+        """Last roll in each bucket."""
+        return self._rolls[: self._n].copy()
+
+    @property
+    def values(self) -> np.ndarray:
+        """Last value in each bucket."""
+        return self._values[: self._n].copy()
+
+    @property
+    def minimums(self) -> np.ndarray:
+        """Minimum value in each bucket."""
+        return self._minimums[: self._n].copy()
+
+    @property
+    def maximums(self) -> np.ndarray:
+        """Maximum value in each bucket."""
+        return self._maximums[: self._n].copy()
+
+
+def stack_trajectories(
+    recorders: typing.Iterable[TrajectoryRecorder],
+    rolls: typing.Sequence[int] | np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Combine the recorded trajectories from many sessions into one array.
+
+    Each trajectory is evaluated at the given roll numbers, using the most
+    recent recorded value at or before each roll. Rolls after the end of a
+    session keep the session's final value, and rolls before the first
+    recorded value (e.g. dropped by a ring buffer) are NaN.
+
+    Args:
+        recorders: The recorders, one per session.
+        rolls: Roll numbers to evaluate the trajectories at. Defaults to every
+            roll up to the longest session.
+
+    Returns:
+        Array of shape (number of recorders, number of rolls).
+    """
+    recorders = list(recorders)
+    if rolls is None:
+        last_roll = max((int(r.rolls[-1]) for r in recorders if len(r)), default=0)
+        rolls = np.arange(last_roll + 1)
+    rolls = np.asarray(rolls)
+
+    out = np.full((len(recorders), len(rolls)), np.nan)
+    for i, recorder in enumerate(recorders):
+        recorded_rolls, values = recorder.rolls, recorder.values
+        idx = np.searchsorted(recorded_rolls, rolls, side="right") - 1
+        valid = idx >= 0
+        out[i, valid] = values[idx[valid]]
+    return out
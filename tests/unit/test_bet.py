@@ -173,12 +173,10 @@ def test_copy_returns_equal_bet(bet):
 
 def test_come_equality():
     come_one = Come(5)
-    come_one.point = 5
-    come_one.new_point = True
+    come_one.number = 5
 
     come_two = Come(5)
-    come_two.point = 5
-    come_two.new_point = True
+    come_two.number = 5
 
     assert come_one == come_two
 
@@ -195,24 +193,20 @@ def test_come_point_inequality():
 
 def test_dont_come_equality():
     dont_come_one = DontCome(5)
-    dont_come_one.point = 5
-    dont_come_one.new_point = True
+    dont_come_one.number = 5
 
     dont_come_two = DontCome(5)
-    dont_come_two.point = 5
-    dont_come_two.new_point = True
+    dont_come_two.number = 5
 
     assert dont_come_one == dont_come_two
 
 
 def test_dont_come_point_inequality():
     dont_come_one = DontCome(5)
-    dont_come_one.point = 5
-    dont_come_one.new_point = True
+    dont_come_one.number = 5
 
     dont_come_two = Come(5)
-    dont_come_two.point = 8
-    dont_come_two.new_point = True
+    dont_come_two.number = 8
 
     assert dont_come_one != dont_come_two
 
@@ -321,3 +315,183 @@ def test_hop_inequality():
 
     assert hop_one != hop_two
     assert hop_one != hop_three
+
+
+@pytest.mark.parametrize(
+    "bet",
+    [
+        crapssim.bet.PassLine(1),
+        crapssim.bet.Come(1, 6),
+        crapssim.bet.Odds(crapssim.bet.DontCome, 10, 1, True),
+        crapssim.bet.Place(8, 1),
+        crapssim.bet.HardWay(4, 1),
+        crapssim.bet.Hop((2, 3), 1),
+        crapssim.bet.Fire(1),
+        crapssim.bet.Small(1),
+    ],
+)
+def test_bets_have_no_instance_dict(bet):
+    assert not hasattr(bet, "__dict__")
+
+
+def test_bet_add_keeps_attributes():
+    bet = Odds(Come, 8, 5, True) + Odds(Come, 8, 10, True)
+
+    assert isinstance(bet, Odds)
+    assert (bet.base_type, bet.number, bet.amount, bet.always_working) == (
+        Come,
+        8,
+        15.0,
+        True,
+    )
+
+
+def test_bet_add_does_not_change_original():
+    bet = Come(5, 6)
+    new_bet = bet - 2.0
+
+    assert (bet.amount, new_bet.amount, new_bet.number) == (5.0, 3.0, 6)
+
+
+def test_placed_key_updates_when_come_moves():
+    table = Table()
+    table.point.number = 6
+    bet = Come(5)
+    assert bet._placed_key == (Come, None)
+
+    table.dice.fixed_roll((4, 4))
+    bet.update_number(table)
+
+    assert bet._placed_key == (Come, 8)
+    assert bet == Come(5, 8)
+    assert hash(bet) == hash(Come(5, 8))
+
+
+def test_hash_key_updates_when_amount_changes():
+    bet = PassLine(5)
+    assert bet == PassLine(5)
+
+    bet.amount = 10.0
+
+    assert bet._hash_key == (PassLine, 10.0)
+    assert bet != PassLine(5)
+    assert bet == PassLine(10)
+
+
+def test_added_bet_has_new_hash_key():
+    bet = Come(5, 6)
+    assert bet == Come(5, 6)
+
+    new_bet = bet + Come(10, 6)
+
+    assert new_bet == Come(15, 6)
+    assert bet == Come(5, 6)
+
+
+SHARED_BETS = [
+    PassLine(5),
+    Come(5),
+    Come(5, 4),
+    crapssim.bet.DontPass(5),
+    DontCome(5, 10),
+    Odds(PassLine, 6, 12),
+    Odds(PassLine, 6, 12, True),
+    Odds(Come, 5, 7, True),
+    Odds(crapssim.bet.DontPass, 4, 30),
+    Odds(DontCome, 9, 13),
+    crapssim.bet.Place(6, 12),
+    crapssim.bet.Place(9, 3),
+    crapssim.bet.Field(5),
+    CAndE(3),
+    crapssim.bet.Any7(1),
+    crapssim.bet.Yo(1),
+    crapssim.bet.HardWay(6, 3),
+    Hop((2, 3), 1),
+    Hop((4, 4), 1),
+]
+
+
+@pytest.mark.parametrize("point", [None, 4, 6, 9])
+def test_shared_result_matches_get_result(point):
+    table = Table()
+    table.point.number = point
+    for d1 in range(1, 7):
+        for d2 in range(1, 7):
+            table.dice.fixed_roll((d1, d2))
+            results = {}
+            for amount in (5, 7.5, 12, 0.1):
+                for bet in SHARED_BETS:
+                    bet = bet._copy_with_amount(amount)
+                    shared = bet.get_shared_result(table, results)
+                    assert shared == bet.get_result(table)
+
+
+def test_shared_result_odds_working_not_mixed():
+    table = Table()
+    table.dice.fixed_roll((3, 3))
+    results = {}
+    off = Odds(PassLine, 6, 10).get_shared_result(table, results)
+    working = Odds(PassLine, 6, 10, True).get_shared_result(table, results)
+    assert off.pushed and working.won
+
+
+def test_shared_result_skips_stateful_bets():
+    table = Table()
+    table.dice.fixed_roll((2, 2))
+    results = {}
+    crapssim.bet.Fire(1).get_shared_result(table, results)
+    crapssim.bet.All(1).get_shared_result(table, results)
+    assert results == {}
+
+
+def test_shared_result_skips_subclasses():
+    class DoublePassLine(PassLine):
+        __slots__ = ()
+
+        def get_result(self, table):
+            result = super().get_result(table)
+            return crapssim.bet.BetResult(
+                result.amount * 2, result.remove, result.bet_amount
+            )
+
+    table = Table()
+    table.dice.fixed_roll((3, 4))
+    results = {}
+    assert PassLine(5).get_shared_result(table, results).amount == 10
+    assert DoublePassLine(5).get_shared_result(table, results).amount == 20
+
+
+def test_number_mask_round_trip():
+    assert crapssim.bet.number_mask([4]) == 0b10000
+    assert crapssim.bet.mask_numbers(crapssim.bet.number_mask({2, 6, 12})) == {2, 6, 12}
+    assert crapssim.bet.Fire.complete_mask == crapssim.bet.number_mask([4, 5, 6, 8, 9, 10])
+    assert crapssim.bet.Small.complete_mask == crapssim.bet.number_mask(range(2, 7))
+
+
+def test_fire_points_mask():
+    table = Table()
+    fire = crapssim.bet.Fire(1)
+    for point, roll in [(4, (2, 2)), (6, (3, 3)), (4, (1, 3)), (8, (2, 3))]:
+        table.point.number = point
+        table.dice.fixed_roll(roll)
+        fire.get_result(table)
+
+    assert fire.points_made == {4, 6}
+    assert fire.n_points_made == 2
+    fire.points_made = [4, 5, 6, 8, 9]
+    assert fire.points_mask == crapssim.bet.number_mask([4, 5, 6, 8, 9])
+
+
+def test_all_tall_small_rolled_mask():
+    table = Table()
+    bet = crapssim.bet.Tall(1)
+    for roll in [(4, 4), (1, 1), (6, 6), (4, 4), (5, 5)]:
+        table.dice.fixed_roll(roll)
+        assert not bet.get_result(table).remove
+
+    assert bet.rolled_numbers == {8, 10, 12}
+    assert bet.n_rolled == 3
+    for roll in [(4, 5), (5, 6)]:
+        table.dice.fixed_roll(roll)
+        result = bet.get_result(table)
+    assert result.won and result.remove
@@ -0,0 +1,95 @@
+import os
+
+import pytest
+
+import crapssim.cache
+from crapssim.bet import Field
+from crapssim.cache import ResultCache, cache_key, strategy_identity
+from crapssim.runner import run_sessions
+from crapssim.strategy import BetPassLine, BetPlace
+from crapssim.strategy.tools import AddIfTrue
+from crapssim.table import Table
+
+SETTINGS = Table().settings
+PASS_SPEC = {"type": "single", "bet": {"type": "PassLine", "amount": 5}}
+
+
+def test_cache_roundtrip(tmp_path):
+    cache = ResultCache(tmp_path)
+    assert cache.get("a") is None
+    cache.put("a", [{"x": 1.5, "y": None}])
+    assert "a" in cache
+    assert cache.get("a") == [{"x": 1.5, "y": None}]
+    assert ResultCache(tmp_path).get("a") == [{"x": 1.5, "y": None}]
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(tmp_path, max_bytes=10_000)
+    value = "x" * 3000
+    for i, key in enumerate("abc"):
+        cache.put(key, value)
+        os.utime(cache.path / f"{key}.json", ns=(i * 10**9, i * 10**9))
+    cache.get("a")  # now the most recently used
+    cache.put("d", value)
+
+    assert "b" not in cache
+    assert all(key in cache for key in "acd")
+    assert cache.size <= 10_000
+
+
+def test_cache_clear(tmp_path):
+    cache = ResultCache(tmp_path)
+    cache.put("a", 1)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_cache_key_stable_and_specific():
+    key = cache_key({"p": BetPassLine(5)}, SETTINGS, seed=1, n_sim=10)
+    assert key == cache_key({"p": BetPassLine(5)}, dict(SETTINGS), n_sim=10, seed=1)
+    assert key != cache_key({"p": BetPassLine(10)}, SETTINGS, seed=1, n_sim=10)
+    assert key != cache_key({"p": BetPassLine(5)}, SETTINGS, seed=2, n_sim=10)
+    settings = dict(SETTINGS, field_payouts={**SETTINGS["field_payouts"], 12: 3})
+    assert key != cache_key({"p": BetPassLine(5)}, settings, seed=1, n_sim=10)
+
+
+def test_cache_key_changes_with_engine(monkeypatch):
+    key = cache_key({"p": BetPassLine(5)}, SETTINGS, seed=1)
+    monkeypatch.setattr(crapssim.cache, "engine_fingerprint", lambda: "other")
+    assert cache_key({"p": BetPassLine(5)}, SETTINGS, seed=1) != key
+
+
+def test_strategy_identity():
+    assert strategy_identity(PASS_SPEC).startswith("spec:")
+    assert strategy_identity(BetPlace({6: 6})) == "repr:" + repr(BetPlace({6: 6}))
+    with pytest.raises(ValueError):
+        strategy_identity(AddIfTrue(Field(5), lambda p: True))
+
+
+def test_run_sessions_uses_cache(tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path)
+    kwargs = dict(n_sim=3, max_rolls=20, seed=4, cache=cache)
+    records = run_sessions({"pass": BetPassLine(5)}, **kwargs)
+    assert len(cache) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("simulated instead of using the cache")
+
+    monkeypatch.setattr(Table, "run", fail)
+    assert run_sessions({"pass": BetPassLine(5)}, **kwargs) == records
+
+
+def test_run_sessions_with_spec_matches_strategy(tmp_path):
+    kwargs = dict(n_sim=3, max_rolls=20, seed=4)
+    cache = ResultCache(tmp_path)
+    records = run_sessions({"pass": PASS_SPEC}, cache=cache, **kwargs)
+    assert records == run_sessions({"pass": BetPassLine(5)}, **kwargs)
+    assert run_sessions({"pass": PASS_SPEC}, cache=cache, **kwargs) == records
+
+
+def test_run_sessions_skips_unstable_strategies(tmp_path):
+    cache = ResultCache(tmp_path)
+    strategy = AddIfTrue(Field(5), lambda p: p.table.point.status == "On")
+    with pytest.warns(UserWarning, match="Not caching"):
+        run_sessions({"field": strategy}, n_sim=2, max_rolls=10, seed=1, cache=cache)
+    assert len(cache) == 0
@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from crapssim.corpus import (
+    DiceCorpus,
+    DiceCorpusWriter,
+    ReplayDice,
+    pack_outcomes,
+    unpack_outcomes,
+)
+from crapssim.dice import Dice
+from crapssim.strategy.examples import IronCross
+from crapssim.table import Table
+
+ALL_OUTCOMES = [(d1, d2) for d1 in range(1, 7) for d2 in range(1, 7)]
+
+
+def test_pack_unpack_round_trip():
+    packed = pack_outcomes(ALL_OUTCOMES)
+    assert packed.dtype == np.uint8
+    assert len(packed) == 36
+    assert [tuple(x) for x in unpack_outcomes(packed).tolist()] == ALL_OUTCOMES
+
+
+@pytest.mark.parametrize("outcome", [(0, 3), (3, 7)])
+def test_pack_invalid_face(outcome):
+    with pytest.raises(ValueError):
+        pack_outcomes([outcome])
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    rng = np.random.default_rng(0)
+    with DiceCorpusWriter(tmp_path) as writer:
+        writer.add(1, 0, ALL_OUTCOMES)
+        writer.add(1, 1, rng.integers(1, 7, size=(500, 2)))
+        writer.add(2, 0, pack_outcomes([(6, 6)]))
+    return DiceCorpus(tmp_path)
+
+
+def test_corpus_index(corpus):
+    assert len(corpus) == 3
+    assert corpus.keys() == [(1, 0), (1, 1), (2, 0)]
+    assert (2, 0) in corpus and (2, 1) not in corpus
+    assert corpus.n_rolls == 537
+
+
+def test_corpus_outcomes(corpus):
+    assert list(corpus.outcomes(1, 0)) == ALL_OUTCOMES
+    assert list(corpus.outcomes(2, 0)) == [(6, 6)]
+
+
+def test_corpus_lookup_out_of_order(tmp_path):
+    keys = [(5, 3), (2, 7), (5, 0), (-1, 2), (2, 1)]
+    with DiceCorpusWriter(tmp_path) as writer:
+        for i, (seed, session) in enumerate(keys):
+            writer.add(seed, session, [ALL_OUTCOMES[i]])
+    corpus = DiceCorpus(tmp_path)
+
+    assert corpus.keys() == keys
+    for i, (seed, session) in enumerate(keys):
+        assert list(corpus.outcomes(seed, session)) == [ALL_OUTCOMES[i]]
+    assert (5, 1) not in corpus and (3, 0) not in corpus and (6, 3) not in corpus
+
+
+def test_corpus_missing_session(corpus):
+    with pytest.raises(KeyError):
+        corpus.session(3, 0)
+
+
+def test_writer_duplicate_session(tmp_path):
+    with DiceCorpusWriter(tmp_path) as writer:
+        writer.add(1, 0, [(1, 1)])
+        with pytest.raises(ValueError):
+            writer.add(1, 0, [(2, 2)])
+
+
+def test_replay_dice(corpus):
+    dice = ReplayDice(corpus.session(1, 0))
+    for outcome in ALL_OUTCOMES:
+        dice.roll()
+        assert dice.result == outcome
+        assert dice.total == sum(outcome)
+    assert dice.n_rolls == 36
+    assert dice.remaining == 0
+
+    with pytest.raises(IndexError):
+        dice.roll()
+
+
+def test_replay_matches_fixed_run(corpus):
+    replayed = Table(dice=ReplayDice(corpus.session(1, 1)))
+    replayed.add_player(bankroll=10_000, strategy=IronCross(5))
+    replayed.run(max_rolls=500, verbose=False)
+
+    fixed = Table()
+    fixed.add_player(bankroll=10_000, strategy=IronCross(5))
+    fixed.fixed_run(corpus.outcomes(1, 1))
+
+    assert replayed.dice.n_rolls == fixed.dice.n_rolls == 500
+    assert replayed.players[0].bankroll == fixed.players[0].bankroll
+    assert replayed.players[0].bets == fixed.players[0].bets
+
+
+def test_replay_recorded_dice(tmp_path):
+    dice = Dice(seed=3)
+    outcomes = []
+    for _ in range(100):
+        dice.roll()
+        outcomes.append(dice.result)
+
+    with DiceCorpusWriter(tmp_path) as writer:
+        writer.add(3, 0, outcomes)
+
+    replay_dice = ReplayDice(DiceCorpus(tmp_path).session(3, 0))
+    seeded, replayed = Table(seed=3), Table(dice=replay_dice)
+    for table in (seeded, replayed):
+        table.add_player(bankroll=10_000, strategy=IronCross(5))
+        table.run(max_rolls=100, verbose=False)
+    assert seeded.players[0].bankroll == replayed.players[0].bankroll
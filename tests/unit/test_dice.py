@@ -1,6 +1,9 @@
+import collections
+
+import numpy as np
 import pytest
 
-from crapssim.dice import Dice
+from crapssim.dice import DICE_BACKENDS, Dice, StreamDice, WeightedDice, _alias_table
 
 
 @pytest.fixture
@@ -49,3 +52,178 @@ def test_roll_seed_idential(seed):
     d2.roll()
     assert d1.result == d2.result
     assert d1.total == d2.total
+
+
+def test_rng_created_on_first_roll():
+    dice = Dice(seed=5)
+    assert dice._rng is None
+    dice.roll()
+    assert dice._rng is not None
+
+
+def test_seeded_rolls_match_numpy():
+    import numpy as np
+
+    dice = Dice(seed=5)
+    expected = np.random.default_rng(5).integers(1, 7, size=(10, 2)).tolist()
+    rolls = []
+    for _ in range(10):
+        dice.roll()
+        rolls.append(list(dice.result))
+    assert rolls == expected
+
+
+def roll_stream(dice, n):
+    rolls = []
+    for _ in range(n):
+        dice.roll()
+        rolls.append(dice.result)
+    return rolls
+
+
+def test_stream_dice_reproducible():
+    rolls = roll_stream(StreamDice(seed=3, session=7), 600)
+    assert rolls == roll_stream(StreamDice(seed=3, session=7), 600)
+    assert rolls != roll_stream(StreamDice(seed=3, session=8), 600)
+    assert rolls != roll_stream(StreamDice(seed=4, session=7), 600)
+    assert all(1 <= d <= 6 for roll in rolls for d in roll)
+
+
+@pytest.mark.parametrize("roll", [0, 3, 255, 256, 257, 599])
+def test_stream_dice_random_access(roll):
+    rolls = roll_stream(StreamDice(seed=3, session=7), 600)
+    assert StreamDice.outcome_at(3, 7, roll) == rolls[roll]
+
+    dice = StreamDice(seed=3, session=7, roll=roll)
+    assert roll_stream(dice, 600 - roll) == rolls[roll:]
+    assert dice.n_rolls == 600
+
+    dice.seek(roll)
+    dice.roll()
+    assert dice.result == rolls[roll]
+
+
+def test_stream_dice_uniform():
+    counts = collections.Counter(roll_stream(StreamDice(seed=1), 36_000))
+    assert len(counts) == 36
+    assert all(800 < c < 1200 for c in counts.values())
+
+
+@pytest.mark.parametrize("seed", [8, [3, 7], "abc"])
+def test_python_backend_seed_identical(seed):
+    d1 = Dice(seed, backend="python")
+    d2 = Dice(seed, backend="python")
+    rolls = []
+    for _ in range(20):
+        d1.roll()
+        d2.roll()
+        assert d1.result == d2.result
+        rolls.append(d1.result)
+    assert all(1 <= d <= 6 for roll in rolls for d in roll)
+    assert d1.n_rolls == 20
+
+
+def test_python_backend_uniform():
+    dice = Dice(1, backend="python")
+    counts = collections.Counter()
+    for _ in range(36_000):
+        dice.roll()
+        counts[dice.result] += 1
+    assert len(counts) == 36
+    assert all(800 < c < 1200 for c in counts.values())
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        Dice(backend="nope")
+
+
+def test_alias_table_matches_probabilities():
+    probabilities = np.random.default_rng(0).random(36)
+    probabilities[[3, 20]] = 0
+    probabilities /= probabilities.sum()
+    accept, alias = _alias_table(probabilities.tolist())
+
+    recovered = np.array(accept) / 36
+    np.add.at(recovered, alias, (1 - np.array(accept)) / 36)
+    assert recovered == pytest.approx(probabilities)
+
+
+def test_weighted_dice():
+    probabilities = [0.0] * 36
+    probabilities[0] = 1  # (1, 1)
+    probabilities[35] = 3  # (6, 6)
+    dice = WeightedDice(probabilities, seed=2)
+    counts = collections.Counter()
+    for _ in range(4_000):
+        dice.roll()
+        counts[dice.result] += 1
+
+    assert dice.n_rolls == 4_000
+    assert set(counts) == {(1, 1), (6, 6)}
+    assert 900 < counts[(1, 1)] < 1100
+    assert dice.probabilities[35] == 0.75
+
+
+def test_weighted_dice_reproducible():
+    probabilities = np.arange(1, 37)
+    d1 = WeightedDice(probabilities, seed=5)
+    d2 = WeightedDice(probabilities, seed=5)
+    for _ in range(2_000):
+        d1.roll()
+        d2.roll()
+        assert d1.result == d2.result
+
+    rolls = WeightedDice(probabilities, seed=5).sample(10)
+    assert rolls.shape == (10, 2)
+    assert ((rolls >= 1) & (rolls <= 6)).all()
+
+
+def test_weighted_dice_from_faces():
+    dice = WeightedDice.from_faces([2, 1, 1, 1, 1, 2])
+    assert sum(dice.probabilities) == pytest.approx(1)
+    assert dice.probabilities[0] == pytest.approx(4 / 64)  # (1, 1)
+    assert dice.probabilities[1] == pytest.approx(2 / 64)  # (1, 2)
+    assert Dice().probabilities is None
+
+
+@pytest.mark.parametrize("probabilities", [[1] * 35, [1] * 35 + [-1], [0] * 36])
+def test_weighted_dice_invalid(probabilities):
+    with pytest.raises(ValueError):
+        WeightedDice(probabilities)
+
+
+@pytest.mark.parametrize("backend", DICE_BACKENDS)
+def test_roll_stores_outcome_and_total(backend):
+    dice = Dice(3, backend=backend)
+    assert (dice.result, dice.total, dice.outcome) == (None, None, None)
+    for _ in range(50):
+        dice.roll()
+        d1, d2 = dice.result
+        assert dice.total == d1 + d2
+        assert dice.outcome == (d1 - 1) * 6 + (d2 - 1)
+        assert dice.result is dice.result
+
+
+@pytest.mark.parametrize(
+    "dice",
+    [
+        StreamDice(1),
+        WeightedDice([1] * 36, seed=1),
+    ],
+)
+def test_dice_modes_store_outcome(dice):
+    for _ in range(300):
+        dice.roll()
+        d1, d2 = dice.result
+        assert (dice.total, dice.outcome) == (d1 + d2, (d1 - 1) * 6 + (d2 - 1))
+
+
+def test_result_setter_updates_total_and_outcome():
+    dice = Dice()
+    dice.result = [2, 5]
+    assert (dice.result, dice.total, dice.outcome) == ((2, 5), 7, 10)
+    dice.fixed_roll((6, 6))
+    assert (dice.result, dice.total, dice.outcome) == ((6, 6), 12, 35)
+    dice.result = (0, 9)  # not a valid roll, but allowed
+    assert (dice.result, dice.total, dice.outcome) == ((0, 9), 9, None)
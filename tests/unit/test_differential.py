@@ -0,0 +1,78 @@
+import numpy as np
+
+from crapssim.bet import Field
+from crapssim.differential import (
+    compare_engines,
+    differential_test,
+    fuzz,
+    random_strategy,
+    roll_outcomes,
+)
+from crapssim.kernel import KernelTableUpdate
+from crapssim.strategy import BetPassLine, BetPlace
+from crapssim.strategy.examples import IronCross, Pass2Come
+from crapssim.strategy.tools import AddIfNotBet, AggregateStrategy
+from crapssim.table import Table, TableUpdate
+
+
+class FieldPaysOneTwelveOnTwelve(TableUpdate):
+    """Broken engine that ignores the table's field payout on 12."""
+
+    @staticmethod
+    def update_bets(table, verbose=False):
+        table.settings["field_payouts"][12] = 1
+        TableUpdate.update_bets(table, verbose)
+
+
+def test_roll_outcomes_match_seeded_table():
+    table = Table(seed=8)
+    outcomes = []
+    for _ in range(20):
+        table.dice.roll()
+        outcomes.append(table.dice.result)
+    assert roll_outcomes(8, 20) == outcomes
+
+
+def test_same_engine_has_no_mismatch():
+    outcomes = roll_outcomes(0, 200)
+    assert compare_engines(TableUpdate(), IronCross(5), outcomes) is None
+
+
+def test_mismatch_has_reproducing_prefix():
+    outcomes = [(3, 4), (6, 6), (2, 2), (6, 6)]
+    strategy = BetPlace({6: 6}) + AddIfNotBet(Field(5))
+    mismatch = compare_engines(FieldPaysOneTwelveOnTwelve(), strategy, outcomes)
+
+    assert mismatch.roll == 2
+    assert mismatch.field == "bankroll"
+    assert mismatch.outcomes == [(3, 4), (6, 6)]
+    assert mismatch.reference - mismatch.candidate == 5
+    assert "bankroll differs after roll 2" in str(mismatch)
+
+    # replaying the prefix reproduces the mismatch
+    again = compare_engines(
+        FieldPaysOneTwelveOnTwelve(), mismatch.strategy, mismatch.outcomes
+    )
+    assert again == mismatch
+
+
+def test_differential_test_kernel():
+    strategies = [BetPassLine(5), Pass2Come(5), IronCross(5)]
+    assert differential_test(KernelTableUpdate(), strategies, seeds=range(3)) is None
+
+
+def test_random_strategy_is_reproducible():
+    a = random_strategy(np.random.default_rng(4))
+    b = random_strategy(np.random.default_rng(4))
+    assert isinstance(a, AggregateStrategy)
+    assert repr(a) == repr(b)
+
+
+def test_fuzz_kernel_matches_reference():
+    assert fuzz(KernelTableUpdate(), n_strategies=40, n_rolls=200) is None
+
+
+def test_fuzz_finds_broken_engine():
+    mismatch = fuzz(FieldPaysOneTwelveOnTwelve(), n_strategies=200, n_rolls=300)
+    assert mismatch is not None
+    assert mismatch.outcomes[-1] == (6, 6)
@@ -0,0 +1,149 @@
+import numpy as np
+import pytest
+
+from crapssim.bet import Come, Fire, Odds, PassLine, Place
+from crapssim.env import (
+    SLOTS,
+    Action,
+    BatchState,
+    State,
+    slot_index,
+    step,
+    step_batch,
+)
+from crapssim.money import Cents
+from crapssim.strategy import BetPassLine, PassLineOddsMultiplier
+from crapssim.table import Table
+
+
+def pass_line_odds(state: State) -> Action:
+    types = {type(bet) for bet in state.bets}
+    if state.point is None and PassLine not in types:
+        return Action(add=(PassLine(5),))
+    if state.point is not None and PassLine in types and Odds not in types:
+        return Action(add=(Odds(PassLine, state.point, 10),))
+    return Action()
+
+
+def test_step_matches_table():
+    rng = np.random.default_rng(1)
+    rolls = [tuple(x) for x in rng.integers(1, 7, size=(500, 2)).tolist()]
+
+    table = Table()
+    table.add_player(1000, BetPassLine(5) + PassLineOddsMultiplier(2))
+    table.fixed_run(rolls, verbose=False)
+
+    state = State(bankroll=1000)
+    total_reward = 0.0
+    for roll in rolls:
+        state, reward = step(state, pass_line_odds(state), roll)
+        total_reward += reward
+
+    player = table.players[0]
+    assert state.bankroll == player.bankroll
+    assert state.bets == tuple(player.bets)
+    assert state.point == table.point.number
+    assert total_reward == pytest.approx(player.total_player_cash - 1000)
+
+
+def test_step_leaves_state_unchanged():
+    state = State(bankroll=100, bets=(Come(5),), point=4)
+    new_state, reward = step(state, Action(add=(Place(6, 6),)), (3, 3))
+
+    assert state.bets[0].number is None
+    assert new_state.bets == (Come(5, 6),)
+    assert new_state.bankroll == 100 - 6 + 6 + 7
+    assert reward == 7
+    assert step(state, Action(add=(Place(6, 6),)), (3, 3)) == (new_state, reward)
+
+
+def test_step_action_follows_player_rules():
+    state = State(bankroll=10, bets=(PassLine(5),), point=6)
+    action = Action(add=(Come(20), Odds(PassLine, 6, 30)), remove=(PassLine(5),))
+    new_state, reward = step(state, action, (1, 1))
+
+    assert new_state.bets == (PassLine(5),)
+    assert new_state.bankroll == 10
+    assert reward == 0
+
+
+def test_step_batch_matches_step():
+    rng = np.random.default_rng(2)
+    n_envs = 50
+    batch = BatchState.initial(n_envs, bankroll=200)
+
+    for _ in range(50):
+        add = np.zeros_like(batch.amounts)
+        for i in range(n_envs):
+            add[i, rng.choice(len(SLOTS), 3)] = rng.integers(1, 4, 3) * 5
+        remove = rng.random(batch.amounts.shape) < 0.05
+        rolls = rng.integers(1, 7, size=(n_envs, 2))
+        new_batch, rewards = step_batch(batch, rolls, add=add, remove=remove)
+
+        for i in range(n_envs):
+            state = batch.state(i)
+            action = Action(
+                add=tuple(SLOTS[j]._copy_with_amount(add[i, j]) for j in np.flatnonzero(add[i])),
+                remove=tuple(b for b in state.bets if remove[i, slot_index(b)]),
+            )
+            new_state, reward = step(state, action, tuple(rolls[i]))
+            expected = BatchState.from_states([new_state])
+
+            assert new_batch.amounts[i] == pytest.approx(expected.amounts[0])
+            assert new_batch.bankroll[i] == pytest.approx(expected.bankroll[0])
+            assert new_batch.point[i] == expected.point[0]
+            assert new_batch.new_shooter[i] == expected.new_shooter[0]
+            assert rewards[i] == pytest.approx(reward)
+        batch = new_batch
+
+
+def test_step_batch_leaves_state_unchanged():
+    batch = BatchState.from_states([State(100, (Come(5),), point=4)])
+    amounts = batch.amounts.copy()
+    new_batch, _ = step_batch(batch, np.array([[3, 3]]))
+
+    assert (batch.amounts == amounts).all()
+    assert new_batch.state(0).bets == (Come(5, 6),)
+
+
+@pytest.mark.parametrize("bet", [Fire(5), Odds(PassLine, 6, 5, always_working=True)])
+def test_slot_index_unsupported(bet):
+    with pytest.raises(ValueError):
+        slot_index(bet)
+
+
+def test_step_batch_cents_matches_step_exactly():
+    rng = np.random.default_rng(3)
+    n_envs = 30
+    batch = BatchState.initial(n_envs, bankroll=Cents(200_00))
+    assert batch.bankroll.dtype == np.int64 and batch.amounts.dtype == np.int64
+
+    for _ in range(40):
+        add = np.zeros_like(batch.amounts)
+        for i in range(n_envs):
+            add[i, rng.choice(len(SLOTS), 3)] = rng.integers(1, 12, 3) * 1_37
+        rolls = rng.integers(1, 7, size=(n_envs, 2))
+        new_batch, rewards = step_batch(batch, rolls, add=add)
+
+        for i in range(n_envs):
+            state = batch.state(i)
+            action = Action(
+                add=tuple(
+                    SLOTS[j]._copy_with_amount(Cents(add[i, j])) for j in np.flatnonzero(add[i])
+                )
+            )
+            new_state, reward = step(state, action, tuple(rolls[i]))
+            expected = BatchState.from_states([new_state])
+
+            assert type(new_state.bankroll) is Cents
+            assert (new_batch.amounts[i] == expected.amounts[0]).all()
+            assert new_batch.bankroll[i] == expected.bankroll[0]
+            assert rewards[i] == reward
+            assert new_batch.state(i) == BatchState.from_states([new_state]).state(0)
+        batch = new_batch
+
+
+def test_cents_states_hash_equal():
+    a = State(Cents(100_00), (PassLine(Cents(5_00)),), point=6)
+    b = State(Cents(100_00), (PassLine(Cents(5_00)),), point=6)
+    assert hash(a) == hash(b) and {a: 1}[b] == 1
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from crapssim.corpus import unpack_outcomes
+from crapssim.hands import HandLibraryDice, build_hand_library, generate_hands
+from crapssim.runner import run_sessions
+from crapssim.strategy import BetPassLine
+from crapssim.table import Table
+
+
+def hand_totals(packed):
+    return unpack_outcomes(packed).sum(axis=1).tolist()
+
+
+def test_generate_hands_end_with_seven_out():
+    packed, lengths = generate_hands(np.random.default_rng(1), 200, chunk_size=64)
+    assert len(lengths) == 200
+    assert lengths.sum() == len(packed)
+
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    for offset, length in zip(offsets, lengths):
+        totals = hand_totals(packed[offset : offset + length])
+        point = None
+        for total in totals[:-1]:
+            if point is None and total in (4, 5, 6, 8, 9, 10):
+                point = total
+            elif point is not None:
+                assert total != 7
+                if total == point:
+                    point = None
+        assert point is not None and totals[-1] == 7
+
+
+def test_build_hand_library(tmp_path):
+    library = build_hand_library(tmp_path, 50, seed=3, chunk_hands=20)
+    packed, lengths = generate_hands(np.random.default_rng(3), 20)
+
+    assert library.n_hands == 50
+    assert library.keys()[:2] == [(3, 0), (3, 1)]
+    assert (library.lengths[:20] == lengths).all()
+    assert (library.hand(0) == packed[: lengths[0]]).all()
+    assert library.n_rolls == library.lengths.sum()
+
+
+def test_dice_play_whole_hands(tmp_path):
+    library = build_hand_library(tmp_path, 100, seed=1)
+    dice = HandLibraryDice(library, seed=2)
+    table = Table(dice=dice)
+    table.add_player(strategy=BetPassLine(5))
+    table.run(max_rolls=float("inf"), max_shooter=10, verbose=False)
+
+    assert dice.n_hands == 10
+    assert table.n_shooters == 10
+    assert dice.total == 7
+
+
+def test_dice_without_replacement(tmp_path):
+    library = build_hand_library(tmp_path, 5, seed=1)
+    dice = HandLibraryDice(library, seed=2, replace=False)
+    for _ in range(int(library.lengths.sum())):
+        dice.roll()
+    assert dice.n_hands == 5
+    assert sorted(dice._played) == list(range(5))
+    with pytest.raises(IndexError):
+        dice.roll()
+
+
+def test_dice_fresh_after_exhaustion(tmp_path):
+    library = build_hand_library(tmp_path, 5, seed=1)
+    dice = HandLibraryDice(library, seed=2, replace=False, fresh=True)
+    for _ in range(int(library.lengths.sum()) + 100):
+        dice.roll()
+    assert dice.n_hands == 5
+    assert dice.n_rolls == library.lengths.sum() + 100
+
+
+def test_run_sessions_with_library(tmp_path):
+    library = build_hand_library(tmp_path, 1000, seed=1)
+    kwargs = dict(max_shooter=5, seed=4, hand_library=library)
+    records = run_sessions({"pass": BetPassLine(5)}, 3, **kwargs)
+    assert records == run_sessions({"pass": BetPassLine(5)}, 3, **kwargs)
+    assert records != run_sessions({"pass": BetPassLine(5)}, 3, max_shooter=5, seed=4)
+
+    with pytest.raises(ValueError):
+        run_sessions({"pass": BetPassLine(5)}, 1, skip_quiet_rolls=True, **kwargs)
@@ -0,0 +1,34 @@
+import subprocess
+import sys
+
+
+def test_import_crapssim_is_lazy():
+    code = (
+        "import sys, crapssim; "
+        "crapssim.Table().add_player(); "
+        "print('numpy' in sys.modules, 'crapssim.strategy.examples' in sys.modules)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert out.stdout.split() == ["False", "False"]
+
+
+def test_lazy_submodules():
+    import crapssim
+    from crapssim.strategy import examples
+    from crapssim.kernel import BetKernel
+
+    assert crapssim.strategy.examples is examples
+    assert crapssim.kernel.BetKernel is BetKernel
+
+
+def test_python_dice_backend_does_not_import_numpy():
+    code = (
+        "import sys, crapssim; "
+        "from crapssim.strategy import BetPassLine; "
+        "table = crapssim.Table(seed=1, dice_backend='python'); "
+        "table.add_player(strategy=BetPassLine(5)); "
+        "table.run(max_rolls=100, verbose=False); "
+        "print('numpy' in sys.modules)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert out.stdout.split() == ["False"]
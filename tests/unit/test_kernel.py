@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+
+import crapssim.bet
+import crapssim.kernel
+from crapssim.kernel import BET_DTYPE, FLAG_FALLBACK, BetKernel, KernelTableUpdate
+from crapssim.strategy import BetDontPass, BetPlace, BetPassLine
+from crapssim.strategy.examples import IronCross, Pass2Come, Place682Come
+from crapssim.strategy.tools import AddIfTrue, CountStrategy
+from crapssim.table import Table, TableUpdate
+
+ALL_BETS = [
+    crapssim.bet.PassLine(5),
+    crapssim.bet.Come(5),
+    crapssim.bet.Come(5, 4),
+    crapssim.bet.Come(5, 9),
+    crapssim.bet.DontPass(5),
+    crapssim.bet.DontCome(5),
+    crapssim.bet.DontCome(5, 10),
+    crapssim.bet.Odds(crapssim.bet.PassLine, 6, 12),
+    crapssim.bet.Odds(crapssim.bet.Come, 5, 7, True),
+    crapssim.bet.Odds(crapssim.bet.DontPass, 4, 30),
+    crapssim.bet.Odds(crapssim.bet.DontCome, 9, 13),
+    crapssim.bet.Place(4, 10),
+    crapssim.bet.Place(6, 12),
+    crapssim.bet.Place(8, 7),
+    crapssim.bet.Place(9, 3),
+    crapssim.bet.Field(5),
+    crapssim.bet.CAndE(3),
+    crapssim.bet.Any7(1),
+    crapssim.bet.Two(1),
+    crapssim.bet.Three(1),
+    crapssim.bet.Yo(1),
+    crapssim.bet.Boxcars(1),
+    crapssim.bet.AnyCraps(1),
+    crapssim.bet.HardWay(6, 3),
+    crapssim.bet.HardWay(10, 3),
+    crapssim.bet.Hop((2, 3), 1),
+    crapssim.bet.Hop((4, 4), 1),
+]
+
+
+@pytest.mark.parametrize("point", [None, 4, 5, 6, 8, 9, 10])
+def test_kernel_matches_get_result(point):
+    table = Table()
+    table.point.number = point
+    kernel = BetKernel(ALL_BETS)
+
+    for d1 in range(1, 7):
+        for d2 in range(1, 7):
+            table.dice.fixed_roll((d1, d2))
+            amounts, remove = kernel.resolve(table)
+            for bet, amount, should_remove in zip(ALL_BETS, amounts, remove):
+                result = bet.get_result(table)
+                assert (amount, should_remove) == (result.amount, result.remove)
+
+
+def test_kernel_rows():
+    kernel = BetKernel(
+        [
+            crapssim.bet.Place(6, 12),
+            crapssim.bet.Odds(crapssim.bet.Come, 8, 10, True),
+            crapssim.bet.Hop((3, 2), 1),
+            crapssim.bet.Fire(1),
+        ]
+    )
+
+    assert kernel.rows.dtype == BET_DTYPE
+    assert kernel.rows["number"].tolist() == [6, 8, 23, 0]
+    assert kernel.rows["amount"].tolist() == [12.0, 10.0, 1.0, 1.0]
+    assert kernel.rows["base"][1] != 0
+    assert kernel.fallback.tolist() == [3]
+    assert kernel.rows["flags"][3] & FLAG_FALLBACK
+
+
+def test_kernel_stateful_bets_fall_back():
+    table = Table()
+    table.point.number = 4
+    fire = crapssim.bet.Fire(1)
+    kernel = BetKernel([fire])
+
+    table.dice.fixed_roll((2, 2))
+    amounts, remove = kernel.resolve(table)
+
+    assert fire.points_made == {4}
+    assert (amounts.tolist(), remove.tolist()) == ([0.0], [False])
+
+
+@pytest.mark.parametrize("strategy", [Pass2Come(5), Place682Come(), IronCross(5)])
+def test_kernel_table_update_matches_reference(strategy, monkeypatch):
+    monkeypatch.setattr(crapssim.kernel, "KERNEL_MIN_BETS", 0)
+    rng = np.random.default_rng(11)
+    outcomes = [tuple(x) for x in rng.integers(1, 7, size=(300, 2)).tolist()]
+
+    reference, candidate = Table(), Table()
+    reference.add_player(bankroll=1000, strategy=strategy)
+    candidate.add_player(bankroll=1000, strategy=strategy)
+
+    for outcome in outcomes:
+        TableUpdate().run(reference, outcome)
+        KernelTableUpdate().run(candidate, outcome)
+
+        assert candidate.players[0].bankroll == reference.players[0].bankroll
+        assert candidate.players[0].bets == reference.players[0].bets
+
+
+def test_kernel_is_kept_up_to_date():
+    strategy = (
+        BetPassLine(5)
+        + BetDontPass(5)
+        + BetPlace({4: 5, 5: 5, 6: 6, 8: 6, 9: 5, 10: 5}, skip_point=False)
+        + CountStrategy((crapssim.bet.Come,), 4, crapssim.bet.Come(5))
+        + AddIfTrue(crapssim.bet.HardWay(8, 1), lambda p: True)
+        + AddIfTrue(crapssim.bet.Field(1), lambda p: True)
+    )
+    rng = np.random.default_rng(3)
+    outcomes = [tuple(x) for x in rng.integers(1, 7, size=(300, 2)).tolist()]
+
+    reference, candidate = Table(), Table()
+    reference.add_player(bankroll=10_000, strategy=strategy)
+    candidate.add_player(bankroll=10_000, strategy=strategy)
+    bets = candidate.players[0].bets
+
+    for outcome in outcomes:
+        TableUpdate().run(reference, outcome)
+        KernelTableUpdate().run(candidate, outcome)
+
+        assert candidate.players[0].bankroll == reference.players[0].bankroll
+        assert candidate.players[0].bets == reference.players[0].bets
+        if bets.kernel is not None:
+            assert all(a is b for a, b in zip(bets.kernel.bets, bets, strict=True))
+            assert (bets.kernel.rows == BetKernel(bets).rows).all()
+    assert bets.kernel is not None
@@ -0,0 +1,152 @@
+import numpy as np
+import pytest
+
+from crapssim.dice import StreamDice
+from crapssim.metrics import RiskMetrics
+from crapssim.runner import run_sessions
+from crapssim.strategy import BetPassLine, BetPlace
+from crapssim.table import Table
+
+
+def test_risk_metrics_update():
+    metrics = RiskMetrics(100)
+    for roll, cash in enumerate([110, 90, 120, 80, 95], start=1):
+        metrics.update(roll, cash)
+
+    assert (metrics.peak, metrics.low, metrics.final) == (120, 80, 95)
+    assert metrics.max_drawdown == 40
+    assert metrics.n_rolls == 5
+    assert not metrics.busted
+
+
+def test_risk_metrics_busted_at_first_ruin():
+    metrics = RiskMetrics(10, ruin_level=5)
+    for roll, cash in enumerate([8, 5, 12, 0], start=1):
+        metrics.update(roll, cash)
+    assert metrics.busted_at == 2
+
+
+def test_risk_metrics_at_risk():
+    metrics = RiskMetrics(100)
+    for amount in [5, 30, 10]:
+        metrics.update_at_risk(amount)
+    assert metrics.max_at_risk == 30
+
+
+def test_player_ruin_level():
+    table = Table()
+    table.add_player(bankroll=100, strategy=BetPassLine(50), name="a", ruin_level=60)
+    table.add_player(bankroll=100, strategy=BetPassLine(50), name="b")
+    metrics = table.fixed_run([(3, 3), (3, 4)])
+
+    assert metrics["a"].ruin_level == 60
+    assert metrics["a"].busted_at == 2
+    assert not metrics["b"].busted
+
+
+def test_table_run_returns_metrics():
+    table = Table(seed=7)
+    table.add_player(bankroll=100, name="a")
+    result = table.run(max_rolls=50, verbose=False)
+
+    assert list(result) == ["a"]
+    assert result["a"] is table.players[0].metrics
+    assert result["a"].n_rolls == table.dice.n_rolls
+    assert result["a"].final == table.players[0].total_player_cash
+
+
+def test_fixed_run_metrics():
+    table = Table()
+    table.add_player(bankroll=100, strategy=BetPassLine(5))
+    metrics = table.fixed_run([(3, 3), (3, 4), (3, 4)])[table.players[0].name]
+
+    assert metrics.max_at_risk == 5
+    assert (metrics.peak, metrics.low, metrics.final) == (100, 95, 100)
+    assert metrics.max_drawdown == 5
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_metrics_match_cash_path(seed):
+    rng = np.random.default_rng(seed)
+    table = Table()
+    table.add_player(bankroll=200, strategy=BetPlace({6: 6, 8: 6}))
+    player = table.players[0]
+
+    cash = [200.0]
+    for outcome in rng.integers(1, 7, size=(200, 2)).tolist():
+        table.fixed_run([outcome])
+        cash.append(player.total_player_cash)
+    cash = np.array(cash)
+    drawdown = np.maximum.accumulate(cash) - cash
+
+    assert player.metrics.peak == cash.max()
+    assert player.metrics.low == cash.min()
+    assert player.metrics.final == cash[-1]
+    assert player.metrics.max_drawdown == drawdown.max()
+    assert player.metrics.max_at_risk == 12
+
+
+def test_run_sessions():
+    records = run_sessions(
+        {"pass": BetPassLine(5), "place": BetPlace({6: 6, 8: 6})},
+        n_sim=3,
+        bankroll=100,
+        max_rolls=30,
+        seed=5,
+    )
+
+    assert [(r["session"], r["name"]) for r in records] == [
+        (0, "pass"),
+        (0, "place"),
+        (1, "pass"),
+        (1, "place"),
+        (2, "pass"),
+        (2, "place"),
+    ]
+    assert records == run_sessions(
+        {"pass": BetPassLine(5), "place": BetPlace({6: 6, 8: 6})},
+        n_sim=3,
+        bankroll=100,
+        max_rolls=30,
+        seed=5,
+    )
+    assert all(r["peak"] >= r["final"] for r in records)
+
+
+def test_run_sessions_ruin_level():
+    strategies = {"pass": BetPassLine(5)}
+    records = run_sessions(strategies, n_sim=20, max_rolls=30, seed=3)
+    ruined = run_sessions(strategies, n_sim=20, max_rolls=30, seed=3, ruin_level=95)
+
+    assert [r["final"] for r in ruined] == [r["final"] for r in records]
+    assert [r["busted_at"] is not None for r in ruined] == [r["low"] <= 95 for r in records]
+    assert any(r["busted_at"] is not None for r in ruined)
+
+
+def test_run_sessions_needs_a_stopping_rule():
+    with pytest.raises(ValueError):
+        run_sessions({"pass": BetPassLine(5)}, n_sim=1, seed=1)
+    records = run_sessions({"pass": BetPassLine(5)}, n_sim=1, max_shooter=1, seed=1)
+    assert len(records) == 1
+
+
+def test_run_sessions_chunks_match():
+    strategies = {"pass": BetPassLine(5)}
+    records = run_sessions(strategies, n_sim=5, max_rolls=30, seed=2)
+    chunks = run_sessions(strategies, n_sim=2, max_rolls=30, seed=2)
+    chunks += run_sessions(strategies, n_sim=3, max_rolls=30, seed=2, first_session=2)
+    assert chunks == records
+
+
+def test_run_sessions_stream_dice_rerun_one_session():
+    strategies = {"pass": BetPassLine(5)}
+    records = run_sessions(strategies, n_sim=5, max_rolls=30, seed=2, stream_dice=True)
+    assert records != run_sessions(strategies, n_sim=5, max_rolls=30, seed=2)
+
+    table = Table(dice=StreamDice(2, 3))
+    table.add_player(100, strategy=BetPassLine(5), name="pass")
+    table.run(max_rolls=30, verbose=False)
+    assert table.players[0].bankroll == records[3]["bankroll"]
+
+    with pytest.raises(ValueError):
+        run_sessions(strategies, n_sim=1, max_rolls=30, stream_dice=True)
@@ -0,0 +1,156 @@
+import fractions
+
+import pytest
+
+from crapssim.bet import Fire, Odds, PassLine, Place
+from crapssim.cache import ResultCache
+from crapssim.kernel import KernelTableUpdate
+from crapssim.metrics import RiskMetrics
+from crapssim.money import Cents, as_amount, exact_ratio
+from crapssim.runner import run_sessions
+from crapssim.strategy import BetPassLine, PassLineOddsMultiplier
+from crapssim.strategy.examples import Place68PR
+from crapssim.strategy.tools import NullStrategy
+from crapssim.table import Table
+
+
+def test_cents_arithmetic():
+    a = Cents(5_00)
+    assert type(a + 25) is Cents and a + 25 == 525
+    assert type(1_000 - a) is Cents and 1_000 - a == 500
+    assert type(-1 * a) is Cents and -1 * a == -500
+    assert type(-a) is Cents
+    assert type(a * 2) is Cents and a * 2 == 1_000
+    assert sum([a, a]) == Cents(10_00)
+    assert a.dollars == 5.0
+    assert repr(a) == "Cents(500)"
+
+
+def test_cents_payout_rounds_down():
+    assert Cents(5_00) * (7 / 6) == 583
+    assert Cents(5_00) * (6 / 5) == 600
+    assert Cents(3_00) * (2 / 3) == 200
+    assert Cents(1) * 1.5 == 1
+    assert exact_ratio(7 / 6) == fractions.Fraction(7, 6)
+
+
+def test_cents_from_dollars():
+    assert Cents.from_dollars("5.25") == 525
+    assert Cents.from_dollars(0.1) == 10
+    with pytest.raises(ValueError):
+        Cents.from_dollars("5.255")
+    with pytest.raises(ValueError):
+        Cents(2.5)
+
+
+def test_as_amount():
+    assert type(as_amount(5)) is float
+    assert type(as_amount(Cents(5))) is Cents
+    assert type(as_amount(0, like=Cents(5))) is Cents
+
+
+@pytest.mark.parametrize(
+    "bet, roll, point, amount",
+    [
+        (Place(6, Cents(5_00)), (3, 3), 4, 5_00 + 5_83),
+        (Place(5, Cents(5_00)), (2, 3), 4, 5_00 + 7_00),
+        (Odds(PassLine, 5, Cents(5_00)), (2, 3), 5, 5_00 + 7_50),
+        (Odds(PassLine, 5, Cents(5_01)), (2, 3), 5, 5_01 + 7_51),
+        (PassLine(Cents(5_00)), (3, 4), 4, -5_00),
+    ],
+)
+def test_bet_results_in_cents(bet, roll, point, amount):
+    table = Table()
+    table.point.number = point
+    table.dice.fixed_roll(roll)
+    result = bet.get_result(table)
+    assert type(bet.amount) is Cents
+    assert result.amount == amount and type(result.amount) is Cents
+
+
+def test_player_in_cents_matches_dollars():
+    # pass line with 2x odds on $5 pays whole dollars, so both are exact
+    results = []
+    for bankroll, amount in [(1_000, 5), (Cents(1_000_00), Cents(5_00))]:
+        table = Table(seed=5)
+        table.add_player(bankroll, BetPassLine(amount) + PassLineOddsMultiplier(2))
+        table.run(max_rolls=500, verbose=False)
+        results.append(table.players[0].bankroll)
+
+    dollars, cents = results
+    assert type(cents) is Cents
+    assert cents == dollars * 100
+
+
+def test_kernel_settles_cents_exactly():
+    bankrolls = []
+    for table_update in (None, KernelTableUpdate()):
+        table = Table()
+        table.add_player(Cents(100_00), Place68PR(Cents(5_00)))
+        rolls = [(2, 2), (3, 3), (4, 4), (3, 3), (5, 1), (3, 4)] * 5
+        for roll in rolls:
+            if table_update is None:
+                table.fixed_run([roll], verbose=False)
+            else:
+                table_update.run(table, dice_outcome=roll)
+        bankrolls.append(table.players[0].bankroll)
+    assert type(bankrolls[1]) is Cents
+    assert bankrolls[0] == bankrolls[1]
+
+
+def test_place68pr_presses_with_cents():
+    table = Table()
+    table.add_player(Cents(100_00), Place68PR(Cents(6_00)))
+    table.fixed_run([(2, 2), (3, 3), (1, 1)], verbose=False)
+    player = table.players[0]
+    assert Place(6, Cents(12_00)) in player.bets
+    assert type(player.bankroll) is Cents
+
+
+def test_fire_in_cents():
+    table = Table()
+    fire = Fire(Cents(1_00))
+    table.point.number = 8
+    table.dice.result = (3, 4)
+    fire.points_made = {4, 5, 6, 9}
+    assert fire.get_result(table).amount == 25_00
+
+
+def test_shared_results_keep_money_type():
+    # $500 in dollars and 500 cents are equal numbers, but not the same money
+    table = Table()
+    table.add_player(10_000, NullStrategy(), name="dollars")
+    table.add_player(Cents(10_000), NullStrategy(), name="cents")
+    table.players[0].add_bet(PassLine(500))
+    table.players[1].add_bet(PassLine(Cents(500)))
+    table.fixed_run([(3, 4)], verbose=False)
+
+    dollars, cents = (player.bankroll for player in table.players)
+    assert type(dollars) is float and type(cents) is Cents
+    assert dollars == cents == 10_500
+
+
+def test_run_sessions_cache_keeps_money_type(tmp_path):
+    cache = ResultCache(tmp_path)
+    kwargs = dict(n_sim=2, max_rolls=20, seed=4, cache=cache)
+    strategy = {"pass": BetPassLine(Cents(5_00))}
+    run_sessions(strategy, bankroll=100_00, **kwargs)
+    for _ in range(2):
+        records = run_sessions(strategy, bankroll=Cents(100_00), **kwargs)
+        assert all(type(record["bankroll"]) is Cents for record in records)
+    assert len(cache) == 2
+
+
+@pytest.mark.parametrize("bankroll", [100, Cents(100_00)])
+def test_run_sessions_cache_hit_matches_miss(tmp_path, bankroll):
+    cache = ResultCache(tmp_path)
+    strategy = {"pass": BetPassLine(as_amount(5, like=bankroll))}
+    kwargs = dict(n_sim=3, bankroll=bankroll, max_rolls=30, seed=4)
+    miss = run_sessions(strategy, cache=cache, **kwargs)
+    hit = run_sessions(strategy, cache=cache, **kwargs)
+
+    assert hit == miss == run_sessions(strategy, **kwargs)
+    for a, b in zip(hit, miss, strict=True):
+        assert {k: type(v) for k, v in a.items()} == {k: type(v) for k, v in b.items()}
+    if type(bankroll) is Cents:
+        assert all(type(miss[0][k]) is Cents for k in RiskMetrics.money_fields)
@@ -1,6 +1,12 @@
+import copy
+import pickle
+
+import pytest
+
 from crapssim import Table
-from crapssim.bet import PassLine
+from crapssim.bet import Come, DontCome, Odds, PassLine, Place
 from crapssim.strategy import BetPassLine
+from crapssim.strategy.tools import NullStrategy
 
 
 def test_default_strategy():
@@ -31,3 +37,176 @@ def test_existing_bet():
     total_bet_amount = table.players[0].total_bet_amount
 
     assert (bet_count, bet_amount, bankroll, total_bet_amount) == (1, 100, 0, 100)
+
+
+def test_version_changes_with_bets():
+    table = Table()
+    table.add_player()
+    player = table.players[0]
+
+    versions = [player.version]
+    player.add_bet(PassLine(5))
+    versions.append(player.version)
+    player.bets.remove(player.bets[0])
+    versions.append(player.version)
+    player.bets = [PassLine(5)]
+    versions.append(player.version)
+    player.bets.append(PassLine(5))
+    versions.append(player.version)
+
+    assert len(set(versions)) == len(versions)
+
+
+def test_version_changes_with_bankroll():
+    table = Table()
+    table.add_player(100)
+    player = table.players[0]
+
+    version = player.version
+    player.bankroll = 100
+    assert player.version == version
+    player.bankroll += 5
+    assert player.version != version
+
+
+def test_version_unchanged_on_rolls_without_action():
+    table = Table()
+    table.add_player(100)
+    player = table.players[0]
+    table.fixed_run([(2, 2)])
+
+    version = player.version
+    table.fixed_run([(2, 3), (5, 6), (1, 2)])
+    assert player.version == version
+
+
+def test_strategy_completed_is_cached():
+    table = Table()
+    table.add_player(100, strategy=BetPassLine(5))
+    player = table.players[0]
+    calls = []
+
+    class CountingPassLine(BetPassLine):
+        completed_is_pure = True
+
+        def completed(self, player):
+            calls.append(player.version)
+            return super().completed(player)
+
+    player.strategy = CountingPassLine(5)
+    assert player.strategy_completed() is False
+    assert player.strategy_completed() is False
+    assert len(calls) == 1
+
+    player.bankroll = 0
+    assert player.strategy_completed() is True
+    assert len(calls) == 2
+
+
+def test_impure_strategy_completed_not_cached():
+    table = Table()
+    table.add_player(100, strategy=BetPassLine(5))
+    player = table.players[0]
+    calls = []
+
+    class RollLimit(BetPassLine):
+        completed_is_pure = False
+
+        def completed(self, player):
+            calls.append(None)
+            return player.table.dice.n_rolls >= 3
+
+    player.strategy = RollLimit(5)
+    player.strategy_completed()
+    player.strategy_completed()
+    assert len(calls) == 2
+
+
+def test_base_bet_amounts():
+    table = Table()
+    table.add_player(1000)
+    player = table.players[0]
+    player.bets.extend([Come(5, 6), Come(10, 6), Come(5, 8), PassLine(5)])
+
+    assert player.base_bet_amounts(Come) == {(6,): 15, (8,): 5}
+    assert player.base_bet_amounts(PassLine) == {(7, 11): 5}
+    assert Odds(Come, 6, 10).base_amount(player) == 15
+    assert Odds(Come, 9, 10).base_amount(player) == 0
+
+    table.point.number = 6
+    assert player.base_bet_amounts(PassLine) == {(6,): 5}
+
+    player.bets.append(Come(5, 9))
+    assert Odds(Come, 9, 10).base_amount(player) == 5
+
+
+def test_base_bet_amounts_dont_odds_share_seven():
+    table = Table()
+    table.point.number = 4
+    table.add_player(1000)
+    player = table.players[0]
+    player.bets.extend([DontCome(5, 6), DontCome(10, 8)])
+
+    assert player.base_bet_amounts(DontCome) == {(7,): 15}
+    assert Odds(DontCome, 6, 10).base_amount(player) == 15
+
+
+def test_add_bet_to_existing_bet_charges_added_amount():
+    table = Table()
+    table.point.number = 6
+    table.add_player(100)
+    player = table.players[0]
+    player.add_bet(Come(5))
+    player.add_bet(Come(15))
+
+    assert player.bets == [Come(20)]
+    assert player.bankroll == 80
+
+
+def test_moving_bets_index():
+    table = Table()
+    table.point.number = 6
+    table.add_player(100, strategy=NullStrategy())
+    player = table.players[0]
+    player.add_bet(Come(5))
+    player.add_bet(DontCome(5))
+    player.add_bet(Come(5, 4))
+
+    assert player.bets.moving == [Come(5), DontCome(5)]
+
+    table.fixed_run([(4, 5)])
+    assert player.bets.moving == []
+    assert player.bets == [Come(5, 9), DontCome(5, 9), Come(5, 4)]
+
+    player.add_bet(Come(5))
+    player.bets.remove(Come(5))
+    assert player.bets.moving == []
+    player.bets = [Come(5), DontCome(5)]
+    assert player.bets.moving == player.bets
+    player.bets[0] = PassLine(5)
+    assert player.bets.moving == [DontCome(5)]
+
+
+@pytest.mark.parametrize(
+    "copy_table",
+    [copy.deepcopy, lambda table: pickle.loads(pickle.dumps(table))],
+    ids=["deepcopy", "pickle"],
+)
+def test_table_round_trip(copy_table):
+    table = Table(seed=2)
+    table.add_player(100)
+    table.fixed_run([(2, 2)])
+    table.players[0].add_bet(Place(6, 6))
+    table.players[0].add_bet(Come(5))
+
+    again = copy_table(table)
+    player = again.players[0]
+    assert player.table is again
+    assert player.bets == table.players[0].bets
+    assert player.bets is not table.players[0].bets
+    assert player.bets.moving == [Come(5)]
+    assert player.bets.moving[0] is player.bets[-1]
+
+    version = player.version
+    player.bets.append(Place(8, 6))
+    assert player.version != version
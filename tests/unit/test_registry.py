@@ -0,0 +1,118 @@
+import pickle
+
+import numpy as np
+import pytest
+
+import crapssim.bet
+from crapssim.bet import Fire, Odds, PassLine, Small
+from crapssim.money import Cents
+from crapssim.registry import (
+    _CODE_TYPES,
+    BET_RECORD_DTYPE,
+    BET_TYPE_CODES,
+    bet_type,
+    bet_type_code,
+    decode_bet,
+    decode_bets,
+    encode_bet,
+    encode_bets,
+    register_bet_type,
+)
+
+ALL_BETS = [
+    crapssim.bet.PassLine(5),
+    crapssim.bet.Come(5),
+    crapssim.bet.Come(5, 4),
+    crapssim.bet.DontPass(5),
+    crapssim.bet.DontCome(5, 10),
+    crapssim.bet.Odds(crapssim.bet.PassLine, 6, 12),
+    crapssim.bet.Odds(crapssim.bet.Come, 5, 7, True),
+    crapssim.bet.Odds(crapssim.bet.DontCome, 9, 13),
+    crapssim.bet.Place(8, 7.5),
+    crapssim.bet.Field(5),
+    crapssim.bet.CAndE(3),
+    crapssim.bet.Any7(1),
+    crapssim.bet.Two(1),
+    crapssim.bet.Three(1),
+    crapssim.bet.Yo(1),
+    crapssim.bet.Boxcars(1),
+    crapssim.bet.AnyCraps(1),
+    crapssim.bet.HardWay(10, 3),
+    crapssim.bet.Hop((2, 3), 1),
+    crapssim.bet.Hop((6, 6), 1),
+    crapssim.bet.Fire(1),
+    crapssim.bet.All(1),
+    crapssim.bet.Tall(1),
+    crapssim.bet.Small(1),
+    crapssim.bet.PassLine(Cents(5_00)),
+]
+
+
+def test_every_bet_type_has_a_code():
+    for name in crapssim.bet.__all__:
+        cls = getattr(crapssim.bet, name)
+        if isinstance(cls, type) and issubclass(cls, crapssim.bet.Bet) and not name.startswith("_"):
+            if cls is not crapssim.bet.Bet:
+                assert bet_type(bet_type_code(cls)) is cls
+    assert len(set(BET_TYPE_CODES.values())) == len(BET_TYPE_CODES)
+
+
+def test_codes_are_stable():
+    assert BET_TYPE_CODES[PassLine] == 1
+    assert BET_TYPE_CODES[Odds] == 5
+    assert BET_TYPE_CODES[Small] == 20
+
+
+@pytest.mark.parametrize("bet", ALL_BETS, ids=repr)
+def test_round_trip(bet):
+    again = decode_bet(encode_bet(bet))
+    assert again == bet
+    assert type(again.amount) is type(bet.amount)
+
+
+def test_round_trip_array_bytes():
+    records = encode_bets(ALL_BETS)
+    assert records.dtype == BET_RECORD_DTYPE
+    data = pickle.dumps(records.tobytes())
+    bets = decode_bets(np.frombuffer(pickle.loads(data), dtype=BET_RECORD_DTYPE))
+    assert bets == ALL_BETS
+    assert bets[6].always_working
+
+
+def test_round_trip_keeps_state():
+    fire = Fire(5)
+    fire.points_made = {4, 8}
+    fire.ended = True
+    small = Small(5)
+    small.rolled_numbers = {2, 3, 5}
+
+    again_fire, again_small = decode_bets(encode_bets([fire, small]))
+    assert again_fire.points_made == {4, 8}
+    assert again_fire.ended
+    assert again_small.rolled_numbers == {2, 3, 5}
+
+
+def test_register_bet_type():
+    class Custom(crapssim.bet.Field):
+        pass
+
+    try:
+        code = register_bet_type(Custom, 100)
+        assert register_bet_type(Custom) == code == 100
+        assert decode_bet(encode_bet(Custom(5))) == Custom(5)
+        with pytest.raises(ValueError):
+            register_bet_type(Custom, 101)
+        with pytest.raises(ValueError):
+            register_bet_type(type("Other", (crapssim.bet.Field,), {}), 100)
+    finally:
+        BET_TYPE_CODES.pop(Custom, None)
+        _CODE_TYPES.pop(100, None)
+
+
+def test_unregistered_bet_type():
+    class Custom(crapssim.bet.Field):
+        pass
+
+    assert bet_type_code(Custom) == 0
+    with pytest.raises(KeyError):
+        encode_bet(Custom(5))
@@ -0,0 +1,208 @@
+import asyncio
+import concurrent.futures
+import json
+
+import pytest
+
+from crapssim.runner import run_sessions
+from crapssim.service import (
+    MAX_SESSIONS,
+    Aggregate,
+    SimulationService,
+    build_strategy,
+    parse_job,
+    stream_job,
+)
+from crapssim.strategy import BetPassLine
+from crapssim.strategy.examples import IronCross
+from crapssim.strategy.single_bet import BetField
+
+JOB = {
+    "strategies": {
+        "pass": {"name": "BetPassLine", "args": [5]},
+        "iron": {"name": "IronCross", "args": [5]},
+    },
+    "bankroll": 100,
+    "n_sessions": 10,
+    "max_rolls": 50,
+    "seed": 3,
+    "chunk_size": 4,
+}
+
+
+def collect(job, **kwargs):
+    async def run():
+        executor = concurrent.futures.ThreadPoolExecutor(2)
+        async with SimulationService(executor=executor, **kwargs) as service:
+            if service.path is None:
+                kwargs["port"] = service.port
+            return [m async for m in stream_job(job, **kwargs)]
+
+    return asyncio.run(run())
+
+
+def test_parse_job_defaults():
+    job = parse_job({"strategy": {"name": "BetPassLine", "args": [5]}, "max_shooter": 3})
+    assert list(job.strategies) == ["Player"]
+    assert job.max_rolls == float("inf")
+    assert job.max_shooter == 3
+    assert job.n_sessions == 100
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [],
+        {},
+        {"strategies": {"x": {"name": "NotAStrategy"}}},
+        {"strategies": {"x": {"name": "Table"}}},
+        {"strategies": {"x": {"name": "BetPassLine"}}},
+        {"strategies": {"x": {"name": "BetPassLine", "args": [5]}}, "rolls": 10},
+        {"strategies": {"x": {"name": "BetPassLine", "args": [5]}}, "n_sessions": 0},
+        {"strategies": {"x": {"name": "BetPassLine", "args": [5]}}},
+        {"strategy": {"name": "IronCross", "args": [5]}, "max_rolls": None, "max_shooter": None},
+        {"strategy": {"name": "BetPassLine", "args": [5]}, "max_rolls": float("inf")},
+        {
+            "strategy": {"name": "BetPassLine", "args": [5]},
+            "max_rolls": 10,
+            "n_sessions": MAX_SESSIONS + 1,
+        },
+        {
+            "strategy": {"type": "single", "bet": {"type": "Hop", "amount": 1, "result": 5}},
+            "max_rolls": 10,
+        },
+    ],
+)
+def test_parse_job_invalid(data):
+    with pytest.raises(ValueError):
+        parse_job(data)
+
+
+def test_build_strategy_list_adds():
+    strategy = build_strategy(
+        [{"name": "BetPassLine", "args": [5]}, {"name": "BetField", "args": [5]}]
+    )
+    assert repr(strategy) == repr(BetPassLine(5) + BetField(5))
+
+
+def test_aggregate():
+    aggregate = Aggregate()
+    for bankroll, busted_at in [(100, None), (0, 10), (50, None)]:
+        record = {"bankroll": bankroll, "busted_at": busted_at}
+        aggregate.update(record | {"max_drawdown": 0, "rolls": 20})
+    result = aggregate.as_dict()
+    assert result["mean_bankroll"] == 50
+    assert result["std_bankroll"] == pytest.approx(50)
+    assert result["bust_rate"] == pytest.approx(1 / 3)
+    assert result["mean_rolls"] == 20
+
+
+def test_stream_job_matches_run_sessions():
+    messages = collect(JOB)
+
+    assert [m["type"] for m in messages] == ["progress", "progress", "done"]
+    assert [m["sessions"] for m in messages] == sorted(m["sessions"] for m in messages)
+    assert messages[-1]["sessions"] == 10
+
+    records = run_sessions(
+        {"pass": BetPassLine(5), "iron": IronCross(5)},
+        10,
+        bankroll=100,
+        max_rolls=50,
+        seed=3,
+    )
+    expected = Aggregate()
+    for record in records:
+        if record["name"] == "iron":
+            expected.update(record)
+    result = messages[-1]["results"]["iron"]
+    assert result["mean_bankroll"] == pytest.approx(expected.mean_bankroll)
+    assert result["sessions"] == 10
+
+
+def test_stream_job_unix_socket(tmp_path):
+    job = dict(JOB, n_sessions=2, chunk_size=2)
+    messages = collect(job, path=str(tmp_path / "crapssim.sock"))
+    assert messages[-1]["type"] == "done"
+
+
+def test_stream_job_rejects_bad_job():
+    with pytest.raises(ValueError, match="unknown strategy"):
+        collect({"strategies": {"x": {"name": "Nope"}}})
+    with pytest.raises(ValueError, match="max_rolls"):
+        collect({"strategy": {"name": "BetPassLine", "args": [5]}})
+
+
+def test_run_job_limits_pending_chunks():
+    class CountingExecutor(concurrent.futures.ThreadPoolExecutor):
+        def __init__(self):
+            super().__init__(4)
+            self.pending = 0
+            self.max_pending = 0
+
+        def submit(self, fn, *args):
+            self.pending += 1
+            self.max_pending = max(self.max_pending, self.pending)
+            future = super().submit(fn, *args)
+            future.add_done_callback(self.done)
+            return future
+
+        def done(self, future):
+            self.pending -= 1
+
+    executor = CountingExecutor()
+    job = parse_job(dict(JOB, n_sessions=20, chunk_size=1))
+
+    async def run():
+        service = SimulationService(executor=executor, max_pending=3)
+        return [m async for m in service.run_job(job)]
+
+    messages = asyncio.run(run())
+    executor.shutdown()
+    assert len(messages) == 20
+    assert messages[-1]["type"] == "done"
+    assert 1 <= executor.max_pending <= 3
+
+
+def test_service_health_and_not_found():
+    async def request(port, line):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(line.encode() + b"\r\n\r\n")
+        response = await reader.read()
+        writer.close()
+        head, _, body = response.partition(b"\r\n\r\n")
+        return head.split()[1], json.loads(body)
+
+    async def run():
+        executor = concurrent.futures.ThreadPoolExecutor(1)
+        async with SimulationService(executor=executor) as service:
+            health = await request(service.port, "GET /health HTTP/1.1")
+            missing = await request(service.port, "GET /nope HTTP/1.1")
+        return health, missing
+
+    health, missing = asyncio.run(run())
+    assert health == (b"200", {"status": "ok"})
+    assert missing[0] == b"404"
+
+
+def test_service_process_pool():
+    job = dict(JOB, n_sessions=4, chunk_size=2)
+
+    async def run():
+        async with SimulationService(max_workers=2) as service:
+            return [m async for m in stream_job(job, port=service.port)]
+
+    messages = asyncio.run(run())
+    assert messages[-1]["type"] == "done"
+    assert messages[-1]["results"]["pass"]["sessions"] == 4
+
+
+def test_build_strategy_declarative_spec():
+    spec = {"type": "single", "bet": {"type": "PassLine", "amount": 5}}
+    job = parse_job({"strategy": spec, "n_sessions": 2, "max_rolls": 20, "seed": 1})
+    messages = collect({"strategy": spec, "n_sessions": 2, "max_rolls": 20, "seed": 1})
+
+    records = run_sessions({"Player": BetPassLine(5)}, 2, max_rolls=20, seed=1)
+    expected = sum(r["bankroll"] for r in records) / 2
+    assert job.strategies == {"Player": spec}
+    assert messages[-1]["results"]["Player"]["mean_bankroll"] == expected
@@ -0,0 +1,170 @@
+import numpy as np
+import pytest
+
+from crapssim.bet import Come, DontPass, Field, Fire, Odds, PassLine
+from crapssim.corpus import ReplayDice, pack_outcomes
+from crapssim.runner import run_sessions
+from crapssim.skip import SkipTableUpdate, quiet_outcomes
+from crapssim.strategy import BetDontPass, BetPassLine, PassLineOddsMultiplier
+from crapssim.strategy.tools import AddIfTrue
+from crapssim.table import Table
+from crapssim.trajectory import RingBufferRecorder
+
+
+def table_with_bets(point, bets):
+    table = Table()
+    table.point.number = point
+    table.add_player()
+    table.players[0].bets.extend(bets)
+    return table
+
+
+@pytest.mark.parametrize(
+    "point, bets, n_quiet",
+    [
+        (None, [], 12),
+        (6, [], 25),
+        (6, [PassLine(5), Odds(PassLine, 6, 10)], 25),
+        (4, [DontPass(5)], 27),
+        (None, [PassLine(5)], 0),
+        (6, [Field(5)], 0),
+        (6, [Come(5)], 0),
+        (6, [Fire(1)], 0),
+    ],
+)
+def test_quiet_outcomes(point, bets, n_quiet):
+    quiet = quiet_outcomes(table_with_bets(point, bets))
+    assert quiet.sum() == n_quiet
+
+
+def test_quiet_outcomes_point_on():
+    quiet = quiet_outcomes(table_with_bets(5, [PassLine(5)]))
+    totals = np.add.outer(np.arange(1, 7), np.arange(1, 7)).ravel()
+    assert set(totals[quiet]) == {2, 3, 4, 6, 8, 9, 10, 11, 12}
+
+
+def test_skip_run_counts_every_roll():
+    table = Table(seed=4)
+    recorder = RingBufferRecorder(1_000)
+    table.add_player(1_000, BetPassLine(5) + PassLineOddsMultiplier(2), recorder=recorder)
+    metrics = table.run(300, verbose=False, skip_quiet_rolls=True)
+
+    assert table.dice.n_rolls == 300
+    assert metrics["Player 0"].n_rolls == 300
+    assert list(recorder.rolls) == list(range(301))
+
+
+def test_skip_run_skips_rolls():
+    table = Table(seed=4)
+    table.add_player(1_000, BetDontPass(5))
+    update = SkipTableUpdate(roll_limit=500)
+    n_updates = 0
+    while table.dice.n_rolls < 500:
+        update.run(table)
+        n_updates += 1
+    assert table.dice.n_rolls == 500
+    assert n_updates < 400
+
+
+def test_impure_strategy_is_never_skipped():
+    def run(skip):
+        table = Table(seed=2)
+        strategy = AddIfTrue(PassLine(5), lambda p: p.table.point.status == "Off")
+        table.add_player(1_000, strategy)
+        table.run(200, verbose=False, skip_quiet_rolls=skip)
+        return table.players[0].bankroll, table.dice.n_rolls, table.pass_rolls
+
+    assert run(True) == run(False)
+
+
+@pytest.mark.parametrize(
+    "strategy", [BetPassLine(5) + PassLineOddsMultiplier(2), BetDontPass(5)]
+)
+def test_skip_run_same_distribution(strategy):
+    results = {}
+    for skip in (False, True):
+        records = run_sessions(
+            {"Player": strategy},
+            200,
+            bankroll=1_000,
+            max_rolls=100,
+            seed=int(skip),
+            skip_quiet_rolls=skip,
+        )
+        results[skip] = np.array([[r["bankroll"], r["max_drawdown"]] for r in records])
+
+    a, b = results[False], results[True]
+    se = np.sqrt(a.var(axis=0) / len(a) + b.var(axis=0) / len(b))
+    assert (np.abs(a.mean(axis=0) - b.mean(axis=0)) < 4 * se).all()
+
+
+def test_skip_run_weighted_dice():
+    # a dice setter who rolls few sevens
+    probabilities = [1.0 if d1 + d2 != 7 else 0.25 for d1 in range(1, 7) for d2 in range(1, 7)]
+    results = {}
+    for skip in (False, True):
+        records = run_sessions(
+            {"Player": BetDontPass(5)},
+            300,
+            bankroll=1_000,
+            max_rolls=60,
+            seed=int(skip),
+            skip_quiet_rolls=skip,
+            dice_probabilities=probabilities,
+        )
+        results[skip] = np.array([[r["bankroll"], r["max_drawdown"]] for r in records])
+
+    a, b = results[False], results[True]
+    se = np.sqrt(a.var(axis=0) / len(a) + b.var(axis=0) / len(b))
+    assert (np.abs(a.mean(axis=0) - b.mean(axis=0)) < 4 * se).all()
+    assert a[:, 0].mean() < 1_000 - 4 * se[0]  # the Don't Pass loses against few sevens
+
+
+def test_update_is_pure():
+    assert (BetPassLine(5) + PassLineOddsMultiplier(2)).update_is_pure
+    impure = BetPassLine(5) + AddIfTrue(Field(5), lambda p: p.table.dice.n_rolls > 10)
+    assert not impure.update_is_pure
+
+
+def test_subclass_overrides_are_not_pure():
+    class Progression(AddIfTrue):
+        def update_bets(self, player):
+            self.bet.amount += 1
+            super().update_bets(player)
+
+    class RollLimit(BetPassLine):
+        def completed(self, player):
+            return player.table.dice.n_rolls >= 3
+
+    class Pure(BetPassLine):
+        update_is_pure = True
+
+        def after_roll(self, player):
+            pass
+
+    assert AddIfTrue.completed_is_pure and not Progression.update_is_pure
+    assert Progression.completed_is_pure
+    assert not RollLimit.completed_is_pure and RollLimit.update_is_pure
+    assert Pure.update_is_pure and Pure.completed_is_pure
+
+
+def test_skip_needs_random_dice():
+    packed = pack_outcomes(np.random.default_rng(1).integers(1, 7, size=(500, 2)))
+    table = Table(dice=ReplayDice(packed))
+    table.add_player(10_000, BetDontPass(5))
+    with pytest.raises(ValueError):
+        table.run(max_rolls=500, verbose=False, skip_quiet_rolls=True)
+    assert table.dice.n_rolls == 0
+
+    table.run(max_rolls=500, verbose=False)
+    assert table.dice.remaining == 0
+
+    with pytest.raises(ValueError):
+        run_sessions(
+            {"pass": BetPassLine(5)},
+            1,
+            max_rolls=30,
+            seed=1,
+            stream_dice=True,
+            skip_quiet_rolls=True,
+        )
@@ -0,0 +1,259 @@
+import itertools
+import pickle
+
+import numpy as np
+import pytest
+
+from crapssim.bet import Come, Field, Odds, PassLine, Place
+from crapssim.strategy.examples import IronCross, Pass2Come, PassLinePlace68
+from crapssim.strategy.spec import (
+    RULE_ADD,
+    RULE_ODDS_MULTIPLIER,
+    RULE_REMOVE,
+    SpecCondition,
+    compile_bet,
+    compile_rules,
+    compile_strategy,
+    evaluate_rules,
+    normalize_spec,
+    spec_hash,
+)
+from crapssim.strategy.tools import AddIfPointOn, AddIfTrue
+from crapssim.table import Table
+
+IRON_CROSS = {
+    "type": "all",
+    "strategies": [
+        {"type": "single", "bet": {"type": "PassLine", "amount": 5}},
+        {"type": "odds_multiplier", "base": "PassLine", "multiplier": 2},
+        {"type": "place", "amounts": {"5": 10, "6": 12, "8": 12}},
+        {"type": "add", "bet": {"type": "Field", "amount": 5}, "when": {"point": "On"}},
+    ],
+}
+
+PASS_2_COME = {
+    "type": "all",
+    "strategies": [
+        {"type": "single", "bet": {"type": "PassLine", "amount": 5}},
+        {"type": "count", "types": "Come", "count": 2, "bet": {"type": "Come", "amount": 5}},
+    ],
+}
+
+PASS_LINE_PLACE_68 = {
+    "type": "all",
+    "strategies": [
+        {"type": "single", "bet": {"type": "PassLine", "amount": 5}},
+        {"type": "place", "amounts": {6: 6, 8: 6}},
+    ],
+}
+
+
+def run(strategy, seed=3, n_rolls=500):
+    table = Table(seed=seed)
+    table.add_player(10_000, strategy)
+    table.run(n_rolls, verbose=False)
+    return table.players[0].bankroll, table.players[0].bets
+
+
+@pytest.mark.parametrize(
+    "spec, strategy",
+    [
+        (IRON_CROSS, IronCross(5)),
+        (PASS_2_COME, Pass2Come(5)),
+        (PASS_LINE_PLACE_68, PassLinePlace68(5, 6, 6)),
+    ],
+)
+def test_compiled_strategy_matches_example(spec, strategy):
+    for seed in range(3):
+        assert run(compile_strategy(spec), seed) == run(strategy, seed)
+
+
+def test_compile_bet():
+    assert compile_bet({"type": "Place", "number": "6", "amount": 6}) == Place(6, 6)
+    assert compile_bet({"type": "Come", "amount": 5}) == Come(5)
+    odds = compile_bet({"type": "Odds", "base": "PassLine", "number": 4, "amount": 10})
+    assert odds == Odds(PassLine, 4, 10)
+
+
+def test_compile_add_uses_existing_classes():
+    strategy = compile_strategy(
+        {"type": "add", "bet": {"type": "Field", "amount": 5}, "when": {"point": "On"}}
+    )
+    assert isinstance(strategy, AddIfPointOn)
+    assert strategy.bet == Field(5)
+
+
+def test_compiled_condition_is_picklable():
+    spec = {
+        "type": "add",
+        "bet": {"type": "Field", "amount": 5},
+        "when": {"any": [{"point_in": [4, 10]}, {"new_shooter": True}]},
+    }
+    strategy = compile_strategy(spec)
+    assert isinstance(strategy, AddIfTrue)
+    again = pickle.loads(pickle.dumps(strategy))
+    assert again.key == strategy.key
+
+
+@pytest.mark.parametrize(
+    "condition, point, new_shooter, bets, expected",
+    [
+        ({"point": "Off"}, None, False, [], True),
+        ({"point_in": [4, 10]}, 10, False, [], True),
+        ({"point_in": [4, 10]}, 6, False, [], False),
+        ({"new_shooter": True}, None, True, [], True),
+        ({"has_bet": {"type": "Field", "amount": 5}}, 6, False, [Field(5)], True),
+        ({"has_bet": {"type": "Field", "amount": 5}}, 6, False, [Field(10)], False),
+        ({"placed": {"type": "Field", "amount": 5}}, 6, False, [Field(10)], True),
+        ({"count_less_than": {"types": ["Place"], "count": 2}}, 6, False, [Place(8, 6)], True),
+        ({"bankroll_at_least": 100}, None, False, [], True),
+        ({"not": {"point": "On"}}, 4, False, [], False),
+        ({"all": [{"point": "On"}, {"new_shooter": False}]}, 4, False, [], True),
+    ],
+)
+def test_spec_condition(condition, point, new_shooter, bets, expected):
+    table = Table()
+    table.add_player(bankroll=100)
+    table.point.number = point
+    table.new_shooter = new_shooter
+    player = table.players[0]
+    for bet in bets:
+        player.add_bet(bet)
+    assert SpecCondition(condition)(player) is expected
+
+
+def test_spec_hash_equivalent_specs():
+    explicit = {
+        "type": "all",
+        "strategies": [
+            {
+                "type": "single",
+                "bet": {"type": "PassLine", "amount": 5.0},
+                "mode": "ADD_IF_POINT_OFF",
+            },
+            {
+                "type": "place",
+                "amounts": {"8": 6.0, "6": 6.0},
+                "mode": "BET_IF_POINT_ON",
+                "skip_point": True,
+                "skip_come": False,
+            },
+        ],
+    }
+    assert normalize_spec(explicit) == normalize_spec(PASS_LINE_PLACE_68)
+    assert spec_hash(explicit) == spec_hash(PASS_LINE_PLACE_68)
+    assert spec_hash(PASS_LINE_PLACE_68) != spec_hash(IRON_CROSS)
+
+
+def test_spec_hash_depends_on_amounts():
+    a = {"type": "single", "bet": {"type": "Field", "amount": 5}}
+    b = {"type": "single", "bet": {"type": "Field", "amount": 10}}
+    assert spec_hash(a) != spec_hash(b)
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        {"type": "nope"},
+        {"type": "add"},
+        {"type": "add", "bet": {"type": "Fake", "amount": 5}},
+        {"type": "add", "bet": {"type": "number_mask", "amount": 5}},
+        {"type": "add", "bet": {"type": "Place", "number": 7, "amount": 5}},
+        {"type": "add", "bet": {"type": "Field", "amount": "5"}},
+        {"type": "add", "bet": {"type": "Field", "amount": 5}, "when": {"point": "on"}},
+        {"type": "single", "bet": {"type": "Field", "amount": 5}, "mode": "SOMETIMES"},
+        {"type": "odds", "base": "Field", "amounts": {"4": 10}},
+        {"type": "all", "strategies": [{"type": "null", "extra": 1}]},
+    ],
+)
+def test_normalize_spec_invalid(spec):
+    with pytest.raises(ValueError):
+        normalize_spec(spec)
+
+
+FIELD = {"type": "Field", "amount": 5}
+
+
+@pytest.mark.parametrize(
+    "spec, key",
+    [
+        ({"type": "add", "bet": FIELD, "when": {"point_in": 4}}, "point_in"),
+        ({"type": "add", "bet": FIELD, "when": {"point_in": "4"}}, "point_in"),
+        ({"type": "add", "bet": {"type": "Hop", "amount": 1, "result": 5}}, "result"),
+        ({"type": "add", "bet": {"type": "Hop", "amount": 1, "result": None}}, "result"),
+        ({"type": "add", "bet": FIELD, "when": {"count_less_than": 3}}, "count_less_than"),
+        ({"type": "count", "types": "Come", "count": [4], "bet": FIELD}, "count"),
+    ],
+)
+def test_normalize_spec_wrong_type_names_key(spec, key):
+    with pytest.raises(ValueError, match=key):
+        normalize_spec(spec)
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        {"type": "add", "bet": {"type": ["Field"], "amount": 5}},
+        {"type": "remove_by_type", "types": [["Field"]]},
+        {"type": "single", "bet": FIELD, "mode": ["REPLACE"]},
+    ],
+)
+def test_normalize_spec_unhashable_values(spec):
+    with pytest.raises(ValueError):
+        normalize_spec(spec)
+
+
+def test_compile_rules():
+    rules = compile_rules(IRON_CROSS)
+    actions = rules["action"].tolist()
+    assert actions.count(RULE_ODDS_MULTIPLIER) == 6
+    assert actions.count(RULE_ADD) == 5  # PassLine, three Place bets and the Field
+    assert actions.count(RULE_REMOVE) == 6  # Place bets on the point and when the point is Off
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        PASS_2_COME,
+        {"type": "progression", "bet": {"type": "Field", "amount": 5}, "multipliers": [1, 2]},
+        {
+            "type": "add",
+            "bet": {"type": "Field", "amount": 5},
+            "when": {"bankroll_at_least": 10},
+        },
+    ],
+)
+def test_compile_rules_not_vectorizable(spec):
+    with pytest.raises(ValueError):
+        compile_rules(spec)
+
+
+def test_evaluate_rules_matches_strategy_conditions():
+    conditions = [
+        {"point": "On"},
+        {"point": "Off"},
+        {"point_in": [5, 9]},
+        {"new_shooter": True},
+        {"all": [{"point": "On"}, {"new_shooter": False}]},
+    ]
+    spec = {
+        "type": "all",
+        "strategies": [
+            {"type": "add", "bet": {"type": "Field", "amount": 5}, "when": cond}
+            for cond in conditions
+        ],
+    }
+    rules = compile_rules(spec)
+
+    states = list(itertools.product([None, 4, 5, 6, 8, 9, 10], [False, True]))
+    fires = evaluate_rules(rules, [p for p, _ in states], [s for _, s in states])
+
+    expected = np.zeros_like(fires)
+    for i, (point, new_shooter) in enumerate(states):
+        table = Table()
+        table.add_player()
+        table.point.number = point
+        table.new_shooter = new_shooter
+        for j, cond in enumerate(conditions):
+            expected[i, j] = SpecCondition(cond)(table.players[0])
+    assert (fires == expected).all()
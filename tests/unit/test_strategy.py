@@ -978,7 +978,7 @@ def test_hammerlock_odds_multiplier(player):
 def test_hammerlock_1_win_after_roll(player):
     strategy = HammerLock(5)
     bet1 = Place(6, 5)
-    bet1.get_result = MagicMock(return_value=BetResult(1, True))
+    player.table.dice.fixed_roll((3, 3))
     player.bets = [bet1]
     strategy.after_roll(player)
     assert strategy.place_win_count == 1
@@ -987,7 +987,7 @@ def test_hammerlock_1_win_after_roll(player):
 def test_hammerlock_2_win_after_roll(player):
     strategy = HammerLock(5)
     bet = Place(6, 5)
-    bet.get_result = MagicMock(return_value=BetResult(1, True))
+    player.table.dice.fixed_roll((3, 3))
     player.bets = [bet, bet]
     strategy.after_roll(player)
     assert strategy.place_win_count == 2
@@ -1081,7 +1081,6 @@ def test_risk_12_point_on_10_pre_point_winnings(player):
 def test_dice_doctor_win_increase_progression(player):
     strategy = DiceDoctor()
     bet = Field(5)
-    bet.get_status = MagicMock(return_value="win")
     player.table.dice.result = (1, 1)
     player.bets = [bet]
     strategy.after_roll(player)
@@ -1092,7 +1091,6 @@ def test_dice_doctor_lose_progression(player):
     strategy = DiceDoctor()
     strategy.current_progression = 4
     bet = Field(5)
-    bet.get_status = MagicMock(return_value="lose")
     player.table.dice.result = (3, 4)
     player.bets = [bet]
     strategy.after_roll(player)
@@ -1126,8 +1124,7 @@ def test_place_68_cpr_after_roll_6_winnings_increase(player):
     strategy = Place68PR(6)
     bet6 = Place(6, 6)
     bet8 = Place(8, 6)
-    bet6.get_result = MagicMock(return_value=BetResult(13, True))
-    bet8.get_result = MagicMock(return_value=BetResult(0, False))
+    player.table.dice.fixed_roll((3, 3))  # Place 6 wins 13, Place 8 has no action
     player.bets = [bet6, bet8]
     player.table.point.number = 6
     strategy.after_roll(player)
@@ -1138,8 +1135,7 @@ def test_place_68_cpr_after_roll_winnings_dont_change(player):
     strategy = Place68PR(6)
     bet6 = Place(6, 6)
     bet8 = Place(8, 6)
-    bet6.get_result = MagicMock(return_value=BetResult(0, False))
-    bet8.get_result = MagicMock(return_value=BetResult(0, False))
+    player.table.dice.fixed_roll((2, 2))  # no action on Place 6 or Place 8
     player.bets = [bet6, bet8]
     player.table.point.number = 6
     strategy.after_roll(player)
@@ -1205,8 +1201,6 @@ def test_place_68_cpr_update_bets_initial_bets_placed_push_6_add_bet(player):
     strategy = Place68PR(6)
     player.add_bet = MagicMock()
     player.table.point.number = 6
-    winning_bet = Place(6, 6)
-    winning_bet.get_status = MagicMock(return_value="win")
     strategy.six_winnings = 7
     player.bets = [Place(6, 6), Place(8, 6)]
     strategy.update_bets(player)
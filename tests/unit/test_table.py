@@ -2,8 +2,16 @@ import pytest
 
 from crapssim import Table
 from crapssim.bet import Come
+from crapssim.differential import roll_outcomes
 from crapssim.point import Point
 from crapssim.strategy import BetPassLine
+from crapssim.strategy.examples import (
+    IronCross,
+    Pass2Come,
+    PassLinePlace68,
+    Place682Come,
+)
+from crapssim.table import TableUpdate
 
 
 def test_ensure_one_player():
@@ -108,3 +116,26 @@ def test_table_rerunning_with_shooters():
 
     table.run(max_rolls=float("inf"), max_shooter=5)
     assert table.n_shooters == 7
+
+
+class UnsharedTableUpdate(TableUpdate):
+    @staticmethod
+    def update_bets(table, verbose=False):
+        for player in table.players:
+            player.update_bet(verbose=verbose)
+
+
+def test_table_shared_results_match_unshared():
+    outcomes = roll_outcomes(3, 300)
+    strategies = [BetPassLine(5), BetPassLine(10), Pass2Come(5), IronCross(5)]
+    strategies += [Place682Come(), PassLinePlace68(5), BetPassLine(7)]
+
+    bankrolls = []
+    for tu in (TableUpdate(), UnsharedTableUpdate()):
+        table = Table()
+        for strategy in strategies:
+            table.add_player(bankroll=1000, strategy=strategy)
+        for outcome in outcomes:
+            tu.run(table, dice_outcome=outcome)
+        bankrolls.append([(p.bankroll, p.bets) for p in table.players])
+    assert bankrolls[0] == bankrolls[1]
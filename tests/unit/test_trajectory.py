@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from crapssim.table import Table
+from crapssim.trajectory import (
+    DecimatingRecorder,
+    MinMaxRecorder,
+    RingBufferRecorder,
+    stack_trajectories,
+)
+
+
+def record_all(recorder, values):
+    for roll, value in enumerate(values):
+        recorder.record(roll, value)
+    return recorder
+
+
+def test_ring_buffer_keeps_all_values_under_capacity():
+    recorder = record_all(RingBufferRecorder(5), [10, 11, 12])
+    assert recorder.rolls.tolist() == [0, 1, 2]
+    assert recorder.values.tolist() == [10, 11, 12]
+    assert len(recorder) == 3
+
+
+def test_ring_buffer_keeps_most_recent_values():
+    recorder = record_all(RingBufferRecorder(4), range(10))
+    assert recorder.rolls.tolist() == [6, 7, 8, 9]
+    assert recorder.values.tolist() == [6, 7, 8, 9]
+
+
+def test_ring_buffer_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        RingBufferRecorder(0)
+
+
+def test_decimating_recorder_keeps_every_stride():
+    recorder = record_all(DecimatingRecorder(4), range(10))
+    assert recorder.stride == 4
+    assert recorder.rolls.tolist() == [0, 4, 8]
+
+
+@pytest.mark.parametrize("n", [1, 7, 8, 9, 100, 1_000])
+def test_decimating_recorder_is_bounded_and_evenly_spaced(n):
+    recorder = record_all(DecimatingRecorder(8), range(n))
+    rolls = recorder.rolls
+    assert len(rolls) <= 8
+    assert rolls[0] == 0
+    assert np.all(np.diff(rolls) == recorder.stride)
+    assert rolls[-1] > n - 1 - recorder.stride
+
+
+def test_decimating_recorder_max_points_must_be_even():
+    with pytest.raises(ValueError):
+        DecimatingRecorder(5)
+
+
+@pytest.mark.parametrize("n", [1, 4, 5, 16, 17, 250])
+def test_min_max_recorder_keeps_extremes(n):
+    values = np.random.default_rng(n).normal(size=n).cumsum()
+    recorder = record_all(MinMaxRecorder(4), values)
+
+    assert len(recorder) <= 4
+    assert recorder.rolls[-1] == n - 1
+    assert recorder.values[-1] == values[-1]
+    assert recorder.minimums.min() == values.min()
+    assert recorder.maximums.max() == values.max()
+
+    starts = np.concatenate(([0], recorder.rolls[:-1] + 1))
+    for start, end, low, high in zip(
+        starts, recorder.rolls, recorder.minimums, recorder.maximums
+    ):
+        assert low == values[start : end + 1].min()
+        assert high == values[start : end + 1].max()
+
+
+def test_min_max_recorder_buckets():
+    recorder = record_all(MinMaxRecorder(2), [5, 1, 9, 3, 4])
+    assert recorder.bucket_size == 4
+    assert recorder.rolls.tolist() == [3, 4]
+    assert recorder.values.tolist() == [3, 4]
+    assert recorder.minimums.tolist() == [1, 4]
+    assert recorder.maximums.tolist() == [9, 4]
+
+
+def test_stack_trajectories_holds_last_value():
+    a = record_all(RingBufferRecorder(10), [100, 95, 90])
+    b = record_all(RingBufferRecorder(10), [100, 105])
+    assert stack_trajectories([a, b]).tolist() == [[100, 95, 90], [100, 105, 105]]
+
+
+def test_stack_trajectories_given_rolls():
+    recorder = record_all(DecimatingRecorder(4), range(10))
+    out = stack_trajectories([recorder], rolls=[0, 3, 5, 20])
+    assert out.tolist() == [[0, 0, 4, 8]]
+
+
+def test_stack_trajectories_nan_before_first_value():
+    recorder = record_all(RingBufferRecorder(2), [1, 2, 3])
+    out = stack_trajectories([recorder])
+    assert np.isnan(out[0, 0])
+    assert out[0, 1:].tolist() == [2, 3]
+
+
+def test_add_player_with_recorder_records_every_roll():
+    table = Table(seed=4)
+    table.add_player(bankroll=100, recorder=RingBufferRecorder(100))
+    table.add_player(bankroll=100)
+    table.run(max_rolls=20, verbose=False)
+
+    recorder = table.players[0].recorder
+    assert table.players[1].recorder is None
+    assert recorder.rolls.tolist() == list(range(table.dice.n_rolls + 1))
+    assert recorder.values[0] == 100
+    assert recorder.values[-1] == table.players[0].bankroll